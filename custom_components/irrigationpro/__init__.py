@@ -152,6 +152,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             # Remove panel
             async_remove_panel(hass, DOMAIN)
             hass.data.pop(f"{DOMAIN}_panel_registered", None)
+            hass.data.pop(f"{DOMAIN}_http_client", None)
 
     return unload_ok
 
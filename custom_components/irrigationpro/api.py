@@ -35,7 +35,9 @@ from .const import (
     CONF_ZONE_ADAPTIVE,
     CONF_ZONE_ADJUSTMENT_PERCENT,
     CONF_ZONE_AREA,
+    CONF_ZONE_BLACKOUT_DATES,
     CONF_ZONE_CROP_COEF,
+    CONF_ZONE_DAY_RESTRICTION,
     CONF_ZONE_EFFICIENCY,
     CONF_ZONE_EMITTER_COUNT,
     CONF_ZONE_ENABLED,
@@ -48,13 +50,16 @@ from .const import (
     CONF_ZONE_PLANT_DENSITY,
     CONF_ZONE_RAIN_FACTORING,
     CONF_ZONE_RAIN_THRESHOLD,
+    CONF_ZONE_SOAK_MINUTES,
     CONF_ZONE_SOIL_MOISTURE_ENTITY,
     CONF_ZONE_SWITCH_ENTITY,
     CONF_ZONE_TARGET_MOISTURE_MAX,
     CONF_ZONE_TARGET_MOISTURE_MIN,
     CONF_ZONE_VEGETATION_TYPE,
+    CONF_ZONE_WATER_CAPACITY,
     CONF_ZONE_WEEKDAYS,
     CONF_ZONES,
+    DAY_RESTRICTIONS,
     DEFAULT_CYCLES,
     DEFAULT_DAILY_REPORT_ENABLED,
     DEFAULT_DAILY_REPORT_HOUR,
@@ -73,6 +78,7 @@ from .const import (
     DEFAULT_ZONE_ADAPTIVE,
     DEFAULT_ZONE_ADJUSTMENT_PERCENT,
     DEFAULT_ZONE_AREA,
+    DEFAULT_ZONE_DAY_RESTRICTION,
     DEFAULT_ZONE_CROP_COEF,
     DEFAULT_ZONE_EFFICIENCY,
     DEFAULT_ZONE_EMITTER_COUNT,
@@ -84,11 +90,14 @@ from .const import (
     DEFAULT_ZONE_PLANT_DENSITY,
     DEFAULT_ZONE_RAIN_FACTORING,
     DEFAULT_ZONE_RAIN_THRESHOLD,
+    DEFAULT_ZONE_SOAK_MINUTES,
     DEFAULT_ZONE_VEGETATION_TYPE,
+    DEFAULT_ZONE_WATER_CAPACITY,
     DOMAIN,
     VEGETATION_TYPES,
     WEEKDAYS,
 )
+from .zone_calendar import parse_blackout_dates
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -181,6 +190,22 @@ def _normalize_weekdays(value: Any) -> list[str]:
     return sorted(set(days), key=WEEKDAYS.index) if days else WEEKDAYS.copy()
 
 
+def _normalize_day_restriction(value: Any) -> str:
+    """Normalize the odd/even-day restriction to a known token."""
+    restriction = str(value or "").strip().lower()
+    return restriction if restriction in DAY_RESTRICTIONS else DEFAULT_ZONE_DAY_RESTRICTION
+
+
+def _normalize_blackout_dates(value: Any) -> list[str]:
+    """Normalize blackout dates to sorted ``YYYY-MM-DD`` / ``MM-DD`` strings."""
+    if isinstance(value, str):
+        value = value.split(",")
+    fixed, yearly = parse_blackout_dates(v for v in value or [] if str(v).strip())
+    return sorted(
+        [day.isoformat() for day in fixed] + [f"{month:02d}-{day:02d}" for month, day in yearly]
+    )
+
+
 def _build_backup_payload(coordinator) -> dict[str, Any]:
     """Build canonical export payload."""
     return {
@@ -334,6 +359,10 @@ def _normalize_zone(zone: dict[str, Any], index: int, existing_zone: dict[str, A
         CONF_ZONE_ADJUSTMENT_PERCENT: DEFAULT_ZONE_ADJUSTMENT_PERCENT,
         CONF_ZONE_WEEKDAYS: WEEKDAYS,
         CONF_ZONE_MONTHS: list(range(1, 13)),
+        CONF_ZONE_DAY_RESTRICTION: DEFAULT_ZONE_DAY_RESTRICTION,
+        CONF_ZONE_BLACKOUT_DATES: [],
+        CONF_ZONE_SOAK_MINUTES: DEFAULT_ZONE_SOAK_MINUTES,
+        CONF_ZONE_WATER_CAPACITY: DEFAULT_ZONE_WATER_CAPACITY,
         CONF_ZONE_SWITCH_ENTITY: "",
         CONF_ZONE_VEGETATION_TYPE: DEFAULT_ZONE_VEGETATION_TYPE,
         CONF_ZONE_SOIL_MOISTURE_ENTITY: None,
@@ -364,6 +393,10 @@ def _normalize_zone(zone: dict[str, Any], index: int, existing_zone: dict[str, A
         CONF_ZONE_ADJUSTMENT_PERCENT: max(10, min(250, _to_int(src.get(CONF_ZONE_ADJUSTMENT_PERCENT), DEFAULT_ZONE_ADJUSTMENT_PERCENT))),
         CONF_ZONE_WEEKDAYS: _normalize_weekdays(src.get(CONF_ZONE_WEEKDAYS)),
         CONF_ZONE_MONTHS: _normalize_months(src.get(CONF_ZONE_MONTHS)),
+        CONF_ZONE_DAY_RESTRICTION: _normalize_day_restriction(src.get(CONF_ZONE_DAY_RESTRICTION)),
+        CONF_ZONE_BLACKOUT_DATES: _normalize_blackout_dates(src.get(CONF_ZONE_BLACKOUT_DATES)),
+        CONF_ZONE_SOAK_MINUTES: max(0, min(240, _to_int(src.get(CONF_ZONE_SOAK_MINUTES), DEFAULT_ZONE_SOAK_MINUTES))),
+        CONF_ZONE_WATER_CAPACITY: max(5.0, min(300.0, _to_float(src.get(CONF_ZONE_WATER_CAPACITY), DEFAULT_ZONE_WATER_CAPACITY))),
         CONF_ZONE_SWITCH_ENTITY: str(src.get(CONF_ZONE_SWITCH_ENTITY) or "").strip() or None,
         CONF_ZONE_VEGETATION_TYPE: veg_type if veg_type in VEGETATION_TYPES else DEFAULT_ZONE_VEGETATION_TYPE,
         CONF_ZONE_SOIL_MOISTURE_ENTITY: str(src.get(CONF_ZONE_SOIL_MOISTURE_ENTITY) or "").strip() or None,
@@ -534,6 +567,9 @@ class IrrigationProApiView(HomeAssistantView):
                         ),
                         "weekdays": zone.weekdays,
                         "months": zone.months,
+                        "calendar": zone.calendar.as_dict(),
+                        "soak_minutes": zone.soak_minutes,
+                        "water_capacity": zone.water_capacity,
                         # Soil moisture learning
                         "vegetation_type": zone.vegetation_type,
                         "soil_moisture_entity": zone.soil_moisture_entity,
@@ -544,6 +580,7 @@ class IrrigationProApiView(HomeAssistantView):
                         "learning_confidence": zone.learning_confidence,
                         "current_moisture": _get_current_moisture(hass, zone.soil_moisture_entity),
                         "moisture_reduction": round(getattr(zone, "moisture_reduction", 1.0), 2),
+                        "rain_carryover": round(zone.rain_carryover, 1),
                     }
                 )
 
@@ -558,6 +595,8 @@ class IrrigationProApiView(HomeAssistantView):
                         "wind_speed": round(day.wind_speed, 1),
                         "rain": round(day.rain, 1),
                         "eto": round(day.eto, 2),
+                        "eto_method": getattr(day, "eto_method", ""),
+                        "estimated": sorted(getattr(day, "estimated", ())),
                         "condition": day.condition,
                     }
                 )
@@ -645,6 +684,56 @@ class IrrigationProApiView(HomeAssistantView):
                     else None
                 ),
                 "weather_status": getattr(coordinator, "weather_status", "ok"),
+                "forecast_snapshot_time": (
+                    coordinator.snapshot_time.isoformat()
+                    if coordinator.snapshot_time else None
+                ),
+                "eto_cache": coordinator.eto_cache.stats(),
+                "forecast_diff": dict(coordinator.diff_stats),
+                "schedule_solver": dict(coordinator.solver_stats),
+                "watering_plan": (
+                    coordinator.watering_plan.as_dict() if coordinator.watering_plan else None
+                ),
+                "water_balance": coordinator.water_balance().as_dict(),
+                "lookahead": {
+                    **coordinator.lookahead_stats,
+                    "plans": {
+                        str(zone_id): plan.as_dict()
+                        for zone_id, plan in coordinator.lookahead_plans.items()
+                    },
+                },
+                "coalesced": {
+                    "weather_fetch": coordinator.fetch_flight.stats(),
+                },
+                "weather_sources": {
+                    source: stats.as_dict()
+                    for source, stats in coordinator.weather_provider.source_stats.items()
+                },
+                "weather_retry": coordinator.retry_policy.as_dict(),
+                "rain_gate": coordinator.rain_gate.as_dict(),
+                "station": {
+                    "today": coordinator.station.today(),
+                    "observed": [
+                        {
+                            "date": day.sunrise.strftime("%Y-%m-%d"),
+                            "min_temp": round(day.min_temp, 1),
+                            "max_temp": round(day.max_temp, 1),
+                            "humidity": round(day.humidity),
+                            "eto": round(day.eto, 2),
+                            "eto_method": day.eto_method,
+                            "estimated": sorted(day.estimated),
+                        }
+                        for day in coordinator.station.observed
+                    ],
+                } if coordinator.station.sensors else None,
+                "observed_history": (
+                    coordinator.observed_history.as_list()
+                    if coordinator.observed_history.configured else None
+                ),
+                "circuit_breakers": {
+                    source: breaker.as_dict()
+                    for source, breaker in coordinator.weather_provider.breakers.items()
+                },
                 "weather_entity": coordinator.entry.data.get(CONF_WEATHER_ENTITY, ""),
                 "available_weather_entities": sorted(
                     list(hass.states.async_entity_ids("weather"))
@@ -1285,7 +1374,7 @@ class IrrigationProBackupApplyView(HomeAssistantView):
 
 
 class IrrigationProZoneScheduleView(HomeAssistantView):
-    """API view to get/update weekdays and months per zone."""
+    """API view to get/update weekdays, months and restrictions per zone."""
 
     url = "/api/irrigationpro/zones/schedule"
     name = "api:irrigationpro:zones_schedule"
@@ -1306,6 +1395,8 @@ class IrrigationProZoneScheduleView(HomeAssistantView):
                     "zone_name": zone.get(CONF_ZONE_NAME),
                     "zone_weekdays": zone.get(CONF_ZONE_WEEKDAYS, WEEKDAYS),
                     "zone_months": zone.get(CONF_ZONE_MONTHS, list(range(1, 13))),
+                    "zone_day_restriction": zone.get(CONF_ZONE_DAY_RESTRICTION, DEFAULT_ZONE_DAY_RESTRICTION),
+                    "zone_blackout_dates": zone.get(CONF_ZONE_BLACKOUT_DATES, []),
                     "zone_area": zone.get(CONF_ZONE_AREA, DEFAULT_ZONE_AREA),
                     "zone_flow_rate": zone.get(CONF_ZONE_FLOW_RATE, DEFAULT_ZONE_FLOW_RATE),
                     "zone_emitter_count": zone.get(CONF_ZONE_EMITTER_COUNT, DEFAULT_ZONE_EMITTER_COUNT),
@@ -1315,6 +1406,8 @@ class IrrigationProZoneScheduleView(HomeAssistantView):
                     "zone_exposure_factor": zone.get(CONF_ZONE_EXPOSURE_FACTOR, DEFAULT_ZONE_EXPOSURE_FACTOR),
                     "zone_rain_threshold": zone.get(CONF_ZONE_RAIN_THRESHOLD, DEFAULT_ZONE_RAIN_THRESHOLD),
                     "zone_max_duration": zone.get(CONF_ZONE_MAX_DURATION, DEFAULT_ZONE_MAX_DURATION),
+                    "zone_soak_minutes": zone.get(CONF_ZONE_SOAK_MINUTES, DEFAULT_ZONE_SOAK_MINUTES),
+                    "zone_water_capacity": zone.get(CONF_ZONE_WATER_CAPACITY, DEFAULT_ZONE_WATER_CAPACITY),
                     "zone_rain_factoring": zone.get(CONF_ZONE_RAIN_FACTORING, DEFAULT_ZONE_RAIN_FACTORING),
                     "zone_adaptive": zone.get(CONF_ZONE_ADAPTIVE, DEFAULT_ZONE_ADAPTIVE),
                     "zone_enabled": zone.get(CONF_ZONE_ENABLED, DEFAULT_ZONE_ENABLED),
@@ -1334,6 +1427,7 @@ class IrrigationProZoneScheduleView(HomeAssistantView):
                 "entry_id": coordinator.entry.entry_id,
                 "valid_weekdays": WEEKDAYS,
                 "valid_months": list(range(1, 13)),
+                "valid_day_restrictions": DAY_RESTRICTIONS,
                 "zones": zones,
             }
         )
@@ -1392,6 +1486,15 @@ class IrrigationProZoneScheduleView(HomeAssistantView):
                     return self.json({"error": f"zone {zone_id}: zone_months must not be empty"}, status_code=400)
                 zone[CONF_ZONE_MONTHS] = sorted(set(months))
 
+            if CONF_ZONE_DAY_RESTRICTION in upd:
+                restriction = str(upd.get(CONF_ZONE_DAY_RESTRICTION) or "").lower()
+                if restriction not in DAY_RESTRICTIONS:
+                    return self.json({"error": f"zone {zone_id}: invalid zone_day_restriction: {restriction}"}, status_code=400)
+                zone[CONF_ZONE_DAY_RESTRICTION] = restriction
+
+            if CONF_ZONE_BLACKOUT_DATES in upd:
+                zone[CONF_ZONE_BLACKOUT_DATES] = _normalize_blackout_dates(upd.get(CONF_ZONE_BLACKOUT_DATES))
+
             if CONF_ZONE_ADJUSTMENT_PERCENT in upd:
                 zone[CONF_ZONE_ADJUSTMENT_PERCENT] = max(10, min(250, _to_int(upd.get(CONF_ZONE_ADJUSTMENT_PERCENT), DEFAULT_ZONE_ADJUSTMENT_PERCENT)))
 
@@ -1413,6 +1516,10 @@ class IrrigationProZoneScheduleView(HomeAssistantView):
                 zone[CONF_ZONE_RAIN_THRESHOLD] = max(0.0, _to_float(upd.get(CONF_ZONE_RAIN_THRESHOLD), DEFAULT_ZONE_RAIN_THRESHOLD))
             if CONF_ZONE_MAX_DURATION in upd:
                 zone[CONF_ZONE_MAX_DURATION] = max(1, _to_int(upd.get(CONF_ZONE_MAX_DURATION), DEFAULT_ZONE_MAX_DURATION))
+            if CONF_ZONE_SOAK_MINUTES in upd:
+                zone[CONF_ZONE_SOAK_MINUTES] = max(0, min(240, _to_int(upd.get(CONF_ZONE_SOAK_MINUTES), DEFAULT_ZONE_SOAK_MINUTES)))
+            if CONF_ZONE_WATER_CAPACITY in upd:
+                zone[CONF_ZONE_WATER_CAPACITY] = max(5.0, min(300.0, _to_float(upd.get(CONF_ZONE_WATER_CAPACITY), DEFAULT_ZONE_WATER_CAPACITY)))
             if CONF_ZONE_RAIN_FACTORING in upd:
                 zone[CONF_ZONE_RAIN_FACTORING] = _to_bool(upd.get(CONF_ZONE_RAIN_FACTORING), DEFAULT_ZONE_RAIN_FACTORING)
             if CONF_ZONE_ADAPTIVE in upd:
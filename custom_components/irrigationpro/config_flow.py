@@ -13,8 +13,11 @@ from homeassistant.helpers import selector
 from .const import (
     CONF_CYCLES,
     CONF_HIGH_THRESHOLD,
+    CONF_HOURLY_ETO,
     CONF_LANGUAGE,
+    CONF_LOOKAHEAD_PLANNER,
     CONF_LOW_THRESHOLD,
+    CONF_MAX_PARALLEL_ZONES,
     CONF_OWM_API_KEY,
     CONF_PUSHOVER_API_TOKEN,
     CONF_PUSHOVER_DEVICE,
@@ -23,14 +26,29 @@ from .const import (
     CONF_PUSHOVER_USER_KEY,
     CONF_DAILY_REPORT_ENABLED,
     CONF_DAILY_REPORT_HOUR,
+    CONF_EVENT_DRIVEN,
+    CONF_FUSION_METHOD,
+    CONF_OWM_BASE_URL,
+    CONF_PARALLEL_SOURCES,
+    CONF_RAIN_GATE_ENTITY,
+    CONF_RAIN_GATE_FORECAST,
+    CONF_RAIN_GATE_THRESHOLD,
     CONF_RECHECK_TIME,
     CONF_SOLAR_RADIATION,
+    CONF_STATION_HUMIDITY,
+    CONF_STATION_PRESSURE,
+    CONF_STATION_RAIN,
+    CONF_STATION_SOLAR_RADIATION,
+    CONF_STATION_TEMPERATURE,
+    CONF_STATION_WIND_SPEED,
     CONF_SUNRISE_OFFSET,
+    CONF_SUPPLY_CAPACITY,
     CONF_USE_OWM,
     CONF_WEATHER_ENTITY,
     CONF_ZONE_ADAPTIVE,
     CONF_ZONE_AREA,
     CONF_ZONE_CROP_COEF,
+    CONF_ZONE_DAY_RESTRICTION,
     CONF_ZONE_EFFICIENCY,
     CONF_ZONE_EMITTER_COUNT,
     CONF_ZONE_ENABLED,
@@ -43,25 +61,40 @@ from .const import (
     CONF_ZONE_PLANT_DENSITY,
     CONF_ZONE_RAIN_FACTORING,
     CONF_ZONE_RAIN_THRESHOLD,
+    CONF_ZONE_SOAK_MINUTES,
     CONF_ZONE_SOIL_MOISTURE_ENTITY,
     CONF_ZONE_SWITCH_ENTITY,
     CONF_ZONE_TARGET_MOISTURE_MAX,
     CONF_ZONE_TARGET_MOISTURE_MIN,
     CONF_ZONE_VEGETATION_TYPE,
+    CONF_ZONE_WATER_CAPACITY,
     CONF_ZONE_WEEKDAYS,
     CONF_ZONES,
+    DAY_RESTRICTION_EVEN,
+    DAY_RESTRICTION_NONE,
+    DAY_RESTRICTION_ODD,
     DEFAULT_CYCLES,
     DEFAULT_HIGH_THRESHOLD,
+    DEFAULT_HOURLY_ETO,
+    DEFAULT_LOOKAHEAD_PLANNER,
     DEFAULT_LOW_THRESHOLD,
+    DEFAULT_MAX_PARALLEL_ZONES,
     DEFAULT_PUSHOVER_ENABLED,
     DEFAULT_PUSHOVER_PRIORITY,
     DEFAULT_DAILY_REPORT_ENABLED,
     DEFAULT_DAILY_REPORT_HOUR,
+    DEFAULT_EVENT_DRIVEN,
+    DEFAULT_FUSION_METHOD,
     DEFAULT_LANGUAGE,
+    DEFAULT_PARALLEL_SOURCES,
+    DEFAULT_RAIN_GATE_FORECAST,
+    DEFAULT_RAIN_GATE_THRESHOLD,
     DEFAULT_RECHECK_TIME,
     DEFAULT_SOLAR_RADIATION,
     DEFAULT_SUNRISE_OFFSET,
+    DEFAULT_SUPPLY_CAPACITY,
     DEFAULT_ZONE_ADAPTIVE,
+    DEFAULT_ZONE_DAY_RESTRICTION,
     DEFAULT_ZONE_AREA,
     DEFAULT_ZONE_CROP_COEF,
     DEFAULT_ZONE_EFFICIENCY,
@@ -74,8 +107,12 @@ from .const import (
     DEFAULT_ZONE_MAX_DURATION,
     DEFAULT_ZONE_RAIN_FACTORING,
     DEFAULT_ZONE_RAIN_THRESHOLD,
+    DEFAULT_ZONE_SOAK_MINUTES,
     DEFAULT_ZONE_VEGETATION_TYPE,
+    DEFAULT_ZONE_WATER_CAPACITY,
     DOMAIN,
+    FUSION_MEDIAN,
+    FUSION_WEIGHTED,
     MONTHS,
     VEGETATION_TYPES,
     WEEKDAYS,
@@ -83,6 +120,16 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Optional weather-station sensors in the options flow: key -> device class
+STATION_SENSOR_FIELDS = {
+    CONF_STATION_TEMPERATURE: "temperature",
+    CONF_STATION_HUMIDITY: "humidity",
+    CONF_STATION_WIND_SPEED: "wind_speed",
+    CONF_STATION_PRESSURE: "atmospheric_pressure",
+    CONF_STATION_SOLAR_RADIATION: "irradiance",
+    CONF_STATION_RAIN: "precipitation",
+}
+
 
 async def _get_weather_entities(hass: HomeAssistant) -> list[str]:
     """Get list of weather entities."""
@@ -305,6 +352,16 @@ class SmartIrrigationConfigFlow(config_entries.ConfigFlow):
                         mode=selector.NumberSelectorMode.BOX,
                     )
                 ),
+                vol.Optional(
+                    CONF_ZONE_SOAK_MINUTES, default=DEFAULT_ZONE_SOAK_MINUTES
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=240,
+                        unit_of_measurement="min",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
                 vol.Required(
                     CONF_ZONE_RAIN_THRESHOLD, default=DEFAULT_ZONE_RAIN_THRESHOLD
                 ): selector.NumberSelector(
@@ -319,6 +376,17 @@ class SmartIrrigationConfigFlow(config_entries.ConfigFlow):
                 vol.Required(
                     CONF_ZONE_RAIN_FACTORING, default=DEFAULT_ZONE_RAIN_FACTORING
                 ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_ZONE_WATER_CAPACITY, default=DEFAULT_ZONE_WATER_CAPACITY
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=5,
+                        max=300,
+                        step=1,
+                        unit_of_measurement="mm",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
                 vol.Required(
                     CONF_ZONE_WEEKDAYS, default=WEEKDAYS
                 ): selector.SelectSelector(
@@ -358,6 +426,18 @@ class SmartIrrigationConfigFlow(config_entries.ConfigFlow):
                         mode=selector.SelectSelectorMode.DROPDOWN,
                     )
                 ),
+                vol.Optional(
+                    CONF_ZONE_DAY_RESTRICTION, default=DEFAULT_ZONE_DAY_RESTRICTION
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[
+                            selector.SelectOptionDict(value=DAY_RESTRICTION_NONE, label="No restriction"),
+                            selector.SelectOptionDict(value=DAY_RESTRICTION_ODD, label="Odd days only"),
+                            selector.SelectOptionDict(value=DAY_RESTRICTION_EVEN, label="Even days only"),
+                        ],
+                        mode=selector.SelectSelectorMode.DROPDOWN,
+                    )
+                ),
                 vol.Required(
                     CONF_ZONE_ENABLED, default=DEFAULT_ZONE_ENABLED
                 ): selector.BooleanSelector(),
@@ -582,10 +662,15 @@ class SmartIrrigationOptionsFlow(config_entries.OptionsFlow):
                         errors["base"] = "pushover_no_key"
                 
                 if not errors:
-                    # Update config entry data with new options
+                    # Update config entry data with new options; cleared
+                    # optional sensors are absent from user_input
+                    data = {**self.config_entry.data, **user_input}
+                    for key in (*STATION_SENSOR_FIELDS, CONF_RAIN_GATE_ENTITY, CONF_OWM_BASE_URL):
+                        if not user_input.get(key):
+                            data.pop(key, None)
                     self.hass.config_entries.async_update_entry(
                         self.config_entry,
-                        data={**self.config_entry.data, **user_input}
+                        data=data
                     )
                     return self.async_create_entry(title="", data={})
             except Exception as err:
@@ -616,6 +701,27 @@ class SmartIrrigationOptionsFlow(config_entries.OptionsFlow):
                         min=1, max=5, mode=selector.NumberSelectorMode.BOX
                     )
                 ),
+                vol.Optional(
+                    CONF_SUPPLY_CAPACITY,
+                    default=current_config.get(CONF_SUPPLY_CAPACITY, DEFAULT_SUPPLY_CAPACITY),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=100000, step=10, unit_of_measurement="L/h",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    CONF_MAX_PARALLEL_ZONES,
+                    default=current_config.get(CONF_MAX_PARALLEL_ZONES, DEFAULT_MAX_PARALLEL_ZONES),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=16, mode=selector.NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Optional(
+                    CONF_LOOKAHEAD_PLANNER,
+                    default=current_config.get(CONF_LOOKAHEAD_PLANNER, DEFAULT_LOOKAHEAD_PLANNER),
+                ): selector.BooleanSelector(),
                 vol.Required(
                     CONF_LOW_THRESHOLD,
                     default=current_config.get(CONF_LOW_THRESHOLD, DEFAULT_LOW_THRESHOLD),
@@ -702,6 +808,69 @@ class SmartIrrigationOptionsFlow(config_entries.OptionsFlow):
                         mode=selector.NumberSelectorMode.BOX,
                     )
                 ),
+                vol.Optional(
+                    CONF_HOURLY_ETO,
+                    default=current_config.get(CONF_HOURLY_ETO, DEFAULT_HOURLY_ETO),
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_EVENT_DRIVEN,
+                    default=current_config.get(CONF_EVENT_DRIVEN, DEFAULT_EVENT_DRIVEN),
+                ): selector.BooleanSelector(),
+                **{
+                    vol.Optional(
+                        key,
+                        description={"suggested_value": current_config.get(key)},
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain="sensor", device_class=device_class)
+                    )
+                    for key, device_class in STATION_SENSOR_FIELDS.items()
+                },
+                vol.Optional(
+                    CONF_RAIN_GATE_ENTITY,
+                    description={"suggested_value": current_config.get(CONF_RAIN_GATE_ENTITY)},
+                ): selector.EntitySelector(
+                    selector.EntitySelectorConfig(domain=["sensor", "binary_sensor"])
+                ),
+                vol.Optional(
+                    CONF_RAIN_GATE_THRESHOLD,
+                    default=current_config.get(CONF_RAIN_GATE_THRESHOLD, DEFAULT_RAIN_GATE_THRESHOLD),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0.1, max=10, step=0.1, unit_of_measurement="mm",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    CONF_RAIN_GATE_FORECAST,
+                    default=current_config.get(CONF_RAIN_GATE_FORECAST, DEFAULT_RAIN_GATE_FORECAST),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=50, step=0.1, unit_of_measurement="mm",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    CONF_PARALLEL_SOURCES,
+                    default=current_config.get(CONF_PARALLEL_SOURCES, DEFAULT_PARALLEL_SOURCES),
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_FUSION_METHOD,
+                    default=current_config.get(CONF_FUSION_METHOD, DEFAULT_FUSION_METHOD),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[
+                            selector.SelectOptionDict(value=FUSION_MEDIAN, label="Median"),
+                            selector.SelectOptionDict(value=FUSION_WEIGHTED, label="Weighted"),
+                        ],
+                        mode=selector.SelectSelectorMode.DROPDOWN,
+                    )
+                ),
+                vol.Optional(
+                    CONF_OWM_BASE_URL,
+                    description={"suggested_value": current_config.get(CONF_OWM_BASE_URL)},
+                ): selector.TextSelector(
+                    selector.TextSelectorConfig(type=selector.TextSelectorType.URL)
+                ),
             }
         )
 
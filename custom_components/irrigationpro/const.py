@@ -25,6 +25,10 @@ CONF_ZONE_ADAPTIVE: Final = "zone_adaptive"
 CONF_ZONE_SWITCH_ENTITY: Final = "zone_switch_entity"
 CONF_ZONE_WEEKDAYS: Final = "zone_weekdays"
 CONF_ZONE_MONTHS: Final = "zone_months"
+CONF_ZONE_DAY_RESTRICTION: Final = "zone_day_restriction"
+CONF_ZONE_BLACKOUT_DATES: Final = "zone_blackout_dates"
+CONF_ZONE_SOAK_MINUTES: Final = "zone_soak_minutes"
+CONF_ZONE_WATER_CAPACITY: Final = "zone_water_capacity"
 
 # Soil moisture learning
 CONF_ZONE_VEGETATION_TYPE: Final = "zone_vegetation_type"
@@ -59,6 +63,13 @@ SENSOR_BATTERY_LOW_THRESHOLD: Final = 15  # percent
 # Solar radiation (monthly average kWh/day)
 CONF_SOLAR_RADIATION: Final = "solar_radiation"
 
+# Hourly FAO-56 ETo (sums hourly forecast ETo per day). The OWM hourly block
+# covers only 48 h; later days keep their daily Penman-Monteith ETo.
+CONF_HOURLY_ETO: Final = "hourly_eto"
+
+# Refresh when the weather entity changes instead of polling hourly
+CONF_EVENT_DRIVEN: Final = "event_driven"
+
 # HomeKit native integration
 CONF_HOMEKIT_ENABLED: Final = "homekit_enabled"
 CONF_HOMEKIT_PORT: Final = "homekit_port"
@@ -67,6 +78,34 @@ CONF_HOMEKIT_PIN: Final = "homekit_pin"
 # OWM fallback
 CONF_OWM_API_KEY: Final = "owm_api_key"
 CONF_USE_OWM: Final = "use_owm"
+# One Call endpoint override, e.g. a local stand-in server (tools/fake_owm_server.py)
+CONF_OWM_BASE_URL: Final = "owm_base_url"
+
+# Local weather station: on-site sensors for observed daily weather
+CONF_STATION_TEMPERATURE: Final = "station_temperature_entity"
+CONF_STATION_HUMIDITY: Final = "station_humidity_entity"
+CONF_STATION_WIND_SPEED: Final = "station_wind_speed_entity"
+CONF_STATION_PRESSURE: Final = "station_pressure_entity"
+CONF_STATION_SOLAR_RADIATION: Final = "station_solar_radiation_entity"
+CONF_STATION_RAIN: Final = "station_rain_entity"
+
+# Rain gate: stop a running cycle on rain onset or expected rain
+CONF_RAIN_GATE_ENTITY: Final = "rain_gate_entity"
+CONF_RAIN_GATE_THRESHOLD: Final = "rain_gate_threshold"
+CONF_RAIN_GATE_FORECAST: Final = "rain_gate_forecast"
+
+# Hydraulic capacity: zones that fit the supply water at the same time
+CONF_SUPPLY_CAPACITY: Final = "supply_capacity"
+CONF_MAX_PARALLEL_ZONES: Final = "max_parallel_zones"
+
+# Look-ahead planner: pick watering days over the forecast per soil bucket
+CONF_LOOKAHEAD_PLANNER: Final = "lookahead_planner"
+
+# Multi-source fetch: query HA entity and OWM concurrently and fuse per day
+CONF_PARALLEL_SOURCES: Final = "parallel_sources"
+CONF_FUSION_METHOD: Final = "fusion_method"
+FUSION_MEDIAN: Final = "median"
+FUSION_WEIGHTED: Final = "weighted"
 
 # Default values
 DEFAULT_SUNRISE_OFFSET: Final = 0
@@ -80,6 +119,15 @@ DEFAULT_PUSHOVER_ENABLED: Final = False
 DEFAULT_PUSHOVER_PRIORITY: Final = 0
 DEFAULT_DAILY_REPORT_ENABLED: Final = False
 DEFAULT_DAILY_REPORT_HOUR: Final = 7
+DEFAULT_HOURLY_ETO: Final = False
+DEFAULT_EVENT_DRIVEN: Final = False
+DEFAULT_PARALLEL_SOURCES: Final = False
+DEFAULT_FUSION_METHOD: Final = FUSION_MEDIAN
+DEFAULT_RAIN_GATE_THRESHOLD: Final = 0.2
+DEFAULT_RAIN_GATE_FORECAST: Final = 0.0
+DEFAULT_SUPPLY_CAPACITY: Final = 0.0
+DEFAULT_MAX_PARALLEL_ZONES: Final = 1
+DEFAULT_LOOKAHEAD_PLANNER: Final = False
 DEFAULT_HOMEKIT_ENABLED: Final = False
 DEFAULT_HOMEKIT_PORT: Final = 21064
 DEFAULT_HOMEKIT_PIN: Final = "246-35-790"
@@ -98,6 +146,10 @@ DEFAULT_ZONE_ENABLED: Final = True
 DEFAULT_ZONE_ADAPTIVE: Final = True
 DEFAULT_ZONE_LEARNING_ENABLED: Final = True
 DEFAULT_ZONE_VEGETATION_TYPE: Final = "lawn"
+DEFAULT_ZONE_DAY_RESTRICTION: Final = "none"
+DEFAULT_ZONE_SOAK_MINUTES: Final = 0
+# Total available water of the root zone in mm (≈ 20 cm roots × 18 % AWC)
+DEFAULT_ZONE_WATER_CAPACITY: Final = 36.0
 
 # ---------------------------------------------------------------------------
 # Vegetation types with scientifically-based soil moisture targets (VWC %)
@@ -121,6 +173,8 @@ DEFAULT_ZONE_VEGETATION_TYPE: Final = "lawn"
 # Kc = crop coefficient (FAO-56 mid-season representative value)
 # MAD = management allowed depletion range (% of AWC)
 # ---------------------------------------------------------------------------
+SOIL_AWC_PERCENT: Final = 18
+
 VEGETATION_TYPES: Final = {
     "lawn": {
         "name_de": "Rasen",
@@ -271,6 +325,12 @@ WEEKDAYS: Final = [
     "sunday",
 ]
 
+# Odd/even-day water restrictions
+DAY_RESTRICTION_NONE: Final = "none"
+DAY_RESTRICTION_ODD: Final = "odd"
+DAY_RESTRICTION_EVEN: Final = "even"
+DAY_RESTRICTIONS: Final = [DAY_RESTRICTION_NONE, DAY_RESTRICTION_ODD, DAY_RESTRICTION_EVEN]
+
 # Months
 MONTHS: Final = [
     "january",
@@ -289,11 +349,43 @@ MONTHS: Final = [
 
 # Update intervals
 UPDATE_INTERVAL_MINUTES: Final = 60
+# Event-driven refresh: debounce entity changes, poll only as a safety net
+EVENT_REFRESH_DEBOUNCE_SECONDS: Final = 30
+EVENT_SAFETY_NET_MINUTES: Final = 360
+# Concurrent refresh triggers within this window share one weather fetch
+WEATHER_COALESCE_SECONDS: Final = 5
+# Per-source deadline when fetching weather sources in parallel
+SOURCE_DEADLINE_SECONDS: Final = 15
+# Weather retry backoff: 2 min doubling up to 1 h, ±20 % jitter
+RETRY_BASE_SECONDS: Final = 120
+RETRY_MAX_SECONDS: Final = 3600
+RETRY_JITTER: Final = 0.2
+# Circuit breaker per weather source: open after 3 consecutive failures for
+# 15 min, doubled after each failed probe up to 6 h
+BREAKER_FAILURE_THRESHOLD: Final = 3
+BREAKER_RESET_SECONDS: Final = 900
+BREAKER_MAX_RESET_SECONDS: Final = 21600
+
+# Rain gate: look-ahead of the hourly forecast check and how often it is refetched
+RAIN_GATE_LOOKAHEAD_HOURS: Final = 2
+RAIN_GATE_FORECAST_MAX_AGE_MINUTES: Final = 15
+
+# Persisted forecast snapshots older than this are not used at startup
+SNAPSHOT_MAX_AGE_HOURS: Final = 48
+
+# Days of past forecast ETo/rain kept to carry the look-ahead soil buckets forward
+BUCKET_DAYS_KEPT: Final = 14
 
 # Storage
 STORAGE_VERSION: Final = 1
 STORAGE_KEY: Final = f"{DOMAIN}_storage"
 
+# Observed weather history (backfilled from long-term statistics)
+OBSERVED_STORAGE_KEY: Final = f"{DOMAIN}_observed"
+OBSERVED_STORAGE_VERSION: Final = 1
+OBSERVED_HISTORY_DAYS_KEPT: Final = 60
+OBSERVED_IMPORT_DAYS: Final = 14
+
 # Services
 SERVICE_START_ZONE: Final = "start_zone"
 SERVICE_STOP_ZONE: Final = "stop_zone"
@@ -3,23 +3,33 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
 from typing import Any
 
 import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval, async_track_time_change
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_change,
+    async_track_time_interval,
+)
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    BUCKET_DAYS_KEPT,
     CONF_CYCLES,
     CONF_HIGH_THRESHOLD,
+    CONF_HOURLY_ETO,
     CONF_MASTER_ENABLED,
     CONF_LANGUAGE,
+    CONF_LOOKAHEAD_PLANNER,
     CONF_LOW_THRESHOLD,
+    CONF_MAX_PARALLEL_ZONES,
     CONF_OWM_API_KEY,
     CONF_PUSHOVER_API_TOKEN,
     CONF_PUSHOVER_DEVICE,
@@ -28,15 +38,31 @@ from .const import (
     CONF_PUSHOVER_USER_KEY,
     CONF_DAILY_REPORT_ENABLED,
     CONF_DAILY_REPORT_HOUR,
+    CONF_EVENT_DRIVEN,
+    CONF_FUSION_METHOD,
+    CONF_OWM_BASE_URL,
+    CONF_PARALLEL_SOURCES,
+    CONF_RAIN_GATE_ENTITY,
+    CONF_RAIN_GATE_FORECAST,
+    CONF_RAIN_GATE_THRESHOLD,
     CONF_RECHECK_TIME,
     CONF_SOLAR_RADIATION,
+    CONF_STATION_HUMIDITY,
+    CONF_STATION_PRESSURE,
+    CONF_STATION_RAIN,
+    CONF_STATION_SOLAR_RADIATION,
+    CONF_STATION_TEMPERATURE,
+    CONF_STATION_WIND_SPEED,
     CONF_SUNRISE_OFFSET,
+    CONF_SUPPLY_CAPACITY,
     CONF_USE_OWM,
     CONF_WEATHER_ENTITY,
     CONF_ZONE_ADAPTIVE,
     CONF_ZONE_ADJUSTMENT_PERCENT,
     CONF_ZONE_AREA,
+    CONF_ZONE_BLACKOUT_DATES,
     CONF_ZONE_CROP_COEF,
+    CONF_ZONE_DAY_RESTRICTION,
     CONF_ZONE_EFFICIENCY,
     CONF_ZONE_EMITTER_COUNT,
     CONF_ZONE_ENABLED,
@@ -49,37 +75,123 @@ from .const import (
     CONF_ZONE_PLANT_DENSITY,
     CONF_ZONE_RAIN_FACTORING,
     CONF_ZONE_RAIN_THRESHOLD,
+    CONF_ZONE_SOAK_MINUTES,
     CONF_ZONE_SOIL_MOISTURE_ENTITY,
     CONF_ZONE_SWITCH_ENTITY,
     CONF_ZONE_TARGET_MOISTURE_MAX,
     CONF_ZONE_TARGET_MOISTURE_MIN,
     CONF_ZONE_VEGETATION_TYPE,
+    CONF_ZONE_WATER_CAPACITY,
     CONF_ZONE_WEEKDAYS,
     CONF_ZONES,
     DEFAULT_CYCLES,
+    DEFAULT_EVENT_DRIVEN,
+    DEFAULT_FUSION_METHOD,
+    DEFAULT_HOURLY_ETO,
     DEFAULT_LANGUAGE,
+    DEFAULT_LOOKAHEAD_PLANNER,
     DEFAULT_MASTER_ENABLED,
+    DEFAULT_MAX_PARALLEL_ZONES,
+    DEFAULT_PARALLEL_SOURCES,
+    DEFAULT_RAIN_GATE_FORECAST,
+    DEFAULT_RAIN_GATE_THRESHOLD,
     DEFAULT_ZONE_ADJUSTMENT_PERCENT,
+    DEFAULT_ZONE_DAY_RESTRICTION,
     DEFAULT_ZONE_LEARNING_ENABLED,
+    DEFAULT_ZONE_SOAK_MINUTES,
     DEFAULT_ZONE_VEGETATION_TYPE,
+    DEFAULT_ZONE_WATER_CAPACITY,
     DEFAULT_SOLAR_RADIATION,
+    DEFAULT_SUPPLY_CAPACITY,
     DEFAULT_DAILY_REPORT_ENABLED,
     DEFAULT_DAILY_REPORT_HOUR,
     DEFAULT_SENSOR_ALERT_MINUTES,
     SENSOR_BATTERY_LOW_THRESHOLD,
     DOMAIN,
+    EVENT_REFRESH_DEBOUNCE_SECONDS,
+    EVENT_SAFETY_NET_MINUTES,
+    OBSERVED_IMPORT_DAYS,
+    RAIN_GATE_FORECAST_MAX_AGE_MINUTES,
+    RAIN_GATE_LOOKAHEAD_HOURS,
+    RETRY_BASE_SECONDS,
+    RETRY_JITTER,
+    RETRY_MAX_SECONDS,
+    SNAPSHOT_MAX_AGE_HOURS,
+    SOIL_AWC_PERCENT,
     STORAGE_KEY,
     STORAGE_VERSION,
     UPDATE_INTERVAL_MINUTES,
     VEGETATION_TYPES,
+    WEATHER_COALESCE_SECONDS,
     WEEKDAYS,
 )
-from .eto import calculate_eto
+from .eto import (
+    METHOD_PENMAN_MONTEITH,
+    EtoCache,
+    RadiationTable,
+    aggregate_hourly_eto,
+    atmospheric_pressure,
+    calculate_eto_batch,
+    get_radiation_table,
+    monthly_solar_radiation,
+    select_eto_method,
+    solar_table_configured,
+)
+from .history import ObservedHistory
+from .hydraulics import RunQueue, SupplyLimits, WateringPlan, plan_runs
+from .http_client import async_get_http_client
 from .learning import FeedbackCollector, get_vegetation_defaults
-from .weather_provider import WeatherData, WeatherProvider
+from .lookahead import LookaheadPlan, ZoneBucket, plan_zones
+from .rain_gate import REASON_FORECAST, RainGate
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .water_balance import WaterBalanceIndex
+from .station import (
+    STATION_HUMIDITY,
+    STATION_PRESSURE,
+    STATION_RAIN,
+    STATION_SOLAR_RADIATION,
+    STATION_TEMPERATURE,
+    STATION_WIND_SPEED,
+    WeatherStation,
+)
+from .weather_provider import OWM_API_URL, ForecastSeries, WeatherData, WeatherProvider
+from .zone_calendar import ZoneCalendar
 
 _LOGGER = logging.getLogger(__name__)
 
+# Forecast fields that determine a day's ETo
+_ETO_INPUT_FIELDS = (
+    "min_temp",
+    "max_temp",
+    "humidity",
+    "pressure",
+    "wind_speed",
+    "estimated",
+)
+# Forecast fields that determine a zone's water need
+_ZONE_INPUT_FIELDS = ("eto", "rain")
+# Zone attributes set by a duration calculation, restored when it is reused
+_ZONE_PLAN_ATTRS = (
+    "skip_reason",
+    "eto_total",
+    "rain_total",
+    "rain_carryover",
+    "window_rain",
+    "water_needed",
+    "duration_uncapped",
+    "moisture_reduction",
+)
+# Zone attributes any duration calculation writes; a simulation restores them
+_ZONE_RUNTIME_ATTRS = _ZONE_PLAN_ATTRS + (
+    "days_until_next",
+    "current_moisture",
+    "learning_correction",
+    "learning_confidence",
+    "bucket_depletion",
+    "bucket_date",
+)
+
 _WEEKDAY_NAMES = {
     "de": ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"],
     "en": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
@@ -143,6 +255,9 @@ _TEXT = {
         "zone_disabled": "Zone deaktiviert",
         "no_watering_day": "Kein Bewässerungstag ({weekday})",
         "no_watering_month": "Kein Bewässerungsmonat",
+        "no_watering_restricted": "Gesperrter Tag (Wasserbeschränkung oder Sperrtermin)",
+        "lookahead_deferred": "Vorausplanung: nächste Bewässerung am {date}",
+        "lookahead_not_needed": "Vorausplanung: keine Bewässerung in den nächsten {days} Tagen nötig",
         "rain_threshold_exceeded": "Regenschwelle überschritten ({rain:.1f} mm >= {threshold} mm)",
         "no_water_needed": "Kein Wasserbedarf (ETo durch Regen gedeckt)",
         "temperature_too_low": "Temperatur zu niedrig (min: {min_temp:.1f}°C, max: {max_temp:.1f}°C – Schwelle min>= {low}°C und max>= {high}°C)",
@@ -165,13 +280,15 @@ _TEXT = {
         "runtime": "Laufzeit",
         "no_zones_configured": "Keine Zonen konfiguriert",
         "next_recalc_before_run": "Nächste Neuberechnung vor geplantem Lauf: {when}",
-        "no_extra_recalc_before_run": "Keine zusätzliche Neuberechnung vor einem geplanten Lauf.\nReguläres Wetter-Update und Neuplanung alle {minutes} Minuten.",
+        "no_extra_recalc_before_run": "Keine zusätzliche Neuberechnung vor einem geplanten Lauf.\nReguläres Wetter-Update und Neuplanung {interval}.",
         "extra_recalc_before_start": "Zusätzliche Neuberechnung vor Start: {when}",
-        "no_extra_recalc_before_start": "Keine zusätzliche Neuberechnung vor Start.\nReguläres Wetter-Update und Neuplanung alle {minutes} Minuten.",
-        "next_extra_recalc": "Nächste zusätzliche Neuberechnung:\n{when}\n(zusätzlich zum regulären Update alle {minutes} Minuten)",
-        "no_extra_recalc_today": "Keine zusätzliche Neuberechnung für heute geplant.\nAutomatische Neuplanung beim nächsten Wetter-Update (alle {minutes} Minuten).",
+        "no_extra_recalc_before_start": "Keine zusätzliche Neuberechnung vor Start.\nReguläres Wetter-Update und Neuplanung {interval}.",
+        "next_extra_recalc": "Nächste zusätzliche Neuberechnung:\n{when}\n(zusätzlich zum regulären Update {interval})",
+        "no_extra_recalc_today": "Keine zusätzliche Neuberechnung für heute geplant.\nAutomatische Neuplanung beim nächsten Wetter-Update ({interval}).",
+        "replan_interval": "alle {minutes} Minuten",
+        "replan_event_driven": "bei jeder Änderung der Wetter-Entität, spätestens alle {minutes} Minuten",
         "no_schedule_set": "Kein Zeitplan gesetzt",
-        "weather_unavailable": "⚠️ Wetter-Entität nicht verfügbar – Retry alle 2 min. Prüfe die Konfiguration.",
+        "weather_unavailable": "⚠️ Wetter-Entität nicht verfügbar – nächster Versuch in {minutes} min. Prüfe die Konfiguration.",
         "manual_zone_started": "Zone «{zone}» manuell gestartet\nGeplante Dauer: {duration} min.",
         "manual_zone_stopped": "Zone «{zone}» beendet\nLaufzeit: {duration} min.\nStart: {start}\nEnde:  {end}",
         "master_disabled_message": "Der Hauptschalter wurde ausgeschaltet. Alle laufenden Zonen wurden gestoppt und die automatische Bewässerung bleibt pausiert, bis du sie wieder aktivierst.",
@@ -180,6 +297,11 @@ _TEXT = {
         "pushover_disabled_message": "Pushover ist jetzt deaktiviert. Ab sofort werden keine Benachrichtigungen mehr gesendet, bis du es manuell wieder aktivierst.",
         "master_blocked_manual_start": "Manueller Start blockiert: Hauptschalter deaktiviert",
         "watering_error": "Fehler beim Bewässern: {error}",
+        "title_rain_stopped": "🌧️ Bewässerung wegen Regen beendet",
+        "rain_gate_sensor": "Regen erkannt ({entity}) – laufende Zone gestoppt, restliche Zonen übersprungen.",
+        "rain_gate_forecast": "{rain:.1f} mm Regen in den nächsten {hours} h erwartet – restliche Zonen übersprungen.",
+        "rain_gate_skipped": "Wegen Regen übersprungen",
+        "rain_gate_stopped": "Wegen Regen vorzeitig beendet",
         "weather_footer": "───\n{day}: {condition}, {clouds}% Wolken\nSonnenaufgang: {sunrise} Uhr | Luftfeuchte: {humidity:.0f}%\nTemp.: {min_temp:.1f}°C – {max_temp:.1f}°C\nLuftdruck: {pressure:.0f} hPa | Wind: {wind:.1f} m/s\nNiederschlag: {rain:.2f} mm | ETo: {eto:.2f} mm",
         "test_message": "Test-Benachrichtigung erfolgreich! Priorität: {priority}",
         "learning_feedback_scheduled": "Bodenfeuchtesensor-Auswertung für Zone «{zone}» in {hours}h geplant",
@@ -203,6 +325,9 @@ _TEXT = {
         "zone_disabled": "Zone disabled",
         "no_watering_day": "Not a watering day ({weekday})",
         "no_watering_month": "Not a watering month",
+        "no_watering_restricted": "Restricted day (water restriction or blackout date)",
+        "lookahead_deferred": "Look-ahead plan: next watering on {date}",
+        "lookahead_not_needed": "Look-ahead plan: no watering needed in the next {days} days",
         "rain_threshold_exceeded": "Rain threshold exceeded ({rain:.1f} mm >= {threshold} mm)",
         "no_water_needed": "No watering needed (ETo covered by rain)",
         "temperature_too_low": "Temperature too low (min: {min_temp:.1f}°C, max: {max_temp:.1f}°C - threshold min>= {low}°C and max>= {high}°C)",
@@ -225,13 +350,15 @@ _TEXT = {
         "runtime": "Runtime",
         "no_zones_configured": "No zones configured",
         "next_recalc_before_run": "Next recalculation before scheduled run: {when}",
-        "no_extra_recalc_before_run": "No additional recalculation before a scheduled run.\nRegular weather update and replanning every {minutes} minutes.",
+        "no_extra_recalc_before_run": "No additional recalculation before a scheduled run.\nRegular weather update and replanning {interval}.",
         "extra_recalc_before_start": "Additional recalculation before start: {when}",
-        "no_extra_recalc_before_start": "No additional recalculation before start.\nRegular weather update and replanning every {minutes} minutes.",
-        "next_extra_recalc": "Next additional recalculation:\n{when}\n(in addition to the regular update every {minutes} minutes)",
-        "no_extra_recalc_today": "No additional recalculation planned for today.\nAutomatic replanning at the next weather update (every {minutes} minutes).",
+        "no_extra_recalc_before_start": "No additional recalculation before start.\nRegular weather update and replanning {interval}.",
+        "next_extra_recalc": "Next additional recalculation:\n{when}\n(in addition to the regular update {interval})",
+        "no_extra_recalc_today": "No additional recalculation planned for today.\nAutomatic replanning at the next weather update ({interval}).",
+        "replan_interval": "every {minutes} minutes",
+        "replan_event_driven": "on every weather entity change, at least every {minutes} minutes",
         "no_schedule_set": "No schedule set",
-        "weather_unavailable": "⚠️ Weather entity not available – retrying every 2 min. Check configuration.",
+        "weather_unavailable": "⚠️ Weather entity not available – next retry in {minutes} min. Check configuration.",
         "manual_zone_started": "Zone «{zone}» started manually\nPlanned duration: {duration} min.",
         "manual_zone_stopped": "Zone «{zone}» finished\nRuntime: {duration} min.\nStart: {start}\nEnd:   {end}",
         "master_disabled_message": "The master switch was turned off. All running zones were stopped and automatic irrigation will stay paused until you enable it again.",
@@ -240,6 +367,11 @@ _TEXT = {
         "pushover_disabled_message": "Pushover is now disabled. No notifications will be sent until you enable it manually again.",
         "master_blocked_manual_start": "Manual start blocked: master switch disabled",
         "watering_error": "Watering error: {error}",
+        "title_rain_stopped": "🌧️ Watering stopped by rain",
+        "rain_gate_sensor": "Rain detected ({entity}) – running zone stopped, remaining zones skipped.",
+        "rain_gate_forecast": "{rain:.1f} mm of rain expected within {hours} h – remaining zones skipped.",
+        "rain_gate_skipped": "Skipped because of rain",
+        "rain_gate_stopped": "Stopped early because of rain",
         "weather_footer": "───\n{day}: {condition}, {clouds}% clouds\nSunrise: {sunrise} | Humidity: {humidity:.0f}%\nTemp.: {min_temp:.1f}°C – {max_temp:.1f}°C\nPressure: {pressure:.0f} hPa | Wind: {wind:.1f} m/s\nPrecipitation: {rain:.2f} mm | ETo: {eto:.2f} mm",
         "test_message": "Test notification sent successfully! Priority: {priority}",
         "learning_feedback_scheduled": "Soil moisture feedback for zone «{zone}» scheduled in {hours}h",
@@ -283,9 +415,16 @@ class ZoneData:
         self.rain_factoring = config.get(CONF_ZONE_RAIN_FACTORING, True)
         self.adjustment_percent = config.get(CONF_ZONE_ADJUSTMENT_PERCENT, DEFAULT_ZONE_ADJUSTMENT_PERCENT)
         self.switch_entity = config.get(CONF_ZONE_SWITCH_ENTITY)
+        self.soak_minutes = config.get(CONF_ZONE_SOAK_MINUTES, DEFAULT_ZONE_SOAK_MINUTES)
+        self.water_capacity = config.get(CONF_ZONE_WATER_CAPACITY, DEFAULT_ZONE_WATER_CAPACITY)
         # Use CONF keys for weekdays and months with proper defaults
         self.weekdays = config.get(CONF_ZONE_WEEKDAYS, WEEKDAYS)
         self.months = config.get(CONF_ZONE_MONTHS, list(range(1, 13)))
+        self.day_restriction = config.get(CONF_ZONE_DAY_RESTRICTION, DEFAULT_ZONE_DAY_RESTRICTION)
+        self.blackout_dates = config.get(CONF_ZONE_BLACKOUT_DATES, [])
+        self.calendar = ZoneCalendar(
+            self.weekdays, self.months, self.day_restriction, self.blackout_dates
+        )
         
         # Soil moisture learning
         self.vegetation_type = config.get(CONF_ZONE_VEGETATION_TYPE, DEFAULT_ZONE_VEGETATION_TYPE)
@@ -313,6 +452,18 @@ class ZoneData:
         self.days_until_next: int = 1  # Days of ETo accumulated for this calculation
         self.current_moisture: float | None = None  # Live reading from sensor
         self.moisture_reduction: float = 1.0  # 1.0 = none, <1.0 = reduced due to moisture
+        self.rain_carryover: float = 0.0  # Observed rain since last run not used up by ETo
+        # Forecast rain (ISO date -> mm) the current calculation and the last run assumed
+        self.window_rain: dict[str, float] = {}
+        self.planned_rain: dict[str, float] = {}
+        # Look-ahead soil bucket: depletion in mm at the start of bucket_date
+        self.bucket_depletion: float | None = None
+        self.bucket_date: date | None = None
+
+    @property
+    def total_flow(self) -> float:
+        """Return the flow of all emitters in L/h."""
+        return self.flow_rate * self.emitter_count
 
 
 class SmartIrrigationCoordinator(DataUpdateCoordinator):
@@ -328,7 +479,9 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         )
         self.entry = entry
         self.zones: list[ZoneData] = []
-        self.forecast: list[WeatherData] = []
+        self.forecast = ForecastSeries()
+        # Provider result the current forecast was computed from
+        self._raw_forecast = ForecastSeries()
         self.scheduled_run: datetime | None = None
         self.recheck_scheduled: datetime | None = None
         self._schedule_timer = None
@@ -338,10 +491,15 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         self._storage: Store | None = None
         self._schedule_checker_unsub = None
         self.schedule_reason: str = ""  # Why no watering is scheduled
-        self.weather_status: str = "ok"  # ok | unavailable | error
+        self.weather_status: str = "ok"  # ok | snapshot | unavailable | error
         self.history: list[dict] = []  # Irrigation & skip history (max 180 entries)
         self.last_calculated: datetime | None = None  # When the schedule was last calculated
         self.last_refresh_time: datetime | None = None  # Last successful coordinator refresh
+        # Last good forecast (with ETo), persisted for an instant cold start
+        self.snapshot_time: datetime | None = None
+        self._snapshot_forecast = ForecastSeries()
+        # Latest forecast ETo and rain per ISO date, to carry soil buckets over past days
+        self._forecast_days: dict[str, list[float]] = {}
         self._daily_report_unsub = None
         self._watering_started_at: datetime | None = None
         self.homekit_server = None  # Set by __init__.py if HomeKit enabled
@@ -352,6 +510,49 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         
         # Soil moisture learning
         self.feedback_collector = FeedbackCollector(hass, entry.entry_id)
+
+        # Astronomical radiation per day of year (rebuilt on location change)
+        self._radiation_table: RadiationTable | None = None
+        # Memoized daily ETo for unchanged forecast days between refreshes
+        self.eto_cache = EtoCache()
+        # Forecast diffing: the last daily-ETo result is the basis for reusing
+        # ETo of unchanged days; zone results are kept per zone and start
+        # date until a day in their watering window changes
+        self._eto_basis: ForecastSeries | None = None
+        self._planned_forecast = ForecastSeries()
+        self._zone_plans: dict[int, dict[date, tuple]] = {}
+        # Prefix sums and next-watering-day tables of the current forecast
+        self._balance = WaterBalanceIndex(self.forecast)
+        # Timing of the last schedule solver run (status API)
+        self.solver_stats: dict[str, Any] = {}
+        # Watering days per zone from the look-ahead planner (if enabled)
+        self.lookahead_plans: dict[int, LookaheadPlan] = {}
+        self.lookahead_stats: dict[str, Any] = {"enabled": False}
+        self.watering_plan: WateringPlan | None = None
+        self.diff_stats: dict[str, int] = {
+            "eto_days_computed": 0,
+            "eto_days_reused": 0,
+            "days_changed": 0,
+            "zones_evaluated": 0,
+            "zones_reused": 0,
+        }
+
+        # Coalesce concurrent refresh triggers (timer, API, service, retries)
+        self.fetch_flight = SingleFlight("weather_fetch", window=WEATHER_COALESCE_SECONDS)
+        # Backoff for weather retries instead of a fixed 2-minute interval
+        self.retry_policy = RetryPolicy(
+            RETRY_BASE_SECONDS, RETRY_MAX_SECONDS, jitter=RETRY_JITTER
+        )
+
+        # Event-driven refresh on weather entity state changes
+        self._weather_listener_unsub = None
+        self._event_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=EVENT_REFRESH_DEBOUNCE_SECONDS,
+            immediate=False,
+            function=self.async_refresh,
+        )
         
         # Validate configuration
         if not entry.data.get(CONF_WEATHER_ENTITY):
@@ -368,8 +569,28 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             weather_entity=entry.data.get(CONF_WEATHER_ENTITY),
             owm_api_key=entry.data.get(CONF_OWM_API_KEY),
             use_owm=entry.data.get(CONF_USE_OWM, False),
+            hourly_eto=entry.data.get(CONF_HOURLY_ETO, DEFAULT_HOURLY_ETO),
+            parallel_sources=entry.data.get(CONF_PARALLEL_SOURCES, DEFAULT_PARALLEL_SOURCES),
+            fusion_method=entry.data.get(CONF_FUSION_METHOD, DEFAULT_FUSION_METHOD),
+            owm_base_url=entry.data.get(CONF_OWM_BASE_URL),
         )
         
+        # Observed weather from on-site sensors (optional)
+        self.station = self._create_station()
+        self.observed_history = self._create_observed_history()
+        self._history_import_unsub = None
+        # Stops a running cycle on rain onset or expected rain
+        self.rain_gate = RainGate(
+            hass,
+            entry.data.get(CONF_RAIN_GATE_ENTITY),
+            entry.data.get(CONF_RAIN_GATE_THRESHOLD, DEFAULT_RAIN_GATE_THRESHOLD),
+            entry.data.get(CONF_RAIN_GATE_FORECAST, DEFAULT_RAIN_GATE_FORECAST),
+            RAIN_GATE_LOOKAHEAD_HOURS,
+            hourly_forecast=self.weather_provider.async_get_hourly_forecast,
+            forecast_max_age=timedelta(minutes=RAIN_GATE_FORECAST_MAX_AGE_MINUTES),
+        )
+        self.weather_provider.keep_hourly = self.rain_gate.forecast_threshold > 0
+
         # Initialize zones from config
         self._init_zones()
         
@@ -379,6 +600,8 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         )
         # Set up daily morning report if configured
         self._setup_daily_report()
+        # Subscribe to the weather entity if event-driven refresh is enabled
+        self._setup_weather_listener()
 
     def _init_zones(self):
         """Initialize zones from configuration."""
@@ -412,8 +635,25 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             zone.learning_correction = self.feedback_collector.get_correction_factor(zone.zone_id)
             zone.learning_confidence = self.feedback_collector.get_confidence(zone.zone_id)
 
+    def _get_radiation_table(self) -> RadiationTable:
+        """Return the radiation table for the configured HA location."""
+        lat = self.hass.config.latitude
+        alt = self.hass.config.elevation
+        if self._radiation_table is None or not self._radiation_table.matches(lat, alt):
+            _LOGGER.debug("Building radiation table for lat=%s, alt=%s", lat, alt)
+            self._radiation_table = get_radiation_table(lat, alt)
+            # ETo of every day depends on the location
+            self._eto_basis = None
+        return self._radiation_table
+
     async def async_config_entry_first_refresh(self):
         """Refresh data for the first time when config entry is setup."""
+        self._get_radiation_table()
+        await self.weather_provider.async_prime_sunrise_cache()
+        self.station.async_start()
+        await self.observed_history.async_load()
+        self._setup_history_import()
+
         # Load stored data
         await self._async_load_storage()
         
@@ -421,18 +661,130 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         await self.feedback_collector.async_load()
         self._sync_learning_to_zones()
         
+        # Plan immediately from the persisted forecast and fetch weather in
+        # the background, so setup does not wait for the weather integration
+        if self._plan_from_snapshot():
+            await self._async_calculate_schedule()
+            self.async_set_updated_data({
+                "forecast": self.forecast,
+                "zones": self.zones,
+                "scheduled_run": self.scheduled_run,
+            })
+            self.hass.async_create_task(self.async_refresh())
+            return
+
         # Perform first refresh
         await super().async_config_entry_first_refresh()
         
         # Calculate initial schedule
         await self._async_calculate_schedule()
 
+    def _create_station(self) -> WeatherStation:
+        """Create the local weather station from the configured sensors."""
+        return WeatherStation(
+            self.hass,
+            self._station_sensors(),
+            monthly_solar=self.entry.data.get(CONF_SOLAR_RADIATION, DEFAULT_SOLAR_RADIATION),
+            on_day_complete=self._handle_observed_day,
+        )
+
+    def _station_sensors(self) -> dict[str, str | None]:
+        """Return the configured station sensors by quantity."""
+        data = self.entry.data
+        return {
+            STATION_TEMPERATURE: data.get(CONF_STATION_TEMPERATURE),
+            STATION_HUMIDITY: data.get(CONF_STATION_HUMIDITY),
+            STATION_WIND_SPEED: data.get(CONF_STATION_WIND_SPEED),
+            STATION_PRESSURE: data.get(CONF_STATION_PRESSURE),
+            STATION_SOLAR_RADIATION: data.get(CONF_STATION_SOLAR_RADIATION),
+        }
+
+    def _create_observed_history(self) -> ObservedHistory:
+        """Create the observed-weather history for the configured sensors."""
+        history = ObservedHistory(self.hass)
+        history.update_sensors(
+            {**self._station_sensors(), STATION_RAIN: self.entry.data.get(CONF_STATION_RAIN)},
+            self.entry.data.get(CONF_SOLAR_RADIATION, DEFAULT_SOLAR_RADIATION),
+        )
+        return history
+
+    def _setup_history_import(self) -> None:
+        """Backfill observed history now (in the background) and daily after midnight."""
+        if self._history_import_unsub:
+            self._history_import_unsub()
+            self._history_import_unsub = None
+        if not self.observed_history.configured:
+            return
+        self.hass.async_create_task(self._async_import_history(OBSERVED_IMPORT_DAYS))
+        # Statistics for the finished day are compiled shortly after midnight
+        self._history_import_unsub = async_track_time_change(
+            self.hass, self._async_daily_history_import, hour=0, minute=20, second=0
+        )
+
+    async def _async_daily_history_import(self, _now: datetime) -> None:
+        """Import the last completed days and re-plan with the observed rain."""
+        await self._async_import_history(2)
+        if self.forecast:
+            await self._async_calculate_schedule()
+
+    async def _async_import_history(self, days: int) -> None:
+        """Import ``days`` days of observed weather and persist them."""
+        if await self.observed_history.async_import(days):
+            await self.observed_history.async_save()
+
+    @callback
+    def _handle_observed_day(self, weather: WeatherData) -> None:
+        """Log the measured weather and actual ETo of a finished day."""
+        _LOGGER.info(
+            "Observed %s: ETo=%.2f mm (%s), Temp=%.1f-%.1f°C",
+            weather.sunrise.date(),
+            weather.eto,
+            weather.eto_method,
+            weather.min_temp,
+            weather.max_temp,
+        )
+        self.observed_history.record(weather)
+        self.hass.async_create_task(self.observed_history.async_save())
+
+    def _snapshot_days(self) -> ForecastSeries:
+        """Return the still usable days of the persisted forecast."""
+        if not self._snapshot_forecast or self.snapshot_time is None:
+            return ForecastSeries()
+        if dt_util.now() - self.snapshot_time > timedelta(hours=SNAPSHOT_MAX_AGE_HOURS):
+            return ForecastSeries()
+        return self._current_days(self._snapshot_forecast)
+
+    @staticmethod
+    def _current_days(forecast: ForecastSeries) -> ForecastSeries:
+        """Return the days of ``forecast`` from today on (the series itself if none passed)."""
+        today = dt_util.now().date()
+        for index, sunrise in enumerate(forecast.column("sunrise")):
+            if sunrise is not None and sunrise.date() >= today:
+                return forecast[index:] if index else forecast
+        return ForecastSeries()
+
+    def _plan_from_snapshot(self) -> bool:
+        """Use the persisted forecast as provisional forecast, if valid."""
+        days = self._snapshot_days()
+        if not days:
+            return False
+        _LOGGER.info(
+            "Using forecast snapshot from %s (%d days) until live weather arrives",
+            self.snapshot_time,
+            len(days),
+        )
+        self.forecast = days
+        self.weather_status = "snapshot"
+        return True
+
     async def async_apply_updated_entry(self, entry: ConfigEntry) -> None:
         """Apply updated config-entry data without unloading the integration.
 
         This keeps the dashboard panel alive when values are changed from the UI.
         """
         old_last_run = {z.zone_id: z.last_run for z in self.zones}
+        old_planned_rain = {z.zone_id: z.planned_rain for z in self.zones}
+        old_bucket = {z.zone_id: (z.bucket_depletion, z.bucket_date) for z in self.zones}
 
         self.entry = entry
 
@@ -440,14 +792,45 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         self.weather_provider.weather_entity = entry.data.get(CONF_WEATHER_ENTITY)
         self.weather_provider.owm_api_key = entry.data.get(CONF_OWM_API_KEY)
         self.weather_provider.use_owm = entry.data.get(CONF_USE_OWM, False)
+        self.weather_provider.owm_base_url = entry.data.get(CONF_OWM_BASE_URL) or OWM_API_URL
+        self.weather_provider.hourly_eto = entry.data.get(CONF_HOURLY_ETO, DEFAULT_HOURLY_ETO)
+        self.weather_provider.parallel_sources = entry.data.get(
+            CONF_PARALLEL_SOURCES, DEFAULT_PARALLEL_SOURCES
+        )
+        self.weather_provider.fusion_method = entry.data.get(
+            CONF_FUSION_METHOD, DEFAULT_FUSION_METHOD
+        )
+        # Settings such as solar radiation change ETo, so re-parse next time
+        self.weather_provider.invalidate_cache()
+        self._eto_basis = None
+        self._zone_plans.clear()
+        self.retry_policy.reset()
+        self.station.async_stop()
+        self.station = self._create_station()
+        self.station.async_start()
+        self.observed_history.update_sensors(
+            {**self._station_sensors(), STATION_RAIN: entry.data.get(CONF_STATION_RAIN)},
+            entry.data.get(CONF_SOLAR_RADIATION, DEFAULT_SOLAR_RADIATION),
+        )
+        self._setup_history_import()
+        self.rain_gate.update(
+            entry.data.get(CONF_RAIN_GATE_ENTITY),
+            entry.data.get(CONF_RAIN_GATE_THRESHOLD, DEFAULT_RAIN_GATE_THRESHOLD),
+            entry.data.get(CONF_RAIN_GATE_FORECAST, DEFAULT_RAIN_GATE_FORECAST),
+        )
+        self.weather_provider.keep_hourly = self.rain_gate.forecast_threshold > 0
+        self.fetch_flight.forget()
 
         # Rebuild zone configs from entry and preserve runtime timestamps.
         self._init_zones()
         for zone in self.zones:
             zone.last_run = old_last_run.get(zone.zone_id)
+            zone.planned_rain = old_planned_rain.get(zone.zone_id, {})
+            zone.bucket_depletion, zone.bucket_date = old_bucket.get(zone.zone_id, (None, None))
 
         # Re-register daily report timer if related settings changed.
         self._setup_daily_report()
+        self._setup_weather_listener()
 
         # Trigger recalculation/refresh with the new settings.
         await self.async_request_refresh()
@@ -459,69 +842,130 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Updating weather data and calculating irrigation needs")
             
             # Get weather forecast – a missing/unavailable entity must not block startup
+            previous_raw = self._raw_forecast
+            retry_delay = None
             try:
-                self.forecast = await self.weather_provider.async_get_forecast(days=8)
+                self._raw_forecast = await self.fetch_flight.run(
+                    "forecast", lambda: self.weather_provider.async_get_forecast(days=8)
+                )
                 self.weather_status = "ok"
+                # An unchanged provider result keeps the series with ETo applied.
+                # Sources are fused by date, so a source still listing
+                # yesterday must not make it day 0.
+                if self._raw_forecast is not previous_raw or not self.forecast:
+                    self.forecast = self._current_days(self._raw_forecast)
             except (ValueError, Exception) as weather_err:
-                _LOGGER.warning(
-                    "Weather data not available (%s) – will retry in 2 min. "
-                    "Available weather entities: %s",
-                    weather_err,
-                    ", ".join(sorted(self.hass.states.async_entity_ids("weather"))) or "none",
-                )
-                self.forecast = []
-                self.weather_status = "unavailable"
+                retry_delay = self.retry_policy.next_delay()
+                if self.retry_policy.attempts == 1:
+                    # Log the entity list once per outage, not on every retry
+                    _LOGGER.warning(
+                        "Weather data not available (%s) – retrying with backoff. "
+                        "Available weather entities: %s",
+                        weather_err,
+                        ", ".join(sorted(self.hass.states.async_entity_ids("weather"))) or "none",
+                    )
+                else:
+                    _LOGGER.debug(
+                        "Weather data still not available (%s), attempt %d, next retry in %s",
+                        weather_err,
+                        self.retry_policy.attempts,
+                        retry_delay,
+                    )
+                self._raw_forecast = ForecastSeries()
+                self.forecast = self._snapshot_days()
+                self.weather_status = "snapshot" if self.forecast else "unavailable"
 
             if not self.forecast:
-                # Retry much sooner than the normal 60-min interval
-                self.update_interval = timedelta(minutes=2)
-                self.schedule_reason = self._txt("weather_unavailable")
-                _LOGGER.warning(
-                    "No forecast data – scheduling retry in 2 min. "
-                    "Watering will not be scheduled until weather data is available."
+                # Retry sooner than the normal interval, backing off over time
+                if retry_delay is None:
+                    retry_delay = self.retry_policy.next_delay()
+                self.update_interval = retry_delay
+                self.schedule_reason = self._txt(
+                    "weather_unavailable",
+                    minutes=max(1, round(retry_delay.total_seconds() / 60)),
                 )
+                if self.retry_policy.attempts == 1:
+                    _LOGGER.warning(
+                        "No forecast data – watering will not be scheduled "
+                        "until weather data is available."
+                    )
                 return {
                     "forecast": [],
                     "zones": self.zones,
                     "scheduled_run": self.scheduled_run,
                 }
 
+            if self.weather_status == "snapshot":
+                # Keep a provisional plan from the last good forecast while
+                # retrying the live source with backoff
+                self.update_interval = retry_delay
+                await self._async_calculate_schedule()
+                return {
+                    "forecast": self.forecast,
+                    "zones": self.zones,
+                    "scheduled_run": self.scheduled_run,
+                }
+
             # Weather is available – restore normal update interval
-            self.update_interval = timedelta(minutes=UPDATE_INTERVAL_MINUTES)
+            if self.retry_policy.attempts:
+                _LOGGER.info(
+                    "Weather data available again after %d failed attempts",
+                    self.retry_policy.attempts,
+                )
+                self.retry_policy.reset()
+            self.update_interval = self._normal_update_interval()
             
+            if self._forecast_unchanged(previous_raw):
+                # Same payload as last time: ETo is still valid, but the schedule
+                # also depends on the time of day, the date, sensors and observed
+                # history, so it is always recalculated (unchanged zone windows
+                # are reused). Across midnight day 0 must become today.
+                _LOGGER.debug("Forecast unchanged – skipping ETo calculation")
+                self.forecast = self._current_days(self.forecast)
+                if (
+                    self.entry.data.get(CONF_HOURLY_ETO, DEFAULT_HOURLY_ETO)
+                    and self._eto_basis is not None
+                ):
+                    # The hourly forecast moves on without the daily one, so
+                    # re-apply it to the daily ETo
+                    self.forecast = self._current_days(self._eto_basis)
+                    await self._async_apply_hourly_eto(
+                        self.entry.data.get(CONF_SOLAR_RADIATION, DEFAULT_SOLAR_RADIATION)
+                    )
+                await self._async_calculate_schedule()
+                self.last_refresh_time = dt_util.now()
+                await self._async_check_sensor_health()
+                return {
+                    "forecast": self.forecast,
+                    "zones": self.zones,
+                    "scheduled_run": self.scheduled_run,
+                }
+
             # Calculate ETo for each forecast day
-            lat = self.hass.config.latitude
-            alt = self.hass.config.elevation
             solar_rad_data = self.entry.data.get(
                 CONF_SOLAR_RADIATION, DEFAULT_SOLAR_RADIATION
             )
-            
+            self._calculate_forecast_eto(solar_rad_data)
+
+            if self.entry.data.get(CONF_HOURLY_ETO, DEFAULT_HOURLY_ETO):
+                await self._async_apply_hourly_eto(solar_rad_data)
+
             for day_data in self.forecast:
-                month = day_data.sunrise.month
-                # Keys may be strings after JSON serialization
-                solar_rad = solar_rad_data.get(month) or solar_rad_data.get(str(month), 6.0)
-                
-                day_data.eto = calculate_eto(
-                    min_temp=day_data.min_temp,
-                    max_temp=day_data.max_temp,
-                    humidity=day_data.humidity,
-                    pressure=day_data.pressure,
-                    wind_speed=day_data.wind_speed,
-                    solar_radiation=solar_rad,
-                    altitude=alt,
-                    latitude=lat,
-                    date=day_data.sunrise,
-                )
-                
                 _LOGGER.debug(
-                    "Day %s: ETo=%.2f mm, Rain=%.1f mm, Temp=%.1f-%.1f°C",
+                    "Day %s: ETo=%.2f mm (%s), Rain=%.1f mm, Temp=%.1f-%.1f°C",
                     day_data.sunrise.date(),
                     day_data.eto,
+                    day_data.eto_method,
                     day_data.rain,
                     day_data.min_temp,
                     day_data.max_temp,
                 )
             
+            # Remember the computed forecast for the next cold start
+            self.snapshot_time = dt_util.now()
+            self._snapshot_forecast = self.forecast
+            self.hass.async_create_task(self._async_save_storage())
+
             # Recalculate zone requirements
             await self._async_calculate_schedule()
             self.last_refresh_time = dt_util.now()
@@ -539,6 +983,202 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error updating data: %s", err)
             raise UpdateFailed(f"Error updating data: {err}")
 
+    def _calculate_forecast_eto(self, solar_rad_data: dict) -> None:
+        """Compute ETo for every forecast day with the best valid method.
+
+        Days with all Penman-Monteith inputs go through the memoized batch
+        path. Days where the source lacked humidity or wind fall back to
+        Priestley-Taylor (if solar radiation is configured) or
+        Hargreaves-Samani instead of silently using default values. Days
+        whose inputs match the previous result keep their ETo.
+        """
+        lat = self.hass.config.latitude
+        alt = self.hass.config.elevation
+        radiation_table = self._get_radiation_table()
+        solar_configured = solar_table_configured(solar_rad_data, DEFAULT_SOLAR_RADIATION)
+
+        etos = list(self.forecast.column("eto"))
+        methods = list(self.forecast.column("eto_method"))
+
+        # Days whose ETo inputs are the same as last time keep their ETo
+        basis = self._eto_basis
+        if basis is not None:
+            changed = self.forecast.changed_days(basis, _ETO_INPUT_FIELDS)
+            basis_index = {day: index for index, day in enumerate(basis.dates())}
+            basis_etos = basis.column("eto")
+            basis_methods = basis.column("eto_method")
+            for index, day in enumerate(self.forecast.dates()):
+                if index not in changed:
+                    etos[index] = basis_etos[basis_index[day]]
+                    methods[index] = basis_methods[basis_index[day]]
+        else:
+            changed = dict.fromkeys(range(len(self.forecast)))
+        self.diff_stats["eto_days_computed"] = len(changed)
+        self.diff_stats["eto_days_reused"] = len(self.forecast) - len(changed)
+
+        pm_days: list[tuple[int, WeatherData, float, float]] = []
+        for index, day_data in enumerate(self.forecast):
+            if index not in changed:
+                continue
+            month = day_data.sunrise.month
+            solar_rad = monthly_solar_radiation(solar_rad_data, month)
+            pressure = (
+                atmospheric_pressure(alt)
+                if "pressure" in day_data.estimated
+                else day_data.pressure
+            )
+
+            available = {"min_temp", "max_temp", "humidity", "wind_speed"} - day_data.estimated
+            if solar_configured:
+                available.add("solar_radiation")
+            method = select_eto_method(available)
+
+            if method is None or method.name == METHOD_PENMAN_MONTEITH:
+                # No valid method at all keeps the estimated Penman-Monteith value
+                methods[index] = METHOD_PENMAN_MONTEITH
+                pm_days.append((index, day_data, pressure, solar_rad))
+                continue
+
+            methods[index] = method.name
+            etos[index] = method.func(
+                min_temp=day_data.min_temp,
+                max_temp=day_data.max_temp,
+                humidity=day_data.humidity,
+                pressure=pressure,
+                wind_speed=day_data.wind_speed,
+                solar_radiation=solar_rad,
+                altitude=alt,
+                latitude=lat,
+                date=day_data.sunrise,
+                radiation_table=radiation_table,
+            )
+
+        if pm_days:
+            pm_etos = self.eto_cache.calculate_batch(
+                min_temps=[d.min_temp for _, d, _, _ in pm_days],
+                max_temps=[d.max_temp for _, d, _, _ in pm_days],
+                humidities=[d.humidity for _, d, _, _ in pm_days],
+                pressures=[pressure for _, _, pressure, _ in pm_days],
+                wind_speeds=[d.wind_speed for _, d, _, _ in pm_days],
+                solar_radiations=[solar_rad for _, _, _, solar_rad in pm_days],
+                dates=[d.sunrise for _, d, _, _ in pm_days],
+                altitude=alt,
+                latitude=lat,
+                radiation_table=radiation_table,
+            )
+            for (index, _, _, _), eto in zip(pm_days, pm_etos):
+                etos[index] = eto
+
+        self.forecast = self.forecast.with_eto(etos, methods)
+        self._eto_basis = self.forecast
+
+    async def _async_apply_hourly_eto(self, solar_rad_data: dict) -> None:
+        """Replace daily ETo with summed hourly FAO-56 ETo where available.
+
+        The hourly forecast is consumed lazily in an executor so the event loop
+        is never blocked. Only days whose daily method is Penman-Monteith are
+        replaced: days that fell back to another method lack inputs the
+        hourly equation needs, and days without enough complete hours keep
+        their daily value.
+        """
+        try:
+            hours = await self.weather_provider.async_get_hourly_forecast()
+        except Exception as err:
+            _LOGGER.warning("Hourly forecast not available, using daily ETo: %s", err)
+            return
+
+        solar_by_month = {
+            month: monthly_solar_radiation(solar_rad_data, month) for month in range(1, 13)
+        }
+        daily_totals = await self.hass.async_add_executor_job(
+            aggregate_hourly_eto,
+            hours,
+            self.hass.config.elevation,
+            self.hass.config.latitude,
+            self.hass.config.longitude,
+            solar_by_month,
+            dt_util.DEFAULT_TIME_ZONE,
+            self._get_radiation_table(),
+        )
+
+        etos = list(self.forecast.column("eto"))
+        methods = list(self.forecast.column("eto_method"))
+        daily_only = []
+        for index, sunrise in enumerate(self.forecast.column("sunrise")):
+            hourly_eto = daily_totals.get(sunrise.date())
+            if methods[index] != METHOD_PENMAN_MONTEITH:
+                continue
+            if hourly_eto is None:
+                daily_only.append(sunrise.date())
+            else:
+                _LOGGER.debug(
+                    "Day %s: hourly ETo=%.2f mm replaces daily ETo=%.2f mm",
+                    sunrise.date(),
+                    hourly_eto,
+                    etos[index],
+                )
+                etos[index] = hourly_eto
+                methods[index] = f"{METHOD_PENMAN_MONTEITH}_hourly"
+        if daily_only:
+            # e.g. beyond the 48 h OWM hourly block
+            _LOGGER.debug(
+                "No complete hourly forecast for %s, keeping daily Penman-Monteith ETo",
+                ", ".join(str(day) for day in daily_only),
+            )
+        self.forecast = self.forecast.with_eto(etos, methods)
+
+    def _event_driven(self) -> bool:
+        """Return True if weather entity changes trigger the refresh."""
+        return bool(
+            self.entry.data.get(CONF_EVENT_DRIVEN, DEFAULT_EVENT_DRIVEN)
+            and self.entry.data.get(CONF_WEATHER_ENTITY)
+        )
+
+    def _normal_update_interval(self) -> timedelta:
+        """Return the polling interval while weather is available."""
+        if self._event_driven():
+            return timedelta(minutes=EVENT_SAFETY_NET_MINUTES)
+        return timedelta(minutes=UPDATE_INTERVAL_MINUTES)
+
+    def _replan_interval_text(self) -> str:
+        """Describe when the schedule is replanned, for notifications."""
+        minutes = int(self._normal_update_interval().total_seconds() // 60)
+        if self._event_driven():
+            return self._txt("replan_event_driven", minutes=minutes)
+        return self._txt("replan_interval", minutes=minutes)
+
+    def _setup_weather_listener(self) -> None:
+        """Register (or re-register) the weather entity state listener."""
+        if self._weather_listener_unsub:
+            self._weather_listener_unsub()
+            self._weather_listener_unsub = None
+        if not self._event_driven():
+            return
+        weather_entity = self.entry.data[CONF_WEATHER_ENTITY]
+        self._weather_listener_unsub = async_track_state_change_event(
+            self.hass, [weather_entity], self._handle_weather_state_change
+        )
+        _LOGGER.debug("Event-driven refresh enabled for %s", weather_entity)
+
+    @callback
+    def _handle_weather_state_change(self, event: Event) -> None:
+        """Schedule a debounced refresh when the weather entity changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None or new_state.state in ("unavailable", "unknown"):
+            return
+        self.hass.async_create_task(self._event_debouncer.async_call())
+
+    def _forecast_unchanged(self, previous_raw: ForecastSeries) -> bool:
+        """Return True if the provider reused the previous, fully computed forecast."""
+        return (
+            self.weather_provider.forecast_unchanged
+            and self._raw_forecast is previous_raw
+            and self._radiation_table is not None
+            and self._radiation_table.matches(
+                self.hass.config.latitude, self.hass.config.elevation
+            )
+        )
+
     async def _async_check_sensor_health(self) -> None:
         """Check soil moisture sensors for availability and battery issues."""
         now = dt_util.now()
@@ -626,17 +1266,24 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             _LOGGER.warning("No forecast data available for scheduling")
             return
 
+        self._remember_forecast_days()
+
         if not self.entry.data.get(CONF_MASTER_ENABLED, DEFAULT_MASTER_ENABLED):
             self.scheduled_run = None
             self.recheck_scheduled = None
             self.schedule_reason = self._txt("master_disabled")
+            self.watering_plan = None
             for zone in self.zones:
                 zone.duration = 0
+                zone.next_run = None
             self.async_set_updated_data(self.data)
             return
         
         _LOGGER.info("Calculating irrigation schedule")
         self.last_calculated = dt_util.now()
+        self._prune_zone_plans()
+        self.diff_stats["zones_evaluated"] = 0
+        self.diff_stats["zones_reused"] = 0
         
         # Get configuration
         sunrise_offset = self.entry.data.get(CONF_SUNRISE_OFFSET, 0)
@@ -645,22 +1292,23 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         high_threshold = self.entry.data.get(CONF_HIGH_THRESHOLD, 15)
         
         # Determine if we can water today or need to schedule for tomorrow
-        total_duration = 0
-        
+        solver_start = time.perf_counter()
+        day_index, durations = await self._solve_schedule_day(cycles, sunrise_offset)
+        self.solver_stats = {
+            "ms": round((time.perf_counter() - solver_start) * 1000, 3),
+            "day_index": day_index,
+            "candidate_days": day_index + 1,
+            "zone_evaluations": len(durations) * (day_index + 1),
+        }
+        _LOGGER.debug(
+            "Schedule solver picked day %d in %.1f ms (%d zone evaluations)",
+            day_index,
+            self.solver_stats["ms"],
+            self.solver_stats["zone_evaluations"],
+        )
         for zone in self.zones:
             if zone.enabled:
-                zone.duration = await self._calculate_zone_duration(zone, 0)
-                total_duration += zone.duration * cycles
-        
-        # Calculate start time
-        day_index = 0
-        sunrise_today = self.forecast[0].sunrise
-        earliest_today = sunrise_today - timedelta(
-            minutes=total_duration + sunrise_offset
-        )
-        
-        if earliest_today < dt_util.now():
-            day_index = 1
+                zone.duration = durations[zone.zone_id]
         
         # Check temperature thresholds
         forecast_day = self.forecast[day_index]
@@ -683,15 +1331,16 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             )
             self._log_skip_event(self.schedule_reason, forecast_day)
             self.recheck_scheduled = None
+            self.watering_plan = None
+            self._update_next_runs(day_index, None)
             return
         
-        # Recalculate durations for the selected day
+        # Sum up the durations the solver computed for the selected day
         total_duration = 0
         moisture_skipped_zones = []
         moisture_reduced_zones = []
         for zone in self.zones:
             if zone.enabled:
-                zone.duration = await self._calculate_zone_duration(zone, day_index)
                 total_duration += zone.duration * cycles
                 _LOGGER.info(
                     "Zone '%s': %.1f minutes (%d cycles of %.1f min)",
@@ -706,6 +1355,10 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                 elif zone.moisture_reduction < 1.0 and zone.duration > 0:
                     moisture_reduced_zones.append(zone)
 
+        # Zones that fit the supply together share the window
+        self.watering_plan = self._plan_runs(cycles)
+        window = self.watering_plan.makespan
+
         # If all zones ended up with 0 duration → nothing to water
         if total_duration == 0:
             self.scheduled_run = None
@@ -718,22 +1371,25 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                 )
             else:
                 self.schedule_reason = self._txt("no_water_needed")
+            self._update_next_runs(day_index, None)
             self._setup_daily_report()
             return
 
         # Calculate start and end times
         sunrise = self.forecast[day_index].sunrise
-        start_time = sunrise - timedelta(minutes=total_duration + sunrise_offset)
-        end_time = start_time + timedelta(minutes=total_duration)
+        start_time = sunrise - timedelta(minutes=window + sunrise_offset)
+        end_time = start_time + timedelta(minutes=window)
         
         self.scheduled_run = start_time
         self.schedule_reason = ""
+        self._update_next_runs(day_index, start_time)
         self._setup_daily_report()  # re-register in case hour changed in options
         
         _LOGGER.info(
-            "Watering scheduled: Start=%s, End=%s, Duration=%.1f min",
+            "Watering scheduled: Start=%s, End=%s, Duration=%.1f min (zone run time %.1f min)",
             start_time.strftime("%Y-%m-%d %H:%M"),
             end_time.strftime("%Y-%m-%d %H:%M"),
+            window,
             total_duration,
         )
         
@@ -748,27 +1404,282 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
 
         self.recheck_scheduled = None
 
+    async def _solve_schedule_day(
+        self, cycles: int, sunrise_offset: float
+    ) -> tuple[int, dict[int, float]]:
+        """Pick the start day and return it with the zone durations for it.
+
+        Candidate days are tried in order (today, then tomorrow) and every
+        zone is evaluated at most once per candidate: today is taken if the
+        whole run still fits before sunrise, otherwise tomorrow, whose
+        results are then used as they are.
+        """
+        now = dt_util.now()
+        sunrises = self.forecast.column("sunrise")
+        last_candidate = min(1, len(self.forecast) - 1)
+        # Soil sensors and observed history are read once per calculation
+        buckets = self._lookahead_buckets()
+        for day_index in range(last_candidate + 1):
+            # Days before the candidate are gone for the look-ahead plan
+            self._plan_lookahead(day_index, buckets)
+            durations = {
+                zone.zone_id: await self._calculate_zone_duration(zone, day_index)
+                for zone in self.zones
+                if zone.enabled
+            }
+            window = self._plan_runs(cycles, durations).makespan
+            earliest = sunrises[day_index] - timedelta(minutes=window + sunrise_offset)
+            if day_index == last_candidate or earliest >= now:
+                break
+        return day_index, durations
+
+    def _lookahead_buckets(self) -> list[ZoneBucket] | None:
+        """Model every adaptive zone as a soil bucket over the forecast.
+
+        Each bucket holds the zone's total available water, drained by crop
+        ET and refilled by forecast rain. Days the zone may not water (its
+        calendar, or forecast rain at its rain threshold) are not allowed.
+        Returns None if the look-ahead planner is disabled.
+        """
+        if not self.entry.data.get(CONF_LOOKAHEAD_PLANNER, DEFAULT_LOOKAHEAD_PLANNER):
+            return None
+        balance = self.water_balance()
+        eto = self.forecast.column("eto")
+        rain = self.forecast.column("rain")
+        buckets = []
+        for zone in self.zones:
+            if not zone.enabled or not zone.adaptive:
+                continue
+            factor = zone.crop_coef * zone.plant_density * zone.exposure_factor
+            mad_range = VEGETATION_TYPES.get(zone.vegetation_type, VEGETATION_TYPES["lawn"])["mad_range"]
+            allowed = [
+                zone.calendar.allows(day)
+                and not (zone.rain_factoring and rain[index] >= zone.rain_threshold)
+                for index, day in enumerate(balance.dates)
+            ]
+            buckets.append(
+                ZoneBucket(
+                    zone.zone_id,
+                    float(zone.water_capacity),
+                    mad_range[0] / 100,
+                    self._zone_depletion(zone, mad_range[0] / 100),
+                    [value * factor for value in eto],
+                    rain if zone.rain_factoring else [0.0] * len(rain),
+                    allowed,
+                )
+            )
+        return buckets
+
+    def _plan_lookahead(self, first_day: int, buckets: list[ZoneBucket] | None) -> None:
+        """Plan the watering days of all adaptive zones over the forecast.
+
+        The planner picks the allowed days from ``first_day`` on that keep
+        each bucket's depletion under the MAD limit with the least water and
+        valve starts.
+        """
+        self.lookahead_plans = {}
+        self.lookahead_stats = {"enabled": buckets is not None}
+        if buckets is None:
+            return
+        started = time.perf_counter()
+        self.lookahead_plans = plan_zones(
+            bucket._replace(
+                allowed=[index >= first_day and ok for index, ok in enumerate(bucket.allowed)]
+            )
+            for bucket in buckets
+        )
+        self.lookahead_stats["ms"] = round((time.perf_counter() - started) * 1000, 3)
+        self.lookahead_stats["zones"] = len(buckets)
+        _LOGGER.debug(
+            "Look-ahead planned %d zones in %.1f ms", len(buckets), self.lookahead_stats["ms"]
+        )
+
+    def _zone_depletion(self, zone: ZoneData, mad: float) -> float:
+        """Estimate the current soil-water depletion of a zone in mm.
+
+        A soil moisture sensor gives it directly (field capacity at the
+        target maximum). Otherwise the zone's persisted bucket is carried
+        forward from its last known state. Without one, the bucket starts
+        from the observed weather since the last run, or half way to the
+        MAD limit.
+        """
+        capacity = float(zone.water_capacity)
+        if zone.soil_moisture_entity:
+            current = self.feedback_collector.read_soil_moisture(zone.soil_moisture_entity)
+            if current is not None:
+                missing = (zone.target_moisture_max - current) / SOIL_AWC_PERCENT
+                return capacity * min(1.0, max(0.0, missing))
+        depletion = self._advance_bucket(zone, capacity)
+        if depletion is not None:
+            return depletion
+        depletion = capacity * mad / 2
+        if zone.last_run is not None:
+            observed = self.observed_history.depletion(
+                zone.last_run.date() + timedelta(days=1),
+                dt_util.now().date() - timedelta(days=1),
+                zone.crop_coef * zone.plant_density * zone.exposure_factor,
+                capacity,
+            )
+            if observed is not None:
+                depletion = observed
+        # Start the bucket here; later refreshes carry it forward
+        zone.bucket_depletion = depletion
+        zone.bucket_date = dt_util.now().date()
+        return depletion
+
+    def _advance_bucket(self, zone: ZoneData, capacity: float) -> float | None:
+        """Carry the zone's soil bucket forward to the start of today.
+
+        Every elapsed day drains the crop ET and adds the (factored) rain,
+        from observed weather where available, else from the last forecast
+        for that day. Returns None if there is no state or a day has no data.
+        """
+        if zone.bucket_date is None or zone.bucket_depletion is None:
+            return None
+        today = dt_util.now().date()
+        factor = zone.crop_coef * zone.plant_density * zone.exposure_factor
+        depletion = zone.bucket_depletion
+        day = zone.bucket_date
+        while day < today:
+            forecast = self._forecast_days.get(day.isoformat())
+            observed = self.observed_history.get(day) or {}
+            eto = observed.get("eto")
+            rain = observed.get("rain")
+            if forecast is not None:
+                eto = forecast[0] if eto is None else eto
+                rain = forecast[1] if rain is None else rain
+            if eto is None:
+                _LOGGER.debug("Zone '%s': no weather for %s, soil bucket state lost", zone.name, day)
+                zone.bucket_depletion = zone.bucket_date = None
+                return None
+            if not zone.rain_factoring:
+                rain = 0.0
+            depletion = min(capacity, max(0.0, depletion + eto * factor - (rain or 0.0)))
+            day += timedelta(days=1)
+        zone.bucket_depletion = depletion
+        zone.bucket_date = today
+        return depletion
+
+    def _remember_forecast_days(self) -> None:
+        """Keep the latest forecast ETo and rain per day for the soil buckets."""
+        for day, eto, rain in zip(
+            self.forecast.dates(), self.forecast.column("eto"), self.forecast.column("rain")
+        ):
+            self._forecast_days[day.isoformat()] = [round(eto, 3), round(rain, 2)]
+        oldest = (dt_util.now().date() - timedelta(days=BUCKET_DAYS_KEPT)).isoformat()
+        for key in [key for key in self._forecast_days if key < oldest]:
+            del self._forecast_days[key]
+
+    @property
+    def supply_limits(self) -> SupplyLimits:
+        """Return the configured supply capacity and valve limit."""
+        return SupplyLimits(
+            self.entry.data.get(CONF_SUPPLY_CAPACITY, DEFAULT_SUPPLY_CAPACITY),
+            self.entry.data.get(CONF_MAX_PARALLEL_ZONES, DEFAULT_MAX_PARALLEL_ZONES),
+        )
+
+    def _zone_runs(self, durations: dict[int, float] | None = None) -> list[tuple[int, float, float, float]]:
+        """Return (zone_id, minutes per cycle, flow, soak) of the enabled zones.
+
+        ``durations`` overrides the current zone durations.
+        """
+        return [
+            (
+                zone.zone_id,
+                durations.get(zone.zone_id, 0) if durations is not None else zone.duration,
+                zone.total_flow,
+                zone.soak_minutes,
+            )
+            for zone in self.zones
+            if zone.enabled
+        ]
+
+    def _plan_runs(self, cycles: int, durations: dict[int, float] | None = None) -> WateringPlan:
+        """Return the timeline of all cycles under the supply and soak limits."""
+        return plan_runs(self._zone_runs(durations), self.supply_limits, cycles)
+
+    def _update_next_runs(self, day_index: int, start_time: datetime | None) -> None:
+        """Set the next run of every zone from the schedule and its calendar.
+
+        Zones in the scheduled run get their start within the first cycle
+        of the packed plan; all others get the start of the next day their
+        calendar allows after the selected day.
+        """
+        after = self.water_balance().dates[day_index] + timedelta(days=1)
+        for zone in self.zones:
+            offset = self.watering_plan.start_of(zone.zone_id) if self.watering_plan else None
+            if not zone.enabled:
+                zone.next_run = None
+            elif start_time is not None and offset is not None:
+                zone.next_run = start_time + timedelta(minutes=offset)
+            else:
+                next_day = zone.calendar.next_allowed(after)
+                lookahead = self.lookahead_plans.get(zone.zone_id)
+                if lookahead is not None:
+                    # Planned day, or the first allowed day after the forecast
+                    dates = self.water_balance().dates
+                    planned = lookahead.next_day(day_index)
+                    if planned is not None:
+                        next_day = dates[planned]
+                    else:
+                        next_day = zone.calendar.next_allowed(dates[-1] + timedelta(days=1))
+                zone.next_run = dt_util.start_of_local_day(next_day) if next_day else None
+
+    def water_balance(self) -> WaterBalanceIndex:
+        """Return the water-balance index, rebuilt once per forecast."""
+        if self._balance.forecast is not self.forecast:
+            self._balance = WaterBalanceIndex(self.forecast)
+        return self._balance
+
+    def _prune_zone_plans(self) -> None:
+        """Drop zone results whose watering window touches a changed day.
+
+        The current forecast is diffed against the one the results were
+        computed from; windows that reach past the forecast or into the past
+        are dropped as well.
+        """
+        if self.forecast is self._planned_forecast:
+            return
+        changed = self.forecast.changed_days(self._planned_forecast, _ZONE_INPUT_FIELDS)
+        dates = self.forecast.dates()
+        self.diff_stats["days_changed"] = len(changed)
+        valid = set(dates) - {dates[index] for index in changed}
+        for plans in self._zone_plans.values():
+            for start in [start for start, plan in plans.items() if not valid.issuperset(plan[0][0])]:
+                del plans[start]
+        self._planned_forecast = self.forecast
+        if changed:
+            _LOGGER.debug(
+                "Forecast changed on %s",
+                ", ".join(f"{dates[index]} ({'/'.join(sorted(fields))})" for index, fields in changed.items()),
+            )
+
     async def _calculate_zone_duration(
         self, zone: ZoneData, day_index: int
     ) -> float:
-        """Calculate watering duration for a zone in minutes."""
+        """Calculate watering duration for a zone in minutes.
+
+        Zones without a soil moisture sensor reuse their previous result for
+        the same start day while no day in their window has changed.
+        """
         if not zone.enabled:
             zone.skip_reason = self._txt("zone_disabled")
             return 0
         
-        # Check if this is a valid watering day
-        forecast_day = self.forecast[day_index]
-        weekday = WEEKDAYS[forecast_day.sunrise.weekday()]
-        month = forecast_day.sunrise.month
-        
-        if weekday not in zone.weekdays:
-            _LOGGER.debug("Zone '%s': Not scheduled for this day", zone.name)
-            zone.skip_reason = self._txt("no_watering_day", weekday=weekday)
-            return 0
+        # Check if this is a valid watering day (one bit test)
+        balance = self.water_balance()
+        day = balance.dates[day_index]
         
-        if month not in zone.months:
-            _LOGGER.debug("Zone '%s': Not scheduled for this month", zone.name)
-            zone.skip_reason = self._txt("no_watering_month")
+        if not zone.calendar.allows(day):
+            if not zone.calendar.allows_weekday(day):
+                _LOGGER.debug("Zone '%s': Not scheduled for this day", zone.name)
+                zone.skip_reason = self._txt("no_watering_day", weekday=balance.weekdays[day_index])
+            elif not zone.calendar.allows_month(day):
+                _LOGGER.debug("Zone '%s': Not scheduled for this month", zone.name)
+                zone.skip_reason = self._txt("no_watering_month")
+            else:
+                _LOGGER.debug("Zone '%s': Watering restricted on %s", zone.name, day)
+                zone.skip_reason = self._txt("no_watering_restricted")
             return 0
         
         if not zone.adaptive:
@@ -778,28 +1689,79 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             return zone.max_duration / 2  # Use half of max as default
         
         # Calculate days until next watering
-        days_until_next = 1
-        for future_day in range(1, 8):
-            if day_index + future_day >= len(self.forecast):
-                break
-            future_forecast = self.forecast[day_index + future_day]
-            future_weekday = WEEKDAYS[future_forecast.sunrise.weekday()]
-            if future_weekday in zone.weekdays:
-                days_until_next = future_day
-                break
-
+        days_until_next = balance.days_until_next(zone.calendar, day_index)
+        lookahead = self.lookahead_plans.get(zone.zone_id)
+        refill = lookahead.refill(day_index) if lookahead is not None else None
+        if lookahead is not None:
+            if refill is None:
+                # Watering later (or not at all) within the forecast is cheaper
+                if lookahead.days:
+                    planned = balance.dates[lookahead.days[0]]
+                    zone.skip_reason = self._txt(
+                        "lookahead_deferred",
+                        date=f"{self._weekday_name(planned.weekday())} {planned.strftime('%d.%m.')}",
+                    )
+                else:
+                    zone.skip_reason = self._txt("lookahead_not_needed", days=len(balance.dates))
+                _LOGGER.debug("Zone '%s': deferred by look-ahead plan %s", zone.name, lookahead.days)
+                zone.duration_uncapped = 0
+                zone.water_needed = 0
+                return 0
+            next_day = lookahead.next_day(day_index)
+            if next_day is not None:
+                days_until_next = next_day - day_index
         zone.days_until_next = days_until_next
-        
-        # Calculate total ETo and rain until next watering
-        eto_total = 0
-        rain_total = 0
-        
-        for day_offset in range(days_until_next):
-            if day_index + day_offset >= len(self.forecast):
-                break
-            day_forecast = self.forecast[day_index + day_offset]
-            eto_total += day_forecast.eto
-            rain_total += day_forecast.rain
+        window_end = day_index + days_until_next
+
+        plan_key = None
+        # A window reaching past the forecast is truncated; never reuse it
+        if (
+            not zone.soil_moisture_entity
+            and self.forecast is self._planned_forecast
+            and window_end <= len(balance.dates)
+        ):
+            dates = balance.dates
+            # Rain carryover depends on the last run, today and observed history
+            plan_key = (
+                dates[day_index:window_end],
+                zone.last_run,
+                dt_util.now().date(),
+                self.observed_history.revision,
+                refill,
+            )
+            plan = self._zone_plans.get(zone.zone_id, {}).get(dates[day_index])
+            if plan is not None and plan[0] == plan_key:
+                for attr, value in zip(_ZONE_PLAN_ATTRS, plan[2]):
+                    setattr(zone, attr, value)
+                self.diff_stats["zones_reused"] += 1
+                _LOGGER.debug("Zone '%s': window unchanged, keeping %.1f min", zone.name, plan[1])
+                return plan[1]
+
+        self.diff_stats["zones_evaluated"] += 1
+        duration = self._calculate_zone_water(zone, day_index, window_end, refill)
+        if plan_key is not None:
+            self._zone_plans.setdefault(zone.zone_id, {})[plan_key[0][0]] = (
+                plan_key,
+                duration,
+                tuple(getattr(zone, attr) for attr in _ZONE_PLAN_ATTRS),
+            )
+        return duration
+
+    def _calculate_zone_water(
+        self, zone: ZoneData, day_index: int, window_end: int, refill: float | None = None
+    ) -> float:
+        """Calculate the per-cycle duration from the water balance of the window.
+
+        ``refill`` is the depletion in mm the look-ahead plan repays on this
+        day; it already accounts for crop factors, rain and soil moisture and
+        replaces the forward-looking window balance.
+        """
+        days_until_next = window_end - day_index
+
+        # Calculate total ETo and rain until next watering (O(1) prefix sums)
+        balance = self.water_balance()
+        eto_total = balance.eto(day_index, window_end)
+        rain_total = balance.rain(day_index, window_end)
         
         zone.eto_total = eto_total
         zone.rain_total = rain_total
@@ -807,24 +1769,47 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         # Calculate water needed
         water_needed = eto_total
         
+        zone.window_rain = {}
+        zone.rain_carryover = 0.0
         if zone.rain_factoring:
-            water_needed -= rain_total
+            # Remember the forecast rain this balance relies on; once the zone
+            # runs, only observed rain above it counts as carryover
+            rain = self.forecast.rain_slice(day_index, window_end)
+            zone.window_rain = {
+                day.isoformat(): value
+                for day, value in zip(balance.dates[day_index:window_end], rain)
+            }
+            # Extra rain since the last run not yet used up by the crop
+            if zone.last_run is not None and refill is None:
+                zone.rain_carryover = self.observed_history.rain_surplus(
+                    zone.last_run.date() + timedelta(days=1),
+                    dt_util.now().date() - timedelta(days=1),
+                    zone.planned_rain,
+                    zone.crop_coef * zone.plant_density * zone.exposure_factor,
+                    float(zone.water_capacity),
+                )
+            water_needed -= rain_total + zone.rain_carryover
             if water_needed < 0:
                 water_needed = 0
             
             # Check rain threshold for today
-            if self.forecast[day_index].rain >= zone.rain_threshold:
+            rain_today = self.forecast.rain_slice(day_index, day_index + 1)[0]
+            if rain_today >= zone.rain_threshold:
                 _LOGGER.debug(
                     "Zone '%s': Rain threshold exceeded (%.1f mm), skipping",
                     zone.name,
-                    self.forecast[day_index].rain,
+                    rain_today,
                 )
                 zone.skip_reason = self._txt(
                     "rain_threshold_exceeded",
-                    rain=self.forecast[day_index].rain,
+                    rain=rain_today,
                     threshold=zone.rain_threshold,
                 )
                 return 0
+
+        if refill is not None:
+            # The look-ahead plan repays the depletion its bucket tracked
+            water_needed = refill
         
         # ── Soil moisture check: skip or reduce if soil is already wet ──
         moisture_reduction = 1.0  # 1.0 = no reduction, 0.0 = full skip
@@ -850,7 +1835,7 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                     zone.water_needed = 0
                     zone.duration_uncapped = 0
                     return 0
-                elif current > zone.target_moisture_min:
+                elif current > zone.target_moisture_min and refill is None:
                     # Soil is in the target range → proportionally reduce
                     moisture_range = zone.target_moisture_max - zone.target_moisture_min
                     if moisture_range > 0:
@@ -862,14 +1847,10 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                         zone.name, current, moisture_reduction * 100,
                     )
 
-        # Apply crop and zone factors
-        water_needed = (
-            water_needed
-            * zone.crop_coef
-            * zone.plant_density
-            * zone.exposure_factor
-            * zone.area
-        )
+        # Apply crop and zone factors (the look-ahead refill is crop water already)
+        if refill is None:
+            water_needed = water_needed * zone.crop_coef * zone.plant_density * zone.exposure_factor
+        water_needed = water_needed * zone.area
 
         # Apply user tweak factor (e.g. 110% for slightly more water)
         water_needed = water_needed * max(10, float(zone.adjustment_percent)) / 100.0
@@ -975,17 +1956,17 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         """Run the complete watering cycle for all zones."""
         cycles = int(self.entry.data.get(CONF_CYCLES, 2))
         self._watering_started_at = dt_util.now()
-        _LOGGER.info("Starting watering cycle (1/%d)", cycles)
+        _LOGGER.info("Starting watering cycle (%d cycles)", cycles)
         
+        watered: dict[int, ZoneData] = {}
+        self.rain_gate.arm()
         try:
-            for cycle in range(cycles):
-                if cycle > 0:
-                    _LOGGER.info("Starting watering cycle (%d/%d)", cycle + 1, cycles)
-                
-                for zone in self.zones:
-                    if zone.enabled and zone.duration > 0:
-                        await self._water_zone(zone)
-            
+            await self._async_water_zones(watered, cycles)
+
+            if self.rain_gate.tripped:
+                await self._async_finish_rain_stopped_cycle(watered)
+                return
+
             _LOGGER.info("Watering cycle completed")
             finished_at = dt_util.now()
 
@@ -1001,7 +1982,7 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             else:
                 next_calc = self._txt(
                     "no_extra_recalc_before_run",
-                    minutes=UPDATE_INTERVAL_MINUTES,
+                    interval=self._replan_interval_text(),
                 )
 
             message = (
@@ -1016,10 +1997,9 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                 self._txt("title_watering_done"), message, priority=0
             )
 
-            # Update last run times
-            for zone in self.zones:
-                if zone.enabled and zone.duration > 0:
-                    zone.last_run = dt_util.now()
+            # Update last run times of the zones whose valve opened
+            for zone in watered.values():
+                self._mark_zone_run(zone, dt_util.now())
             
             await self._async_save_storage()
             
@@ -1034,9 +2014,109 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                 self._txt("watering_error", error=err),
                 priority=0
             )
+        finally:
+            self.rain_gate.disarm()
 
-    async def _water_zone(self, zone: ZoneData):
-        """Water a single zone."""
+    @staticmethod
+    def _mark_zone_run(zone: ZoneData, when: datetime) -> None:
+        """Record a scheduled run: the water balance and soil bucket restart."""
+        zone.last_run = when
+        zone.planned_rain = zone.window_rain
+        # The run refills the bucket before the day's ET drains it
+        zone.bucket_depletion = 0.0
+        zone.bucket_date = when.date()
+
+    async def _async_finish_rain_stopped_cycle(self, watered: dict[int, ZoneData]) -> None:
+        """Wrap up a cycle that the rain gate ended early."""
+        gate = self.rain_gate
+        if gate.reason == REASON_FORECAST:
+            reason = self._txt(
+                "rain_gate_forecast", rain=gate.detail or 0.0, hours=gate.lookahead_hours
+            )
+        else:
+            reason = self._txt("rain_gate_sensor", entity=gate.rain_entity)
+        _LOGGER.info("Watering cycle ended early: %s", reason)
+
+        now = dt_util.now()
+        lines = []
+        for zone in self.zones:
+            if not zone.enabled or zone.duration <= 0:
+                continue
+            if zone.zone_id in watered:
+                # Zones that got water count as run for the next water balance
+                self._mark_zone_run(zone, now)
+                lines.append(f"\u2705 {zone.name}")
+            else:
+                zone.skip_reason = self._txt("rain_gate_skipped")
+                lines.append(f"\u23ed {zone.name}: {zone.skip_reason}")
+
+        actual_min = (now - self._watering_started_at).total_seconds() / 60
+        message = (
+            f"{reason}\n\n"
+            f"{self._txt('start')}: {self._fmt_dt(self._watering_started_at)}\n"
+            f"{self._txt('end')}:  {self._fmt_dt(now)}\n"
+            f"{self._txt('total_duration')}: {self._fmt_duration(actual_min)} min.\n\n"
+            + "\n".join(lines)
+        )
+        await self._send_pushover_notification(
+            self._txt("title_rain_stopped"), message, priority=0
+        )
+
+        await self._async_save_storage()
+        self.scheduled_run = None
+        await self._async_calculate_schedule()
+
+    async def _async_water_zones(self, watered: dict[int, ZoneData], cycles: int) -> None:
+        """Water all cycles of the scheduled zones, interleaved like the plan.
+
+        The run queue of the plan is driven in real time: a zone cycle
+        starts once its soak time has passed and the supply allows it next
+        to the running zones, otherwise the queue waits for the next zone
+        to finish or to be ready.
+        """
+        queue = RunQueue(self._zone_runs(), self.supply_limits, cycles)
+        by_id = {zone.zone_id: zone for zone in self.zones}
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        running: dict[asyncio.Task, int] = {}
+        try:
+            while not queue.done:
+                # Rain sensor or hourly forecast: skip the remaining runs
+                if await self.rain_gate.async_check_forecast():
+                    queue.cancel()
+                now = (loop.time() - started) / 60
+                for zone_id, cycle in queue.pop_startable(now):
+                    zone = by_id[zone_id]
+                    if cycles > 1:
+                        _LOGGER.info("Zone '%s': cycle %d/%d", zone.name, cycle, cycles)
+                    running[asyncio.create_task(self._water_zone(zone, watered))] = zone_id
+                ready = queue.next_ready(now)
+                timeout = (ready - now) * 60 if ready is not None else None
+                if running:
+                    done, _ = await asyncio.wait(
+                        running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        queue.finish(running.pop(task), (loop.time() - started) / 60)
+                        task.result()
+                elif timeout is not None:
+                    # Every zone is soaking
+                    if not await self.rain_gate.async_wait(timeout):
+                        queue.cancel()
+                else:
+                    break
+        finally:
+            # Stopping the run closes every valve that is still open
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def _water_zone(self, zone: ZoneData, watered: dict[int, ZoneData] | None = None):
+        """Water a single zone.
+
+        Once the valve is open, the zone is added to ``watered``.
+        """
         _LOGGER.info("Starting zone '%s' for %.1f minutes", zone.name, zone.duration)
 
         # Safety net: re-check soil moisture before actually opening the valve
@@ -1092,13 +2172,17 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                 return
         else:
             _LOGGER.warning("Zone '%s' has no switch entity configured", zone.name)
-        
+        if watered is not None:
+            watered[zone.zone_id] = zone
+
         # Notify entities to update
         self.async_set_updated_data(self.data)
         
-        # Wait for duration
+        # Wait for duration; the rain gate wakes up early on rain onset
         try:
-            await asyncio.sleep(zone_planned_duration * 60)
+            if not await self.rain_gate.async_wait(zone_planned_duration * 60):
+                _LOGGER.info("Zone '%s': stopped early, rain detected", zone.name)
+                zone.skip_reason = self._txt("rain_gate_stopped")
         finally:
             ts_end = dt_util.now()
             # Log history entry
@@ -1434,9 +2518,12 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         weather = self._format_weather_footer()
 
         if self.scheduled_run:
-            total_min = sum(
-                z.duration * cycles for z in self.zones if z.enabled and z.duration > 0
-            )
+            if self.watering_plan is not None:
+                total_min = self.watering_plan.makespan
+            else:
+                total_min = sum(
+                    z.duration * cycles for z in self.zones if z.enabled and z.duration > 0
+                )
             end_time = self.scheduled_run + timedelta(minutes=total_min)
             zone_lines = self._format_zone_lines("\U0001f331")
 
@@ -1448,7 +2535,7 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             else:
                 recheck_str = self._txt(
                     "no_extra_recalc_before_start",
-                    minutes=UPDATE_INTERVAL_MINUTES,
+                    interval=self._replan_interval_text(),
                 )
 
             message = (
@@ -1469,12 +2556,12 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                 next_calc = self._txt(
                     "next_extra_recalc",
                     when=self._fmt_dt(self.recheck_scheduled),
-                    minutes=UPDATE_INTERVAL_MINUTES,
+                    interval=self._replan_interval_text(),
                 )
             else:
                 next_calc = self._txt(
                     "no_extra_recalc_today",
-                    minutes=UPDATE_INTERVAL_MINUTES,
+                    interval=self._replan_interval_text(),
                 )
 
             message = (
@@ -1580,34 +2667,48 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         solar_rad = 8.0  # Peak summer solar radiation kWh/m²/day
 
         # Build 8 fake days: hot, dry summer
-        fake_forecast: list[WeatherData] = []
         now = dt_util.now()
-        for i in range(8):
-            day = WeatherData()
-            day.sunrise = now.replace(hour=6, minute=0, second=0, microsecond=0) + timedelta(days=i)
-            day.min_temp = 18.0
-            day.max_temp = 35.0
-            day.humidity = 30.0
-            day.pressure = 1013.0
-            day.wind_speed = 4.0
-            day.rain = 0.0
-            day.condition = "sunny"
-            day.summary = "Sunny"
-            day.eto = calculate_eto(
-                min_temp=day.min_temp,
-                max_temp=day.max_temp,
-                humidity=day.humidity,
-                pressure=day.pressure,
-                wind_speed=day.wind_speed,
-                solar_radiation=solar_rad,
-                altitude=alt,
-                latitude=lat,
-                date=day.sunrise,
+        first_sunrise = now.replace(hour=6, minute=0, second=0, microsecond=0)
+        fake_forecast = ForecastSeries(
+            WeatherData(
+                sunrise=first_sunrise + timedelta(days=i),
+                min_temp=18.0,
+                max_temp=35.0,
+                humidity=30.0,
+                pressure=1013.0,
+                wind_speed=4.0,
+                rain=0.0,
+                condition="sunny",
+                summary="Sunny",
             )
-            fake_forecast.append(day)
+            for i in range(8)
+        )
+
+        etos = calculate_eto_batch(
+            min_temps=fake_forecast.column("min_temp"),
+            max_temps=fake_forecast.column("max_temp"),
+            humidities=fake_forecast.column("humidity"),
+            pressures=fake_forecast.column("pressure"),
+            wind_speeds=fake_forecast.column("wind_speed"),
+            solar_radiations=[solar_rad] * len(fake_forecast),
+            dates=fake_forecast.column("sunrise"),
+            altitude=alt,
+            latitude=lat,
+            radiation_table=self._get_radiation_table(),
+        )
+        fake_forecast = fake_forecast.with_eto(
+            etos, [METHOD_PENMAN_MONTEITH] * len(fake_forecast)
+        )
 
-        # Temporarily replace forecast for duration calculations
+        # Temporarily replace forecast for duration calculations; the zone
+        # results feed the next real run (planned rain), so keep them as well
         real_forecast = self.forecast
+        real_lookahead = (self.lookahead_plans, self.lookahead_stats)
+        real_diff_stats = dict(self.diff_stats)
+        real_zone_state = {
+            zone.zone_id: {attr: getattr(zone, attr) for attr in _ZONE_RUNTIME_ATTRS}
+            for zone in self.zones
+        }
         self.forecast = fake_forecast
 
         cycles = int(self.entry.data.get(CONF_CYCLES, 2))
@@ -1615,7 +2716,9 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
 
         zone_results = []
         total_duration = 0.0
+        durations: dict[int, float] = {}
         try:
+            self._plan_lookahead(0, self._lookahead_buckets())
             for zone in self.zones:
                 if zone.enabled:
                     duration = await self._calculate_zone_duration(zone, 0)
@@ -1626,6 +2729,7 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                         "skip_reason": getattr(zone, "skip_reason", ""),
                     })
                     total_duration += duration * cycles
+                    durations[zone.zone_id] = duration
                 else:
                     zone_results.append({
                         "zone_id": zone.zone_id,
@@ -1635,15 +2739,21 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                     })
         finally:
             self.forecast = real_forecast
+            self.lookahead_plans, self.lookahead_stats = real_lookahead
+            self.diff_stats = real_diff_stats
+            for zone in self.zones:
+                for attr, value in real_zone_state[zone.zone_id].items():
+                    setattr(zone, attr, value)
 
         scheduled_would_be = None
         schedule_reason = ""
+        window = self._plan_runs(cycles, durations).makespan
         if total_duration > 0:
             sunrise = fake_forecast[0].sunrise
-            start_time = sunrise - timedelta(minutes=total_duration + sunrise_offset)
+            start_time = sunrise - timedelta(minutes=window + sunrise_offset)
             if start_time < now:
                 sunrise = fake_forecast[1].sunrise
-                start_time = sunrise - timedelta(minutes=total_duration + sunrise_offset)
+                start_time = sunrise - timedelta(minutes=window + sunrise_offset)
             scheduled_would_be = start_time.isoformat()
         else:
             schedule_reason = self._txt("no_water_needed")
@@ -1651,6 +2761,7 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         return {
             "zones": zone_results,
             "total_duration_minutes": round(total_duration, 1),
+            "window_minutes": round(window, 1),
             "cycles": cycles,
             "scheduled_would_be": scheduled_would_be,
             "schedule_reason": schedule_reason,
@@ -1677,8 +2788,13 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                 zone = next(
                     (z for z in self.zones if z.zone_id == zone_data["zone_id"]), None
                 )
+                if zone and zone_data.get("bucket"):
+                    depletion, day = zone_data["bucket"]
+                    zone.bucket_depletion = depletion
+                    zone.bucket_date = date.fromisoformat(day)
                 if zone and zone_data.get("last_run"):
                     zone.last_run = dt_util.parse_datetime(zone_data["last_run"])
+                    zone.planned_rain = zone_data.get("planned_rain") or {}
                     _LOGGER.debug(
                         "Restored last run for zone '%s': %s",
                         zone.name,
@@ -1686,6 +2802,14 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                     )
             # Restore history
             self.history = data.get("history", [])
+            self._forecast_days = data.get("forecast_days") or {}
+            # Restore the last good forecast
+            snapshot = data.get("forecast_snapshot") or {}
+            if snapshot.get("saved"):
+                self.snapshot_time = dt_util.parse_datetime(snapshot["saved"])
+                self._snapshot_forecast = ForecastSeries(
+                    WeatherData.from_dict(day) for day in snapshot.get("days", [])
+                )
 
     async def _async_save_storage(self):
         """Save data to storage."""
@@ -1697,11 +2821,23 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
                 {
                     "zone_id": zone.zone_id,
                     "last_run": zone.last_run.isoformat() if zone.last_run else None,
+                    "planned_rain": zone.planned_rain,
+                    "bucket": (
+                        [round(zone.bucket_depletion, 2), zone.bucket_date.isoformat()]
+                        if zone.bucket_date is not None
+                        else None
+                    ),
                 }
                 for zone in self.zones
             ],
             "history": self.history[-180:],
+            "forecast_days": self._forecast_days,
         }
+        if self.snapshot_time is not None:
+            data["forecast_snapshot"] = {
+                "saved": self.snapshot_time.isoformat(),
+                "days": [day.as_dict() for day in self._snapshot_forecast],
+            }
         
         await self._storage.async_save(data)
 
@@ -1755,26 +2891,25 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
             payload["device"] = device
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(api_url, json=payload) as resp:
-                    if resp.status == 200:
-                        result = await resp.json()
-                        if result.get("status") == 1:
-                            _LOGGER.debug("Pushover notification sent: %s", title)
-                            return
-                        else:
-                            errors = result.get("errors", ["Unknown error"])
-                            msg = f"Pushover API error: {', '.join(errors)}"
-                            if test_mode:
-                                raise RuntimeError(msg)
-                            _LOGGER.error(msg)
-                            return
+            async with async_get_http_client(self.hass).post(api_url, json=payload) as resp:
+                if resp.status == 200:
+                    result = await resp.json()
+                    if result.get("status") == 1:
+                        _LOGGER.debug("Pushover notification sent: %s", title)
+                        return
                     else:
-                        msg = f"Pushover HTTP {resp.status}: {await resp.text()}"
+                        errors = result.get("errors", ["Unknown error"])
+                        msg = f"Pushover API error: {', '.join(errors)}"
                         if test_mode:
                             raise RuntimeError(msg)
                         _LOGGER.error(msg)
                         return
+                else:
+                    msg = f"Pushover HTTP {resp.status}: {await resp.text()}"
+                    if test_mode:
+                        raise RuntimeError(msg)
+                    _LOGGER.error(msg)
+                    return
 
         except aiohttp.ClientError as err:
             msg = f"Pushover connection error: {err}"
@@ -1792,6 +2927,16 @@ class SmartIrrigationCoordinator(DataUpdateCoordinator):
         if self._schedule_checker_unsub:
             self._schedule_checker_unsub()
 
+        if self._weather_listener_unsub:
+            self._weather_listener_unsub()
+            self._weather_listener_unsub = None
+        self._event_debouncer.async_cancel()
+        self.station.async_stop()
+        self.rain_gate.disarm()
+        if self._history_import_unsub:
+            self._history_import_unsub()
+            self._history_import_unsub = None
+
         if self._daily_report_unsub:
             self._daily_report_unsub()
 
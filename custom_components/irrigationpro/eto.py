@@ -1,8 +1,119 @@
-"""ETo (Evapotranspiration) calculation using FAO Penman-Monteith method."""
+"""ETo (Evapotranspiration) calculation.
+
+FAO-56 Penman-Monteith is the reference method. Priestley-Taylor and
+Hargreaves-Samani are registered as fallbacks for forecasts that lack
+humidity/wind (and, for Hargreaves-Samani, configured solar radiation).
+"""
 from __future__ import annotations
 
+import logging
 import math
-from datetime import datetime
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date as date_cls, datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .weather_provider import HourlyWeather
+
+_LOGGER = logging.getLogger(__name__)
+
+# Day-of-year entries in a radiation table (covers leap years)
+DAYS_IN_TABLE = 366
+
+# Hourly hours required before an hourly daily total replaces the daily value
+HOURLY_MIN_HOURS = 20
+
+# Default number of memoized daily ETo results
+ETO_CACHE_SIZE = 256
+
+# Rs/Rso assumed at night for the hourly longwave term (FAO-56, eq. 39 note)
+NIGHT_RS_RSO = 0.8
+
+HAS_NUMPY = False
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    _LOGGER.debug("numpy not installed – batch ETo uses the scalar fallback")
+
+
+def _day_of_year(date: datetime) -> int:
+    """Return the 1-based day of year for a (possibly tz-aware) date."""
+    return date.timetuple().tm_yday
+
+
+def _astronomical_radiation(
+    latitude: float, altitude: float, doy: int
+) -> tuple[float, float]:
+    """Return extraterrestrial and clear sky radiation (MJ/m²/day) for a day."""
+    # Inverse relative distance Earth-Sun
+    d_r = 1 + 0.033 * math.cos(2 * math.pi * doy / 365)
+    
+    # Solar declination (rad)
+    s_d = 0.409 * math.sin((2 * math.pi * doy / 365) - 1.39)
+    
+    # Latitude in radians
+    l_rad = latitude * math.pi / 180
+    
+    # Sunset hour angle (rad)
+    # Clamp argument to [-1, 1] to avoid math domain errors at extreme latitudes
+    sunset_arg = -(math.tan(s_d) * math.tan(l_rad))
+    sunset_arg = max(-1.0, min(1.0, sunset_arg))
+    sunset_ha = math.acos(sunset_arg)
+    
+    # Extraterrestrial radiation (MJ/m²/day)
+    r_a = (
+        (1440 / math.pi)
+        * 0.082
+        * d_r
+        * (
+            (sunset_ha * math.sin(l_rad) * math.sin(s_d))
+            + (math.cos(l_rad) * math.cos(s_d) * math.sin(sunset_ha))
+        )
+    )
+    
+    # Clear sky radiation (MJ/m²/day)
+    r_so = r_a * (0.75 + (2 * altitude / 100000))
+    return r_a, r_so
+
+
+class RadiationTable:
+    """Day-of-year table of extraterrestrial and clear sky radiation.
+
+    Both values only depend on latitude, altitude and day of year, so they
+    are computed once for all 366 days and then looked up per ETo call.
+    """
+
+    __slots__ = ("latitude", "altitude", "r_a", "r_so")
+
+    def __init__(self, latitude: float, altitude: float) -> None:
+        """Build the table for a location."""
+        self.latitude = latitude
+        self.altitude = altitude
+        values = [
+            _astronomical_radiation(latitude, altitude, doy)
+            for doy in range(1, DAYS_IN_TABLE + 1)
+        ]
+        self.r_a: tuple[float, ...] = tuple(v[0] for v in values)
+        self.r_so: tuple[float, ...] = tuple(v[1] for v in values)
+
+    def matches(self, latitude: float, altitude: float) -> bool:
+        """Return True if the table was built for this location."""
+        return self.latitude == latitude and self.altitude == altitude
+
+    def lookup(self, doy: int) -> tuple[float, float]:
+        """Return (r_a, r_so) for a 1-based day of year."""
+        return self.r_a[doy - 1], self.r_so[doy - 1]
+
+
+@lru_cache(maxsize=8)
+def get_radiation_table(latitude: float, altitude: float) -> RadiationTable:
+    """Return the shared radiation table for a location (cached)."""
+    return RadiationTable(latitude, altitude)
 
 
 def calculate_eto(
@@ -15,6 +126,7 @@ def calculate_eto(
     altitude: float,
     latitude: float,
     date: datetime,
+    radiation_table: RadiationTable | None = None,
 ) -> float:
     """
     Calculate reference evapotranspiration (ETo) using FAO-56 Penman-Monteith.
@@ -29,6 +141,7 @@ def calculate_eto(
         altitude: Altitude (m)
         latitude: Latitude (decimal degrees)
         date: Date for calculation
+        radiation_table: Precomputed table for latitude/altitude (optional)
 
     Returns:
         ETo in mm/day
@@ -71,38 +184,10 @@ def calculate_eto(
     # Actual vapor pressure (kPa)
     e_a = humidity * e_s / 100
     
-    # Julian day
-    start_of_year = datetime(date.year, 1, 1, tzinfo=date.tzinfo)
-    doy = (date - start_of_year).days + 1
-    
-    # Inverse relative distance Earth-Sun
-    d_r = 1 + 0.033 * math.cos(2 * math.pi * doy / 365)
-    
-    # Solar declination (rad)
-    s_d = 0.409 * math.sin((2 * math.pi * doy / 365) - 1.39)
-    
-    # Latitude in radians
-    l_rad = latitude * math.pi / 180
-    
-    # Sunset hour angle (rad)
-    # Clamp argument to [-1, 1] to avoid math domain errors at extreme latitudes
-    sunset_arg = -(math.tan(s_d) * math.tan(l_rad))
-    sunset_arg = max(-1.0, min(1.0, sunset_arg))
-    sunset_ha = math.acos(sunset_arg)
-    
-    # Extraterrestrial radiation (MJ/m²/day)
-    r_a = (
-        (1440 / math.pi)
-        * 0.082
-        * d_r
-        * (
-            (sunset_ha * math.sin(l_rad) * math.sin(s_d))
-            + (math.cos(l_rad) * math.cos(s_d) * math.sin(sunset_ha))
-        )
-    )
-    
-    # Clear sky radiation (MJ/m²/day)
-    r_so = r_a * (0.75 + (2 * altitude / 100000))
+    # Extraterrestrial (r_a) and clear sky (r_so) radiation (MJ/m²/day)
+    if radiation_table is None:
+        radiation_table = get_radiation_table(latitude, altitude)
+    r_a, r_so = radiation_table.lookup(_day_of_year(date))
     
     # Net shortwave radiation (MJ/m²/day) - albedo of 0.23
     r_ns = r_s * (1 - 0.23)
@@ -137,3 +222,573 @@ def calculate_eto(
     eto = et_rad + et_wind
     
     return max(0, eto)  # Ensure non-negative
+
+
+def calculate_eto_batch(
+    min_temps: Sequence[float],
+    max_temps: Sequence[float],
+    humidities: Sequence[float],
+    pressures: Sequence[float],
+    wind_speeds: Sequence[float],
+    solar_radiations: Sequence[float],
+    dates: Sequence[datetime],
+    altitude: float,
+    latitude: float,
+    radiation_table: RadiationTable | None = None,
+) -> list[float]:
+    """
+    Calculate FAO-56 Penman-Monteith ETo for many days in one pass.
+
+    All sequences must have the same length; element ``i`` of each sequence
+    describes day ``i``. Units are identical to :func:`calculate_eto`.
+    When numpy is available the whole series is evaluated as arrays,
+    otherwise this falls back to calling :func:`calculate_eto` per day.
+
+    Returns:
+        ETo in mm/day, one value per input day
+    """
+    if radiation_table is None:
+        radiation_table = get_radiation_table(latitude, altitude)
+
+    count = len(dates)
+    columns = (min_temps, max_temps, humidities, pressures, wind_speeds, solar_radiations)
+    if any(len(column) != count for column in columns):
+        raise ValueError("All ETo input sequences must have the same length")
+    if count == 0:
+        return []
+
+    if not HAS_NUMPY:
+        return [
+            calculate_eto(
+                min_temp=min_temps[i],
+                max_temp=max_temps[i],
+                humidity=humidities[i],
+                pressure=pressures[i],
+                wind_speed=wind_speeds[i],
+                solar_radiation=solar_radiations[i],
+                altitude=altitude,
+                latitude=latitude,
+                date=dates[i],
+                radiation_table=radiation_table,
+            )
+            for i in range(count)
+        ]
+
+    t_min = np.asarray(min_temps, dtype=float)
+    t_max = np.asarray(max_temps, dtype=float)
+    rh = np.asarray(humidities, dtype=float)
+    p_a = np.asarray(pressures, dtype=float) / 10
+    u_2 = np.asarray(wind_speeds, dtype=float) * 0.748
+    r_s = np.asarray(solar_radiations, dtype=float) * 3.6
+    doy = np.fromiter((_day_of_year(d) for d in dates), dtype=int, count=count)
+
+    t_mean = (t_max + t_min) / 2
+    slope_svpc = 4098 * (0.6108 * np.exp((17.27 * t_mean) / (t_mean + 237.3))) / (t_mean + 237.3) ** 2
+    psc = p_a * 0.000665
+    denom = slope_svpc + (psc * (1 + (0.34 * u_2)))
+    dt = slope_svpc / denom
+    pt = psc / denom
+    tt = u_2 * (900 / (t_mean + 273))
+
+    e_s = (
+        0.6108 * np.exp(17.27 * t_max / (t_max + 237.3))
+        + 0.6108 * np.exp(17.27 * t_min / (t_min + 237.3))
+    ) / 2
+    e_a = rh * e_s / 100
+
+    r_a = np.take(radiation_table.r_a, doy - 1)
+    r_so = np.take(radiation_table.r_so, doy - 1)
+
+    r_ns = r_s * (1 - 0.23)
+    r_nl = 4.903e-9 * ((273.16 + t_max) ** 4 + (273.16 + t_min) ** 4) / 2
+    r_nl = r_nl * (0.34 - (0.14 * np.sqrt(np.maximum(0, e_a))))
+    safe_r_so = np.where(r_so > 0, r_so, 1.0)
+    cloud_factor = np.where(
+        r_so > 0, (1.35 * np.minimum(r_s / safe_r_so, 1.0)) - 0.35, 1.35 * 0.5 - 0.35
+    )
+    r_nl = r_nl * cloud_factor
+
+    eto = dt * 0.408 * (r_ns - r_nl) + pt * tt * (e_s - e_a)
+    return np.maximum(0, eto).tolist()
+
+
+def _extraterrestrial_radiation_hourly(
+    latitude: float, longitude: float, start: datetime
+) -> float:
+    """Return extraterrestrial radiation (MJ/m²/h) for the hour after ``start``.
+
+    Implements FAO-56 eq. 28 with solar time derived from UTC and longitude,
+    so no time zone meridian is needed.
+    """
+    start_utc = start.astimezone(timezone.utc)
+    doy = _day_of_year(start_utc)
+    d_r = 1 + 0.033 * math.cos(2 * math.pi * doy / 365)
+    s_d = 0.409 * math.sin((2 * math.pi * doy / 365) - 1.39)
+    l_rad = latitude * math.pi / 180
+
+    # Seasonal correction for solar time (hours)
+    b = 2 * math.pi * (doy - 81) / 364
+    s_c = 0.1645 * math.sin(2 * b) - 0.1255 * math.cos(b) - 0.025 * math.sin(b)
+
+    # Solar time angle at the midpoint of the period
+    mid_hour = start_utc.hour + start_utc.minute / 60 + 0.5
+    omega = math.pi / 12 * ((mid_hour + longitude / 15 + s_c) - 12)
+    omega = (omega + math.pi) % (2 * math.pi) - math.pi
+
+    sunset_arg = max(-1.0, min(1.0, -(math.tan(s_d) * math.tan(l_rad))))
+    sunset_ha = math.acos(sunset_arg)
+    omega_1 = max(-sunset_ha, omega - math.pi / 24)
+    omega_2 = min(sunset_ha, omega + math.pi / 24)
+    if omega_1 >= omega_2:
+        return 0.0
+
+    r_a = (
+        (12 * 60 / math.pi)
+        * 0.082
+        * d_r
+        * (
+            ((omega_2 - omega_1) * math.sin(l_rad) * math.sin(s_d))
+            + (math.cos(l_rad) * math.cos(s_d) * (math.sin(omega_2) - math.sin(omega_1)))
+        )
+    )
+    return max(0.0, r_a)
+
+
+def calculate_eto_hourly(
+    temp: float,
+    humidity: float,
+    pressure: float,
+    wind_speed: float,
+    altitude: float,
+    latitude: float,
+    longitude: float,
+    start: datetime,
+    cloud_coverage: float | None = None,
+    daily_solar_radiation: float | None = None,
+    radiation_table: RadiationTable | None = None,
+) -> float:
+    """
+    Calculate hourly reference evapotranspiration using FAO-56 eq. 53.
+
+    Solar radiation for the hour is estimated from cloud coverage when the
+    forecast provides it, otherwise the configured daily radiation is spread
+    over the day in proportion to the hourly extraterrestrial radiation.
+
+    Args:
+        temp: Mean air temperature of the hour (°C)
+        humidity: Relative humidity (%)
+        pressure: Atmospheric pressure (hPa)
+        wind_speed: Wind speed (m/s)
+        altitude: Altitude (m)
+        latitude: Latitude (decimal degrees)
+        longitude: Longitude (decimal degrees)
+        start: Start of the hour (tz-aware)
+        cloud_coverage: Cloud coverage (%), optional
+        daily_solar_radiation: Daily solar radiation (kWh/m²/day), optional
+        radiation_table: Precomputed table for latitude/altitude (optional)
+
+    Returns:
+        ETo in mm/hour
+    """
+    r_a = _extraterrestrial_radiation_hourly(latitude, longitude, start)
+    r_so = r_a * (0.75 + (2 * altitude / 100000))
+    daytime = r_a > 0
+
+    if not daytime:
+        r_s = 0.0
+    elif cloud_coverage is not None:
+        # Kasten & Czeplak cloud attenuation of clear sky radiation
+        r_s = r_so * (1 - 0.75 * math.pow(max(0.0, min(100.0, cloud_coverage)) / 100, 3.4))
+    elif daily_solar_radiation is not None:
+        if radiation_table is None:
+            radiation_table = get_radiation_table(latitude, altitude)
+        r_a_day = radiation_table.lookup(_day_of_year(start))[0]
+        r_s = daily_solar_radiation * 3.6 * r_a / r_a_day if r_a_day > 0 else 0.0
+    else:
+        r_s = 0.75 * r_so
+
+    u_2 = wind_speed * 0.748
+    e_0 = 0.6108 * math.exp(17.27 * temp / (temp + 237.3))
+    e_a = humidity * e_0 / 100
+    slope_svpc = 4098 * e_0 / math.pow(temp + 237.3, 2)
+    psc = pressure / 10 * 0.000665
+
+    rs_rso = min(r_s / r_so, 1.0) if r_so > 0 else NIGHT_RS_RSO
+    r_ns = r_s * (1 - 0.23)
+    r_nl = (
+        2.043e-10
+        * math.pow(273.16 + temp, 4)
+        * (0.34 - (0.14 * math.sqrt(max(0, e_a))))
+        * ((1.35 * rs_rso) - 0.35)
+    )
+    r_n = r_ns - r_nl
+
+    # Soil heat flux: 10 % of Rn during daylight, 50 % at night
+    g = 0.1 * r_n if daytime else 0.5 * r_n
+
+    eto = (
+        0.408 * slope_svpc * (r_n - g)
+        + psc * (37 / (temp + 273)) * u_2 * (e_0 - e_a)
+    ) / (slope_svpc + psc * (1 + 0.34 * u_2))
+    return max(0, eto)
+
+
+class DailyEtoAccumulator:
+    """Streaming fold of hourly ETo values into per-day totals.
+
+    Only a running sum and an hour count per calendar day are kept, so the
+    hourly series never has to be held in memory.
+    """
+
+    __slots__ = ("_totals", "_hours")
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self._totals: dict[date_cls, float] = {}
+        self._hours: dict[date_cls, int] = {}
+
+    def add(self, day: date_cls, eto: float) -> None:
+        """Add one hourly ETo value (mm) to its day."""
+        self._totals[day] = self._totals.get(day, 0.0) + eto
+        self._hours[day] = self._hours.get(day, 0) + 1
+
+    def totals(self, min_hours: int = HOURLY_MIN_HOURS) -> dict[date_cls, float]:
+        """Return daily totals for days with at least ``min_hours`` hours."""
+        return {
+            day: total
+            for day, total in self._totals.items()
+            if self._hours[day] >= min_hours
+        }
+
+
+def aggregate_hourly_eto(
+    hours: Iterable[HourlyWeather],
+    altitude: float,
+    latitude: float,
+    longitude: float,
+    solar_radiation: Mapping[int, float],
+    local_tz: tzinfo,
+    radiation_table: RadiationTable | None = None,
+) -> dict[date_cls, float]:
+    """
+    Compute hourly ETo for a stream of forecast hours and sum it per day.
+
+    Meant to run in an executor: the iterable is consumed lazily and only
+    daily totals (mm/day) for sufficiently covered local days are returned.
+    Hours without humidity or wind speed are skipped instead of assuming
+    defaults; missing pressure is derived from the altitude.
+    """
+    if radiation_table is None:
+        radiation_table = get_radiation_table(latitude, altitude)
+    default_pressure = atmospheric_pressure(altitude)
+
+    accumulator = DailyEtoAccumulator()
+    for hour in hours:
+        if hour.humidity is None or hour.wind_speed is None:
+            continue
+        local_start = hour.start.astimezone(local_tz)
+        month = local_start.month
+        accumulator.add(
+            local_start.date(),
+            calculate_eto_hourly(
+                temp=hour.temp,
+                humidity=hour.humidity,
+                pressure=hour.pressure if hour.pressure is not None else default_pressure,
+                wind_speed=hour.wind_speed,
+                altitude=altitude,
+                latitude=latitude,
+                longitude=longitude,
+                start=local_start,
+                cloud_coverage=hour.clouds,
+                daily_solar_radiation=solar_radiation.get(month),
+                radiation_table=radiation_table,
+            ),
+        )
+    return accumulator.totals()
+
+
+def _quantize(value: float, step: float) -> int:
+    """Return ``value`` as an integer multiple of ``step``."""
+    return int(round(value / step))
+
+
+class EtoCache:
+    """LRU memo of daily ETo results keyed by quantized weather inputs.
+
+    Inputs are rounded to 0.1 °C, 1 % humidity, 1 hPa, 0.1 m/s wind and
+    0.01 kWh/m² solar radiation, combined with day of year and location.
+    ETo is always computed from the quantized inputs so a cached value does
+    not depend on which refresh first produced it.
+    """
+
+    def __init__(self, maxsize: int = ETO_CACHE_SIZE) -> None:
+        """Initialize an empty cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached results and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters for diagnostics."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def calculate_batch(
+        self,
+        min_temps: Sequence[float],
+        max_temps: Sequence[float],
+        humidities: Sequence[float],
+        pressures: Sequence[float],
+        wind_speeds: Sequence[float],
+        solar_radiations: Sequence[float],
+        dates: Sequence[datetime],
+        altitude: float,
+        latitude: float,
+        radiation_table: RadiationTable | None = None,
+    ) -> list[float]:
+        """Return ETo per day like :func:`calculate_eto_batch`, using the memo.
+
+        Only days whose quantized inputs are not cached are computed, and
+        those are computed together in a single batch call.
+        """
+        location = (_quantize(latitude, 0.0001), _quantize(altitude, 0.1))
+        keys = [
+            (
+                _quantize(min_temps[i], 0.1),
+                _quantize(max_temps[i], 0.1),
+                _quantize(humidities[i], 1),
+                _quantize(pressures[i], 1),
+                _quantize(wind_speeds[i], 0.1),
+                _quantize(solar_radiations[i], 0.01),
+                _day_of_year(dates[i]),
+                location,
+            )
+            for i in range(len(dates))
+        ]
+
+        results: list[float | None] = []
+        missing: list[int] = []
+        for index, key in enumerate(keys):
+            cached = self._entries.get(key)
+            if cached is None:
+                missing.append(index)
+            else:
+                self._entries.move_to_end(key)
+            results.append(cached)
+
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            computed = calculate_eto_batch(
+                min_temps=[keys[i][0] * 0.1 for i in missing],
+                max_temps=[keys[i][1] * 0.1 for i in missing],
+                humidities=[keys[i][2] for i in missing],
+                pressures=[keys[i][3] for i in missing],
+                wind_speeds=[keys[i][4] * 0.1 for i in missing],
+                solar_radiations=[keys[i][5] * 0.01 for i in missing],
+                dates=[dates[i] for i in missing],
+                altitude=altitude,
+                latitude=latitude,
+                radiation_table=radiation_table,
+            )
+            for index, eto in zip(missing, computed):
+                results[index] = eto
+                self._entries[keys[index]] = eto
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return results  # type: ignore[return-value]
+
+
+def atmospheric_pressure(altitude: float) -> float:
+    """Return mean atmospheric pressure (hPa) for an altitude (FAO-56 eq. 7)."""
+    return 1013 * math.pow((293 - 0.0065 * altitude) / 293, 5.26)
+
+
+def calculate_eto_hargreaves(
+    min_temp: float,
+    max_temp: float,
+    altitude: float,
+    latitude: float,
+    date: datetime,
+    radiation_table: RadiationTable | None = None,
+) -> float:
+    """
+    Calculate ETo using Hargreaves-Samani (FAO-56 eq. 52).
+
+    Only needs the daily temperature range; radiation is derived from the
+    extraterrestrial radiation of the day.
+
+    Returns:
+        ETo in mm/day
+    """
+    if radiation_table is None:
+        radiation_table = get_radiation_table(latitude, altitude)
+    r_a = radiation_table.lookup(_day_of_year(date))[0]
+    t_mean = (max_temp + min_temp) / 2
+    eto = 0.0023 * (t_mean + 17.8) * math.sqrt(max(0, max_temp - min_temp)) * 0.408 * r_a
+    return max(0, eto)
+
+
+def calculate_eto_priestley_taylor(
+    min_temp: float,
+    max_temp: float,
+    pressure: float,
+    solar_radiation: float,
+    altitude: float,
+    latitude: float,
+    date: datetime,
+    radiation_table: RadiationTable | None = None,
+) -> float:
+    """
+    Calculate ETo using Priestley-Taylor (alpha = 1.26).
+
+    Humidity is estimated from the minimum temperature (FAO-56 eq. 48) for
+    the net longwave term; wind is not needed.
+
+    Returns:
+        ETo in mm/day
+    """
+    if radiation_table is None:
+        radiation_table = get_radiation_table(latitude, altitude)
+    r_so = radiation_table.lookup(_day_of_year(date))[1]
+
+    t_mean = (max_temp + min_temp) / 2
+    r_s = solar_radiation * 3.6
+    slope_svpc = (
+        4098 * (0.6108 * math.exp((17.27 * t_mean) / (t_mean + 237.3)))
+        / math.pow((t_mean + 237.3), 2)
+    )
+    psc = pressure / 10 * 0.000665
+    e_a = 0.6108 * math.exp(17.27 * min_temp / (min_temp + 237.3))
+
+    rs_rso = min(r_s / r_so, 1.0) if r_so > 0 else 0.5
+    r_nl = (
+        4.903e-9
+        * (math.pow((273.16 + max_temp), 4) + math.pow((273.16 + min_temp), 4))
+        / 2
+        * (0.34 - (0.14 * math.sqrt(e_a)))
+        * ((1.35 * rs_rso) - 0.35)
+    )
+    r_n = r_s * (1 - 0.23) - r_nl
+
+    eto = 1.26 * slope_svpc / (slope_svpc + psc) * 0.408 * r_n
+    return max(0, eto)
+
+
+@dataclass(frozen=True)
+class EtoMethod:
+    """A registered ETo method and the inputs it needs."""
+
+    name: str
+    requires: frozenset[str]
+    tier: int  # accuracy class, 1 = reference method
+    cost: int  # relative evaluation cost, lower is cheaper
+    func: Callable[..., float]
+
+
+def _penman_monteith(**kwargs) -> float:
+    """Penman-Monteith adapter for the method registry."""
+    return calculate_eto(**kwargs)
+
+
+def _priestley_taylor(**kwargs) -> float:
+    """Priestley-Taylor adapter for the method registry."""
+    return calculate_eto_priestley_taylor(
+        min_temp=kwargs["min_temp"],
+        max_temp=kwargs["max_temp"],
+        pressure=kwargs["pressure"],
+        solar_radiation=kwargs["solar_radiation"],
+        altitude=kwargs["altitude"],
+        latitude=kwargs["latitude"],
+        date=kwargs["date"],
+        radiation_table=kwargs.get("radiation_table"),
+    )
+
+
+def _hargreaves_samani(**kwargs) -> float:
+    """Hargreaves-Samani adapter for the method registry."""
+    return calculate_eto_hargreaves(
+        min_temp=kwargs["min_temp"],
+        max_temp=kwargs["max_temp"],
+        altitude=kwargs["altitude"],
+        latitude=kwargs["latitude"],
+        date=kwargs["date"],
+        radiation_table=kwargs.get("radiation_table"),
+    )
+
+
+METHOD_PENMAN_MONTEITH = "penman_monteith"
+METHOD_PRIESTLEY_TAYLOR = "priestley_taylor"
+METHOD_HARGREAVES_SAMANI = "hargreaves_samani"
+
+ETO_METHODS: dict[str, EtoMethod] = {
+    METHOD_PENMAN_MONTEITH: EtoMethod(
+        name=METHOD_PENMAN_MONTEITH,
+        requires=frozenset({"min_temp", "max_temp", "humidity", "wind_speed"}),
+        tier=1,
+        cost=3,
+        func=_penman_monteith,
+    ),
+    METHOD_PRIESTLEY_TAYLOR: EtoMethod(
+        name=METHOD_PRIESTLEY_TAYLOR,
+        requires=frozenset({"min_temp", "max_temp", "solar_radiation"}),
+        tier=2,
+        cost=2,
+        func=_priestley_taylor,
+    ),
+    METHOD_HARGREAVES_SAMANI: EtoMethod(
+        name=METHOD_HARGREAVES_SAMANI,
+        requires=frozenset({"min_temp", "max_temp"}),
+        tier=3,
+        cost=1,
+        func=_hargreaves_samani,
+    ),
+}
+
+
+def monthly_solar_radiation(monthly: Mapping | None, month: int, default: float = 6.0) -> float:
+    """Return the configured solar radiation (kWh/m²/day) of ``month``.
+
+    Keys may be strings after JSON serialization.
+    """
+    if not monthly:
+        return default
+    return monthly.get(month) or monthly.get(str(month)) or default
+
+
+def solar_table_configured(monthly: Mapping | None, defaults: Mapping[int, float]) -> bool:
+    """Return True if the monthly radiation table counts as solar data.
+
+    The shipped defaults are a placeholder: Penman-Monteith still uses
+    them, but they do not make Priestley-Taylor valid. Forecast and
+    observed days both use this rule so a day gets the same method.
+    """
+    return any(
+        monthly_solar_radiation(monthly, month, defaults[month]) != defaults[month]
+        for month in range(1, 13)
+    )
+
+
+def select_eto_method(available: Iterable[str]) -> EtoMethod | None:
+    """Return the method to use for a day with the given measured inputs.
+
+    Methods whose required inputs are all available are valid; among them
+    the best accuracy tier wins and the cheapest method within that tier is
+    chosen. Returns None when not even the temperatures are available.
+    """
+    available_set = set(available)
+    valid = [m for m in ETO_METHODS.values() if m.requires <= available_set]
+    if not valid:
+        return None
+    return min(valid, key=lambda m: (m.tier, m.cost))
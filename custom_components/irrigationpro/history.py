@@ -0,0 +1,243 @@
+"""Observed-weather history for IrrigationPro.
+
+Backfills daily observed temperature, rain and actual ETo from Home
+Assistant's long-term statistics. All station sensors are read with a
+single daily statistics query in the recorder's executor, so refreshes
+never hit the recorder database. Days are kept in a compact store (one
+short row per date) next to the coordinator storage.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    OBSERVED_HISTORY_DAYS_KEPT,
+    OBSERVED_STORAGE_KEY,
+    OBSERVED_STORAGE_VERSION,
+)
+from .station import (
+    STATION_HUMIDITY,
+    STATION_PRESSURE,
+    STATION_RAIN,
+    STATION_SOLAR_RADIATION,
+    STATION_TEMPERATURE,
+    STATION_WIND_SPEED,
+    observed_weather,
+)
+from .weather_provider import WeatherData
+
+_LOGGER = logging.getLogger(__name__)
+
+# Column order of a stored day row
+_ROW_FIELDS = ("min_temp", "max_temp", "rain", "eto")
+
+# Units the recorder converts the statistics to before returning them
+_STATISTICS_UNITS = {
+    "temperature": "°C",
+    "speed": "m/s",
+    "pressure": "hPa",
+    "distance": "mm",
+}
+
+
+def _row_date(start: Any) -> date:
+    """Return the local date of a statistics row start (timestamp or datetime)."""
+    if isinstance(start, (int, float)):
+        start = dt_util.utc_from_timestamp(start)
+    return dt_util.as_local(start).date()
+
+
+class ObservedHistory:
+    """Compact per-day store of observed weather."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty history without sensors."""
+        self.hass = hass
+        self.sensors: dict[str, str] = {}
+        self.monthly_solar: dict | None = None
+        self._store = Store(hass, OBSERVED_STORAGE_VERSION, OBSERVED_STORAGE_KEY)
+        # ISO date -> [min_temp, max_temp, rain | None, eto]
+        self._days: dict[str, list[float | None]] = {}
+        self.last_import: datetime | None = None
+        # Bumped whenever stored days change, so callers can tell if results are stale
+        self.revision = 0
+
+    def update_sensors(self, sensors: dict[str, str | None], monthly_solar: dict | None) -> None:
+        """Set the ``{quantity: entity_id}`` station sensors to import from."""
+        self.sensors = {quantity: entity for quantity, entity in sensors.items() if entity}
+        self.monthly_solar = monthly_solar
+
+    @property
+    def configured(self) -> bool:
+        """Return True if a temperature or rain sensor is configured."""
+        return STATION_TEMPERATURE in self.sensors or STATION_RAIN in self.sensors
+
+    async def async_load(self) -> None:
+        """Load stored days."""
+        data = await self._store.async_load()
+        if data:
+            self._days = data.get("days", {})
+            self.revision += 1
+
+    async def async_save(self) -> None:
+        """Persist the stored days, dropping the oldest beyond the limit."""
+        if len(self._days) > OBSERVED_HISTORY_DAYS_KEPT:
+            for key in sorted(self._days)[: len(self._days) - OBSERVED_HISTORY_DAYS_KEPT]:
+                del self._days[key]
+        await self._store.async_save({"days": self._days})
+
+    def record(self, weather: WeatherData) -> None:
+        """Store a measured day, keeping rain that was already imported."""
+        key = weather.sunrise.date().isoformat()
+        rain = None if "rain" in weather.estimated else weather.rain
+        if rain is None and key in self._days:
+            rain = self._days[key][2]
+        self._days[key] = [
+            round(weather.min_temp, 2),
+            round(weather.max_temp, 2),
+            round(rain, 2) if rain is not None else None,
+            round(weather.eto, 3),
+        ]
+        self.revision += 1
+
+    async def async_import(self, days: int) -> int:
+        """Backfill the last ``days`` completed days from long-term statistics.
+
+        Returns the number of days stored. Without the recorder this is a
+        no-op.
+        """
+        if not self.configured:
+            return 0
+        try:
+            from homeassistant.components.recorder import get_instance
+            from homeassistant.components.recorder.statistics import (
+                statistics_during_period,
+            )
+        except ImportError:
+            _LOGGER.debug("Recorder not available, skipping observed history import")
+            return 0
+
+        end = dt_util.start_of_local_day()
+        start = end - timedelta(days=days)
+        try:
+            stats = await get_instance(self.hass).async_add_executor_job(
+                statistics_during_period,
+                self.hass,
+                start,
+                end,
+                set(self.sensors.values()),
+                "day",
+                _STATISTICS_UNITS,
+                {"mean", "min", "max", "change"},
+            )
+        except Exception as err:
+            _LOGGER.warning("Could not import observed weather history: %s", err)
+            return 0
+
+        by_day: dict[date, dict[str, dict[str, Any]]] = {}
+        for quantity, entity_id in self.sensors.items():
+            for row in stats.get(entity_id, []):
+                by_day.setdefault(_row_date(row["start"]), {})[quantity] = row
+
+        for day, rows in sorted(by_day.items()):
+            temperature = rows.get(STATION_TEMPERATURE)
+            rain = rows.get(STATION_RAIN, {}).get("change")
+            if temperature is None or temperature.get("min") is None:
+                # Rain only: keep any measured temperature/ETo already stored
+                if rain is not None:
+                    row = self._days.setdefault(day.isoformat(), [None, None, None, None])
+                    row[2] = round(rain, 2)
+                continue
+
+            values = {
+                field: rows[quantity]["mean"]
+                for quantity, field in (
+                    (STATION_HUMIDITY, "humidity"),
+                    (STATION_WIND_SPEED, "wind_speed"),
+                    (STATION_PRESSURE, "pressure"),
+                )
+                if rows.get(quantity, {}).get("mean") is not None
+            }
+            radiation = rows.get(STATION_SOLAR_RADIATION, {}).get("mean")
+            weather = observed_weather(
+                self.hass,
+                day,
+                temperature["min"],
+                temperature["max"],
+                values,
+                # Daily mean W/m² → kWh/m² per day
+                solar_radiation=radiation * 24 / 1000 if radiation is not None else None,
+                monthly_solar=self.monthly_solar,
+                rain=rain,
+            )
+            self.record(weather)
+
+        self.last_import = dt_util.now()
+        self.revision += 1
+        _LOGGER.debug("Imported %d observed days from statistics", len(by_day))
+        return len(by_day)
+
+    def get(self, day: date) -> dict[str, float | None] | None:
+        """Return the stored values of one day."""
+        row = self._days.get(day.isoformat())
+        return dict(zip(_ROW_FIELDS, row)) if row else None
+
+    def rain_surplus(
+        self,
+        first: date,
+        last: date,
+        assumed: dict[str, float],
+        factor: float,
+        capacity: float,
+    ) -> float:
+        """Return observed rain beyond the planned rain still left from ``first`` to ``last``.
+
+        ``assumed`` is the forecast rain (ISO date -> mm) the last water
+        balance already subtracted; only rain above it is extra water. The
+        extra water fills a bucket of ``capacity`` mm that observed ETo
+        times ``factor`` (crop, density, exposure) drains, day by day. Days
+        without rain data only drain, days without any data are skipped.
+        """
+        surplus = 0.0
+        day = first
+        while day <= last:
+            key = day.isoformat()
+            row = self._days.get(key)
+            if row and (row[2] is not None or row[3] is not None):
+                extra = max(0.0, (row[2] or 0.0) - assumed.get(key, 0.0))
+                surplus = surplus + extra - (row[3] or 0.0) * factor
+                surplus = min(capacity, max(0.0, surplus))
+            day += timedelta(days=1)
+        return surplus
+
+    def depletion(self, first: date, last: date, factor: float, capacity: float) -> float | None:
+        """Return the soil-water depletion in mm after ``first`` to ``last``.
+
+        Like ``rain_surplus`` but the other way round: observed ETo times
+        ``factor`` drains a bucket of ``capacity`` mm, rain refills it.
+        Returns None if no day in the range has data.
+        """
+        depletion = 0.0
+        found = False
+        day = first
+        while day <= last:
+            row = self._days.get(day.isoformat())
+            if row and (row[2] is not None or row[3] is not None):
+                found = True
+                depletion += (row[3] or 0.0) * factor - (row[2] or 0.0)
+                depletion = min(capacity, max(0.0, depletion))
+            day += timedelta(days=1)
+        return depletion if found else None
+
+    def as_list(self, limit: int = 14) -> list[dict[str, Any]]:
+        """Return the most recent days for the status API."""
+        return [
+            {"date": key, **dict(zip(_ROW_FIELDS, self._days[key]))}
+            for key in sorted(self._days)[-limit:]
+        ]
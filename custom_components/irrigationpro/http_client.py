@@ -0,0 +1,82 @@
+"""Shared outbound HTTP client for IrrigationPro.
+
+All outbound requests (OpenWeatherMap, Pushover) go through one client that
+reuses Home Assistant's shared aiohttp session, so TCP/TLS connections are
+kept alive between calls instead of being opened per request.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from yarl import URL
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+HTTP_CONNECT_TIMEOUT = 10  # seconds
+HTTP_READ_TIMEOUT = 30  # seconds
+HTTP_LIMIT_PER_HOST = 4  # concurrent requests per remote host
+
+_DATA_KEY = f"{DOMAIN}_http_client"
+
+
+class HttpClient:
+    """Pooled HTTP client with explicit timeouts and per-host limits."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = HTTP_READ_TIMEOUT,
+        limit_per_host: int = HTTP_LIMIT_PER_HOST,
+    ) -> None:
+        """Initialize the client on top of an existing session."""
+        self._session = session
+        self._timeout = aiohttp.ClientTimeout(
+            connect=connect_timeout, sock_read=read_timeout
+        )
+        self._limit_per_host = limit_per_host
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    def _slot(self, url: str) -> asyncio.Semaphore:
+        """Return the concurrency limiter for the URL's host."""
+        host = URL(url).host or ""
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self._limit_per_host)
+        return slot
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Perform a request and yield the response (released on exit)."""
+        kwargs.setdefault("timeout", self._timeout)
+        async with self._slot(url):
+            async with self._session.request(method, url, **kwargs) as response:
+                yield response
+
+    def get(self, url: str, **kwargs: Any):
+        """Shortcut for a GET request (use as async context manager)."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any):
+        """Shortcut for a POST request (use as async context manager)."""
+        return self.request("POST", url, **kwargs)
+
+
+def async_get_http_client(hass: HomeAssistant) -> HttpClient:
+    """Return the integration-wide HTTP client, creating it on first use."""
+    client: HttpClient | None = hass.data.get(_DATA_KEY)
+    if client is None:
+        _LOGGER.debug("Creating shared IrrigationPro HTTP client")
+        client = hass.data[_DATA_KEY] = HttpClient(async_get_clientsession(hass))
+    return client
@@ -0,0 +1,254 @@
+"""Hydraulic-capacity- and soak-aware scheduling of IrrigationPro zone runs.
+
+The water supply limits how many valves can be open at once: by total
+flow (L/h) and/or by a number of valves. With several cycles per run every
+zone also needs a minimum soak time between two of its cycles, during
+which other zones can water.
+
+``RunQueue`` decides which zone cycles may start at a given time: runs of
+earlier cycles first, then the zone with the longest remaining chain of
+runs and soaks (critical path), or the configured zone order when only one
+valve may be open. Every run that fits the supply next to the running ones
+starts (first fit). ``plan_runs`` replays the queue in simulated time to
+get the timeline and its makespan; the coordinator drives the same queue
+in real time while watering. With one valve and no soak times the result
+is the classic order: zone 1..N, then zone 1..N again.
+"""
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+# Tolerance for flow sums (L/h) and times (min)
+_EPSILON = 1e-6
+
+
+class SupplyLimits:
+    """Supply capacity (L/h, 0 = unlimited) and max open valves (0 = unlimited)."""
+
+    __slots__ = ("capacity", "max_parallel")
+
+    def __init__(self, capacity: float = 0.0, max_parallel: int = 1) -> None:
+        """Initialize the limits."""
+        self.capacity = max(0.0, float(capacity or 0.0))
+        self.max_parallel = max(0, int(max_parallel or 0))
+
+    @property
+    def parallel(self) -> bool:
+        """Return True if more than one valve may be open at a time."""
+        return self.max_parallel != 1
+
+    def fits(self, running_flow: float, running_count: int, flow: float) -> bool:
+        """Return True if a zone with ``flow`` may start next to the running ones.
+
+        A zone that alone exceeds the capacity still runs, but only alone.
+        """
+        if running_count == 0:
+            return True
+        if self.max_parallel and running_count >= self.max_parallel:
+            return False
+        return not self.capacity or running_flow + flow <= self.capacity + _EPSILON
+
+
+class ZoneRun(NamedTuple):
+    """One cycle of a zone; times in minutes from the start of the run."""
+
+    zone_id: int
+    cycle: int
+    start: float
+    duration: float
+    flow: float
+
+    @property
+    def end(self) -> float:
+        """Return the end of the run."""
+        return self.start + self.duration
+
+
+class WateringPlan(NamedTuple):
+    """Timeline of all zone cycles of one watering run."""
+
+    runs: tuple[ZoneRun, ...]
+    makespan: float
+    sequential: float
+    lower_bound: float
+    peak_flow: float
+
+    def start_of(self, zone_id: int) -> float | None:
+        """Return the start of the first cycle of ``zone_id``, if planned."""
+        for run in self.runs:
+            if run.zone_id == zone_id:
+                return run.start
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timeline for the status API."""
+        return {
+            "makespan_minutes": round(self.makespan, 1),
+            "sequential_minutes": round(self.sequential, 1),
+            "lower_bound_minutes": round(self.lower_bound, 1),
+            "peak_flow_lph": round(self.peak_flow, 1),
+            "runs": [
+                {
+                    "zone_id": run.zone_id,
+                    "cycle": run.cycle,
+                    "start_minute": round(run.start, 1),
+                    "end_minute": round(run.end, 1),
+                    "flow_lph": round(run.flow, 1),
+                }
+                for run in self.runs
+            ],
+        }
+
+
+class _QueuedZone:
+    """Run state of one zone within a RunQueue."""
+
+    __slots__ = ("zone_id", "duration", "flow", "soak", "order", "cycle", "remaining", "ready_at", "running")
+
+    def __init__(self, zone_id: int, duration: float, flow: float, soak: float, order: int, cycles: int) -> None:
+        self.zone_id = zone_id
+        self.duration = duration
+        self.flow = flow
+        self.soak = max(0.0, soak)
+        self.order = order
+        self.cycle = 1
+        self.remaining = cycles
+        self.ready_at = 0.0
+        self.running = False
+
+    @property
+    def tail(self) -> float:
+        """Return the minutes of runs and soaks this zone still needs."""
+        return self.remaining * self.duration + (self.remaining - 1) * self.soak
+
+
+class RunQueue:
+    """Decides which zone cycles start when, under supply and soak limits."""
+
+    def __init__(
+        self,
+        zones: Iterable[tuple[int, float, float, float]],
+        limits: SupplyLimits,
+        cycles: int = 1,
+    ) -> None:
+        """Queue ``cycles`` runs of every ``(zone_id, duration, flow, soak)``."""
+        self.limits = limits
+        self.cycles = max(1, cycles)
+        self._zones = [
+            _QueuedZone(zone_id, duration, flow, soak, order, self.cycles)
+            for order, (zone_id, duration, flow, soak) in enumerate(zones)
+            if duration > 0
+        ]
+        self._by_id = {zone.zone_id: zone for zone in self._zones}
+        self._running: dict[int, _QueuedZone] = {}
+
+    @property
+    def done(self) -> bool:
+        """Return True when no run is left or running."""
+        return not self._running and not any(zone.remaining for zone in self._zones)
+
+    @property
+    def running_flow(self) -> float:
+        """Return the flow of the running zones in L/h."""
+        return sum(zone.flow for zone in self._running.values())
+
+    def _priority(self, zone: _QueuedZone) -> tuple:
+        """Earlier cycles first, then the critical path (or zone order)."""
+        if self.limits.parallel:
+            return (zone.cycle, -zone.tail, zone.order)
+        return (zone.cycle, zone.order)
+
+    def pop_startable(self, now: float) -> list[tuple[int, int]]:
+        """Start every ready run that fits and return its (zone_id, cycle)."""
+        ready = sorted(
+            (
+                zone
+                for zone in self._zones
+                if zone.remaining and not zone.running and zone.ready_at <= now + _EPSILON
+            ),
+            key=self._priority,
+        )
+        started = []
+        for zone in ready:
+            if self.limits.fits(self.running_flow, len(self._running), zone.flow):
+                zone.running = True
+                self._running[zone.zone_id] = zone
+                started.append((zone.zone_id, zone.cycle))
+                zone.cycle += 1
+                zone.remaining -= 1
+        return started
+
+    def finish(self, zone_id: int, now: float) -> None:
+        """Record the end of the running cycle of ``zone_id``."""
+        zone = self._running.pop(zone_id)
+        zone.running = False
+        zone.ready_at = now + zone.soak
+
+    def next_ready(self, now: float) -> float | None:
+        """Return the next time after ``now`` at which a soaking zone is ready."""
+        return min(
+            (
+                zone.ready_at
+                for zone in self._zones
+                if zone.remaining and not zone.running and zone.ready_at > now + _EPSILON
+            ),
+            default=None,
+        )
+
+    def cancel(self) -> None:
+        """Drop all runs that have not started yet."""
+        for zone in self._zones:
+            zone.remaining = 0
+
+    def lower_bound(self) -> float:
+        """Return a lower bound of the makespan of the queued runs.
+
+        No plan can be shorter than the longest chain of one zone, nor than
+        the total run time spread over all valves or all of the capacity.
+        """
+        bound = max((zone.tail for zone in self._zones), default=0.0)
+        work = sum(zone.remaining * zone.duration for zone in self._zones)
+        if self.limits.max_parallel:
+            bound = max(bound, work / self.limits.max_parallel)
+        if self.limits.capacity:
+            volume = sum(
+                zone.remaining * zone.duration * min(zone.flow, self.limits.capacity)
+                for zone in self._zones
+            )
+            bound = max(bound, volume / self.limits.capacity)
+        return bound
+
+
+def plan_runs(
+    zones: Iterable[tuple[int, float, float, float]],
+    limits: SupplyLimits,
+    cycles: int = 1,
+) -> WateringPlan:
+    """Return the timeline of ``cycles`` runs of every ``(zone_id, duration, flow, soak)``."""
+    queue = RunQueue(zones, limits, cycles)
+    lower_bound = queue.lower_bound()
+    sequential = sum(zone.remaining * zone.duration for zone in queue._zones)
+    runs: list[ZoneRun] = []
+    ends: list[tuple[float, int]] = []  # heap of (end, zone_id)
+    peak_flow = 0.0
+    now = 0.0
+    while not queue.done:
+        for zone_id, cycle in queue.pop_startable(now):
+            zone = queue._by_id[zone_id]
+            runs.append(ZoneRun(zone_id, cycle, now, zone.duration, zone.flow))
+            heapq.heappush(ends, (now + zone.duration, zone_id))
+        peak_flow = max(peak_flow, queue.running_flow)
+        events = [ends[0][0]] if ends else []
+        ready = queue.next_ready(now)
+        if ready is not None:
+            events.append(ready)
+        if not events:
+            break
+        now = min(events)
+        while ends and ends[0][0] <= now + _EPSILON:
+            end, zone_id = heapq.heappop(ends)
+            queue.finish(zone_id, end)
+    makespan = max((run.end for run in runs), default=0.0)
+    return WateringPlan(tuple(runs), makespan, sequential, lower_bound, peak_flow)
@@ -0,0 +1,145 @@
+"""Multi-day look-ahead planner for IrrigationPro watering days.
+
+Every zone is modelled as a soil-water bucket: crop ET drains it, rain and
+irrigation refill it, and the depletion must stay below the management
+allowed depletion (MAD) share of the total available water (TAW). Over the
+forecast days a dynamic program decides on which allowed days a zone
+refills the bucket to field capacity, so that the water applied plus a
+penalty per valve start is minimal and depletion never exceeds the MAD
+limit. Water still owed at the end of the horizon counts as applied
+water, so watering early only pays off if the soil would otherwise cross
+the limit; late watering leaves room for rain.
+
+Since every watering refills the bucket, the depletion on a day depends
+only on the day of the last refill. The dynamic program therefore runs
+over (day, last refill) states and is exact without a depletion grid:
+O(days²) per zone.
+
+The module has no Home Assistant dependencies, so it can be benchmarked
+on its own (see ``tools/benchmark_lookahead.py``).
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple
+
+# Cost of one valve start in mm of water
+START_PENALTY_MM = 2.0
+
+# Cost per mm of depletion above the MAD limit (soft constraint, so zones
+# without an allowed watering day in time still get a plan)
+_OVER_LIMIT_PENALTY = 1000.0
+
+
+class ZoneBucket(NamedTuple):
+    """Soil-water bucket of one zone and its daily inputs in mm."""
+
+    zone_id: int
+    taw: float
+    mad: float
+    depletion: float
+    etc: Sequence[float]
+    rain: Sequence[float]
+    allowed: Sequence[bool]
+
+
+class LookaheadPlan(NamedTuple):
+    """Planned watering days of one zone."""
+
+    zone_id: int
+    days: tuple[int, ...]
+    water: tuple[float, ...]
+    depletion: tuple[float, ...]
+    limit: float
+    over_limit: float
+
+    def next_day(self, day_index: int) -> int | None:
+        """Return the first planned day after ``day_index``."""
+        return next((day for day in self.days if day > day_index), None)
+
+    def refill(self, day_index: int) -> float | None:
+        """Return the water in mm planned for ``day_index``, or None if it is no watering day."""
+        if day_index in self.days:
+            return self.water[self.days.index(day_index)]
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the plan for the status API."""
+        return {
+            "days": list(self.days),
+            "water_mm": [round(value, 2) for value in self.water],
+            "depletion_mm": [round(value, 2) for value in self.depletion],
+            "limit_mm": round(self.limit, 2),
+            "over_limit_mm": round(self.over_limit, 2),
+        }
+
+
+def _segments(bucket: ZoneBucket, start: int, limit: float) -> list[tuple[float, float]]:
+    """Return (depletion, worst excess over the limit) at the start of every later day.
+
+    ``start`` is the day of a refill, or -1 for the current depletion
+    before day 0. Entry ``j`` belongs to day ``max(start, 0) + j``; the
+    last entry is the end of the horizon.
+    """
+    first = max(start, 0)
+    depletion = 0.0 if start >= 0 else min(bucket.taw, max(0.0, bucket.depletion))
+    excess = 0.0
+    result = [(depletion, excess)]
+    for day in range(first, len(bucket.etc)):
+        depletion = min(bucket.taw, max(0.0, depletion + bucket.etc[day] - bucket.rain[day]))
+        excess = max(excess, depletion - limit)
+        result.append((depletion, excess))
+    return result
+
+
+def plan_zone(bucket: ZoneBucket, start_penalty: float = START_PENALTY_MM) -> LookaheadPlan:
+    """Plan the watering days of one zone by backward induction.
+
+    ``best[start]`` is the cheapest cost from a refill on day ``start``
+    (or from the current depletion for -1) to the end of the horizon: either
+    no further watering, or the next refill on an allowed later day.
+    """
+    days = len(bucket.etc)
+    limit = bucket.mad * bucket.taw
+    best: dict[int, float] = {}
+    follow: dict[int, int | None] = {}
+    for start in range(days - 1, -2, -1):
+        if start >= 0 and not bucket.allowed[start]:
+            continue
+        first = max(start, 0)
+        segment = _segments(bucket, start, limit)
+        depletion, excess = segment[-1]
+        best[start] = depletion + _OVER_LIMIT_PENALTY * max(0.0, excess)
+        follow[start] = None
+        for day in range(start + 1, days):
+            if day not in best:
+                continue
+            # Refill in the morning of ``day``: the day itself is not drained yet
+            depletion, excess = segment[day - first]
+            cost = depletion + start_penalty + _OVER_LIMIT_PENALTY * max(0.0, excess) + best[day]
+            if cost < best[start]:
+                best[start] = cost
+                follow[start] = day
+
+    # Follow the chosen refills from the current depletion
+    planned: list[int] = []
+    water: list[float] = []
+    path: list[float] = []
+    start = -1
+    segment = _segments(bucket, start, limit)
+    for day in range(days):
+        if day == follow[start]:
+            planned.append(day)
+            water.append(segment[day - max(start, 0)][0])
+            start = day
+            segment = _segments(bucket, start, limit)
+        path.append(segment[day + 1 - max(start, 0)][0])
+    over_limit = max(0.0, max(path, default=0.0) - limit)
+    return LookaheadPlan(bucket.zone_id, tuple(planned), tuple(water), tuple(path), limit, over_limit)
+
+
+def plan_zones(
+    buckets: Iterable[ZoneBucket], start_penalty: float = START_PENALTY_MM
+) -> dict[int, LookaheadPlan]:
+    """Plan all zones; zones are independent of each other."""
+    return {bucket.zone_id: plan_zone(bucket, start_penalty) for bucket in buckets}
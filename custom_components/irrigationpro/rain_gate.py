@@ -0,0 +1,228 @@
+"""Intraday rain gate for IrrigationPro watering runs.
+
+While a run is in progress the gate listens to a rain sensor (rain rate,
+accumulating precipitation or a binary rain detector) and trips on rain
+onset, so the running zone stops and the remaining zones are skipped
+within seconds. Before each zone the hourly forecast for the next hours
+is consulted as well. Outside of runs the gate holds no subscriptions.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+
+from .weather_provider import HourlyWeather
+
+_LOGGER = logging.getLogger(__name__)
+
+# Trip reasons
+REASON_SENSOR = "sensor"
+REASON_FORECAST = "forecast"
+
+# Units of rain-rate sensors (others are treated as accumulating totals)
+_RATE_UNITS = {"mm/h": 1.0, "in/h": 25.4, "mm/d": 1 / 24, "in/d": 25.4 / 24}
+_TOTAL_UNITS = {"mm": 1.0, "in": 25.4, "cm": 10.0}
+
+
+class RainGate:
+    """Trips when rain starts or is expected during a watering run."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rain_entity: str | None,
+        threshold: float,
+        forecast_threshold: float,
+        lookahead_hours: int,
+        hourly_forecast: Callable[[int], Awaitable[Iterable[HourlyWeather]]] | None = None,
+        forecast_max_age: timedelta = timedelta(minutes=15),
+    ) -> None:
+        """Initialize the gate.
+
+        ``threshold`` is the rain rate (mm/h) or the precipitation since the
+        run started (mm) that counts as rain onset. ``forecast_threshold`` is
+        the rain (mm) expected within ``lookahead_hours`` that skips the
+        remaining zones; 0 disables the forecast check.
+        """
+        self.hass = hass
+        self.rain_entity = rain_entity
+        self.threshold = threshold
+        self.forecast_threshold = forecast_threshold
+        self.lookahead_hours = lookahead_hours
+        self._hourly_forecast = hourly_forecast
+        self._forecast_max_age = forecast_max_age
+        self._tripped = asyncio.Event()
+        self._unsub: Callable[[], None] | None = None
+        self._armed = False
+        self._baseline: float | None = None
+        self._expected: float | None = None
+        self._expected_at: datetime | None = None
+        self.reason: str | None = None
+        self.tripped_at: datetime | None = None
+        self.detail: float | None = None
+        self.trips = 0
+
+    @property
+    def configured(self) -> bool:
+        """Return True if a sensor or the forecast check is active."""
+        return bool(self.rain_entity) or (
+            self.forecast_threshold > 0 and self._hourly_forecast is not None
+        )
+
+    @property
+    def tripped(self) -> bool:
+        """Return True once rain has been detected in the current run."""
+        return self._tripped.is_set()
+
+    @callback
+    def update(self, rain_entity: str | None, threshold: float, forecast_threshold: float) -> None:
+        """Apply changed options; an armed gate re-subscribes."""
+        changed = rain_entity != self.rain_entity
+        self.rain_entity = rain_entity
+        self.threshold = threshold
+        self.forecast_threshold = forecast_threshold
+        self._expected_at = None
+        if changed and self._armed:
+            self._subscribe()
+
+    @callback
+    def arm(self) -> None:
+        """Start watching for rain at the beginning of a run."""
+        self.disarm()
+        self._armed = True
+        self._tripped.clear()
+        self.reason = None
+        self.tripped_at = None
+        self.detail = None
+        self._subscribe()
+
+    def _subscribe(self) -> None:
+        """(Re-)subscribe to the rain sensor, starting from its current state."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._baseline = None
+        if not self.rain_entity:
+            return
+        self._check_state(self.hass.states.get(self.rain_entity), arming=True)
+        self._unsub = async_track_state_change_event(
+            self.hass, [self.rain_entity], self._handle_state_change
+        )
+
+    @callback
+    def disarm(self) -> None:
+        """Stop watching after the run."""
+        self._armed = False
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        """Check every new sensor state for rain onset."""
+        self._check_state(event.data.get("new_state"))
+
+    def _check_state(self, state: State | None, arming: bool = False) -> None:
+        """Trip on a wet binary sensor, a high rate or a rising total."""
+        if state is None or state.state in ("unavailable", "unknown"):
+            return
+        if state.domain == "binary_sensor":
+            if state.state == "on":
+                self._trip(REASON_SENSOR, None)
+            return
+        try:
+            value = float(state.state)
+        except ValueError:
+            return
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if unit in _RATE_UNITS:
+            rate = value * _RATE_UNITS[unit]
+            if rate >= self.threshold:
+                self._trip(REASON_SENSOR, rate)
+            return
+        total = value * _TOTAL_UNITS.get(unit, 1.0)
+        if arming or self._baseline is None or total < self._baseline:
+            # Start of the run, or the counter was reset (e.g. daily total)
+            self._baseline = total
+        elif total - self._baseline >= self.threshold:
+            self._trip(REASON_SENSOR, total - self._baseline)
+
+    def _trip(self, reason: str, detail: float | None) -> None:
+        """Record the onset and wake up the running zone."""
+        if self.tripped:
+            return
+        self.reason = reason
+        self.detail = detail
+        self.tripped_at = dt_util.now()
+        self.trips += 1
+        self._tripped.set()
+        _LOGGER.info(
+            "Rain gate tripped by %s%s",
+            reason,
+            f" ({detail:.1f} mm)" if detail is not None else "",
+        )
+
+    async def async_check_forecast(self) -> bool:
+        """Trip if the hourly forecast expects rain within the look-ahead.
+
+        The hourly forecast is fetched at most every ``forecast_max_age``.
+        Returns True if the gate is tripped.
+        """
+        if self.tripped:
+            return True
+        if not self._armed or self.forecast_threshold <= 0 or self._hourly_forecast is None:
+            return False
+        now = dt_util.now()
+        if self._expected_at is None or now - self._expected_at >= self._forecast_max_age:
+            try:
+                hours = await self._hourly_forecast(self.lookahead_hours + 1)
+            except Exception as err:
+                _LOGGER.debug("Hourly forecast for rain gate not available: %s", err)
+                return False
+            end = now + timedelta(hours=self.lookahead_hours)
+            # An hour that already started still counts
+            self._expected = sum(
+                hour.rain for hour in hours if now - timedelta(hours=1) < hour.start < end
+            )
+            self._expected_at = now
+        if self._expected >= self.forecast_threshold:
+            self._trip(REASON_FORECAST, self._expected)
+        return self.tripped
+
+    async def async_wait(self, seconds: float) -> bool:
+        """Sleep for ``seconds`` unless the gate trips first.
+
+        Returns True if the full time passed without rain. Outside of an
+        armed run (e.g. manual starts) this is a plain sleep.
+        """
+        if not self._armed:
+            await asyncio.sleep(seconds)
+            return True
+        if self.tripped:
+            return False
+        try:
+            await asyncio.wait_for(self._tripped.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            return True
+        return False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the gate state for the status API."""
+        return {
+            "entity": self.rain_entity,
+            "armed": self._armed,
+            "tripped": self.tripped,
+            "reason": self.reason,
+            "detail_mm": round(self.detail, 2) if self.detail is not None else None,
+            "tripped_at": self.tripped_at.isoformat() if self.tripped_at else None,
+            "expected_mm": round(self._expected, 2) if self._expected is not None else None,
+            "trips": self.trips,
+        }
@@ -0,0 +1,171 @@
+"""Retry backoff and circuit breaking for IrrigationPro weather sources."""
+from __future__ import annotations
+
+import logging
+import random
+import time
+from datetime import timedelta
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the source's circuit is open."""
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter and an upper bound.
+
+    The n-th consecutive failure waits ``base * factor ** (n - 1)`` seconds,
+    capped at ``max_interval`` and spread by ``±jitter`` so that several
+    instances do not retry in lockstep.
+    """
+
+    def __init__(
+        self,
+        base: float,
+        max_interval: float,
+        factor: float = 2.0,
+        jitter: float = 0.2,
+    ) -> None:
+        """Initialize the policy."""
+        self.base = base
+        self.max_interval = max_interval
+        self.factor = factor
+        self.jitter = jitter
+        self.attempts = 0
+        self.last_delay: float | None = None
+
+    def next_delay(self) -> timedelta:
+        """Record a failure and return how long to wait before retrying."""
+        self.attempts += 1
+        delay = min(self.base * self.factor ** (self.attempts - 1), self.max_interval)
+        delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        self.last_delay = min(delay, self.max_interval)
+        return timedelta(seconds=self.last_delay)
+
+    def reset(self) -> None:
+        """Forget past failures after a success."""
+        self.attempts = 0
+        self.last_delay = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the policy state for the status API."""
+        return {
+            "attempts": self.attempts,
+            "last_delay_s": round(self.last_delay) if self.last_delay is not None else None,
+            "max_interval_s": self.max_interval,
+        }
+
+
+class CircuitBreaker:
+    """Per-source circuit breaker (closed → open → half-open → closed).
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are refused for ``reset_timeout`` seconds. Then a single probe is
+    let through (half-open): success closes the circuit, failure opens it
+    again for twice as long, up to ``max_reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        max_reset_timeout: float,
+    ) -> None:
+        """Initialize the breaker."""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened = 0
+        self._open_for = reset_timeout
+        self._opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        """Return True if a call may be made now.
+
+        While half-open only the probe is let through; other callers are
+        refused until it has succeeded or failed.
+        """
+        if self.state == STATE_OPEN:
+            if time.monotonic() - self._opened_at < self._open_for:
+                return False
+            self.state = STATE_HALF_OPEN
+            _LOGGER.debug("Circuit for %s half-open, probing", self.name)
+        if self.state == STATE_HALF_OPEN:
+            if self._probing:
+                return False
+            self._probing = True
+        return True
+
+    def release(self) -> None:
+        """Forget a call that ended without an outcome (cancelled).
+
+        A cancelled probe lets the next caller probe instead.
+        """
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self.state != STATE_CLOSED:
+            _LOGGER.info("Weather source %s recovered, circuit closed", self.name)
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self._open_for = self.reset_timeout
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed call and open the circuit if needed."""
+        self.failures += 1
+        self._probing = False
+        if self.state == STATE_HALF_OPEN:
+            self._open_for = min(self._open_for * 2, self.max_reset_timeout)
+            self._open()
+        elif self.state == STATE_CLOSED and self.failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        """Refuse calls for the current open period."""
+        if self.state == STATE_CLOSED:
+            _LOGGER.warning(
+                "Weather source %s failed %d times, pausing it for %d min",
+                self.name,
+                self.failures,
+                self._open_for // 60,
+            )
+        else:
+            # Failed probes would otherwise warn once per open period
+            _LOGGER.debug(
+                "Weather source %s still failing, pausing it for %d min",
+                self.name,
+                self._open_for // 60,
+            )
+        self.state = STATE_OPEN
+        self.opened += 1
+        self._opened_at = time.monotonic()
+
+    def retry_in(self) -> float | None:
+        """Return seconds until the next probe while open."""
+        if self.state != STATE_OPEN:
+            return None
+        return max(0.0, self._open_for - (time.monotonic() - self._opened_at))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for the status API."""
+        retry_in = self.retry_in()
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "opened": self.opened,
+            "retry_in_s": round(retry_in) if retry_in is not None else None,
+        }
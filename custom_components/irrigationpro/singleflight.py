@@ -0,0 +1,73 @@
+"""Single-flight coalescing of concurrent async calls for IrrigationPro."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class SingleFlight:
+    """Let concurrent callers with the same key share one in-flight call.
+
+    While a call for a key is running, further callers await the same task
+    instead of starting their own. With a coalescing ``window`` (seconds),
+    callers arriving shortly after a successful call also reuse its result.
+    Failures are never reused.
+    """
+
+    def __init__(self, name: str, window: float = 0.0) -> None:
+        """Initialize the coalescer."""
+        self.name = name
+        self.window = window
+        self.calls = 0
+        self.merged = 0
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._recent: dict[Hashable, tuple[float, Any]] = {}
+
+    def stats(self) -> dict[str, int]:
+        """Return call and merge counters for diagnostics."""
+        return {"calls": self.calls, "merged": self.merged}
+
+    def forget(self, key: Hashable | None = None) -> None:
+        """Drop remembered results so the next call runs again."""
+        if key is None:
+            self._recent.clear()
+        else:
+            self._recent.pop(key, None)
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[_T]]) -> _T:
+        """Run ``factory()`` once per key and return its result to all callers."""
+        self.calls += 1
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.merged += 1
+            _LOGGER.debug("%s: joining in-flight call for %s", self.name, key)
+            return await asyncio.shield(inflight)
+
+        recent = self._recent.get(key)
+        if recent is not None and time.monotonic() - recent[0] < self.window:
+            self.merged += 1
+            _LOGGER.debug("%s: reusing result from %.1fs ago", self.name, time.monotonic() - recent[0])
+            return recent[1]
+
+        future: asyncio.Future = asyncio.ensure_future(factory())
+        self._inflight[key] = future
+        # The shared task outlives a cancelled caller, so it cleans up itself
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        """Retire a finished shared task and remember its result."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        if self.window > 0:
+            self._recent[key] = (time.monotonic(), future.result())
@@ -0,0 +1,424 @@
+"""Local weather-station ingestion for IrrigationPro.
+
+Subscribes to on-site HA sensor entities and keeps one streaming
+accumulator per quantity for the current day. Every state change costs
+O(1) time and memory; no recorder queries or history scans are made. At
+midnight the accumulators are closed into a measured ``WeatherData`` for
+the finished day and restarted with the last reading carried over.
+"""
+from __future__ import annotations
+
+import logging
+from collections import deque
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_change,
+)
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_SOLAR_RADIATION
+from .eto import (
+    METHOD_PENMAN_MONTEITH,
+    atmospheric_pressure,
+    get_radiation_table,
+    monthly_solar_radiation,
+    select_eto_method,
+    solar_table_configured,
+)
+from .weather_provider import WeatherData, _sunrise
+
+_LOGGER = logging.getLogger(__name__)
+
+# Station quantities (keys of the sensor mapping)
+STATION_TEMPERATURE = "temperature"
+STATION_HUMIDITY = "humidity"
+STATION_WIND_SPEED = "wind_speed"
+STATION_PRESSURE = "pressure"
+STATION_SOLAR_RADIATION = "solar_radiation"
+# Only used by the statistics importer (history.py)
+STATION_RAIN = "rain"
+
+# Unit conversions to the units used by WeatherData and eto.py
+_UNIT_CONVERSIONS: dict[str, Callable[[float], float]] = {
+    "°F": lambda value: (value - 32) * 5 / 9,
+    "K": lambda value: value - 273.15,
+    "km/h": lambda value: value / 3.6,
+    "mph": lambda value: value * 0.44704,
+    "kn": lambda value: value * 0.514444,
+    "kPa": lambda value: value * 10,
+    "Pa": lambda value: value / 100,
+    "inHg": lambda value: value * 33.8639,
+    "mmHg": lambda value: value * 1.33322,
+    "psi": lambda value: value * 68.9476,
+}
+
+# Joule per m² in one kWh per m²
+_J_PER_KWH = 3.6e6
+
+# Measured days kept in memory
+OBSERVED_DAYS_KEPT = 7
+
+# Share of a day a sensor must have covered for a measured day; after a
+# restart or a sensor outage the partial day is left to the history import
+MIN_DAY_COVERAGE = 0.9
+
+
+def observed_weather(
+    hass: HomeAssistant,
+    day: date,
+    min_temp: float,
+    max_temp: float,
+    values: dict[str, float],
+    solar_radiation: float | None = None,
+    monthly_solar: dict | None = None,
+    rain: float | None = None,
+) -> WeatherData:
+    """Build a measured day record and compute its actual ETo.
+
+    ``values`` holds the measured humidity, wind speed and pressure means;
+    missing ones are listed in ``estimated`` and the ETo method is chosen
+    accordingly. Without measured radiation (kWh/m²) the configured
+    monthly value is used; like for forecast days it only counts as solar
+    data if the table differs from the defaults.
+    """
+    estimated = {
+        field for field in ("humidity", "wind_speed", "pressure") if field not in values
+    }
+    estimated.add("clouds")
+    if rain is None:
+        estimated.add("rain")
+
+    config = hass.config
+    sunrise = _sunrise(day, config.latitude, config.longitude, str(dt_util.DEFAULT_TIME_ZONE))
+    if sunrise is None:
+        sunrise = dt_util.start_of_local_day(day) + timedelta(hours=6)
+
+    available = {"min_temp", "max_temp", "humidity", "wind_speed"} - estimated
+    if solar_radiation is None:
+        estimated.add("solar_radiation")
+        if solar_table_configured(monthly_solar, DEFAULT_SOLAR_RADIATION):
+            available.add("solar_radiation")
+        solar_radiation = monthly_solar_radiation(
+            monthly_solar, sunrise.month, DEFAULT_SOLAR_RADIATION[sunrise.month]
+        )
+    else:
+        available.add("solar_radiation")
+    method = select_eto_method(available)
+
+    weather = WeatherData(
+        sunrise=sunrise,
+        min_temp=min_temp,
+        max_temp=max_temp,
+        rain=rain or 0.0,
+        summary="observed",
+        condition="observed",
+        eto_method=method.name if method else METHOD_PENMAN_MONTEITH,
+        estimated=frozenset(estimated),
+        **values,
+    )
+    if method is None:
+        return weather
+    eto = method.func(
+        min_temp=min_temp,
+        max_temp=max_temp,
+        humidity=weather.humidity,
+        pressure=(
+            atmospheric_pressure(config.elevation)
+            if "pressure" in estimated else weather.pressure
+        ),
+        wind_speed=weather.wind_speed,
+        solar_radiation=solar_radiation or 0.0,
+        altitude=config.elevation,
+        latitude=config.latitude,
+        date=sunrise,
+        radiation_table=get_radiation_table(config.latitude, config.elevation),
+    )
+    return weather._replace(eto=eto)
+
+
+class DailyAccumulator:
+    """O(1) streaming min / max / time-weighted mean / time integral.
+
+    Sensor values are treated as held until the next reading, so the
+    integral of a pyranometer (W/m²) is the day's radiation in J/m² and
+    the mean is not biased by sensors that report more often when the
+    value changes quickly.
+    """
+
+    __slots__ = (
+        "minimum",
+        "maximum",
+        "count",
+        "integral",
+        "seconds",
+        "_last_value",
+        "_last_time",
+    )
+
+    def __init__(self, start: datetime | None = None, value: float | None = None) -> None:
+        """Start empty, or seeded with a value held since ``start``."""
+        self.minimum: float | None = value
+        self.maximum: float | None = value
+        self.count = 0
+        self.integral = 0.0
+        self.seconds = 0.0
+        self._last_value = value
+        self._last_time = start if value is not None else None
+
+    def _advance(self, when: datetime) -> None:
+        """Integrate the held value up to ``when``."""
+        if self._last_time is None or self._last_value is None:
+            return
+        elapsed = (when - self._last_time).total_seconds()
+        if elapsed > 0:
+            self.integral += self._last_value * elapsed
+            self.seconds += elapsed
+            self._last_time = when
+
+    def add(self, value: float, when: datetime) -> None:
+        """Add one reading taken at ``when``."""
+        self._advance(when)
+        self.count += 1
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        self._last_value = value
+        self._last_time = when
+
+    def interrupt(self, when: datetime) -> None:
+        """Stop holding the last value at ``when`` (sensor unavailable)."""
+        self._advance(when)
+        self._last_time = None
+
+    def close(self, end: datetime) -> DailyAccumulator:
+        """Integrate up to ``end`` and return the accumulator for the next period."""
+        self._advance(end)
+        if self._last_time is None:
+            return DailyAccumulator()
+        return DailyAccumulator(end, self._last_value)
+
+    def coverage(self, seconds: float) -> float:
+        """Return the share of a period of ``seconds`` covered by readings."""
+        return self.seconds / seconds if seconds > 0 else 0.0
+
+    @property
+    def has_data(self) -> bool:
+        """Return True if there is at least one value for this period."""
+        return self._last_value is not None
+
+    @property
+    def mean(self) -> float | None:
+        """Return the time-weighted mean (last value if no time has passed)."""
+        if self.seconds > 0:
+            return self.integral / self.seconds
+        return self._last_value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the running statistics for the status API."""
+        mean = self.mean
+        return {
+            "min": round(self.minimum, 2) if self.minimum is not None else None,
+            "max": round(self.maximum, 2) if self.maximum is not None else None,
+            "mean": round(mean, 2) if mean is not None else None,
+            "samples": self.count,
+        }
+
+
+class WeatherStation:
+    """"Observed today" source fed by local HA sensor entities."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        sensors: dict[str, str],
+        monthly_solar: dict | None = None,
+        on_day_complete: Callable[[WeatherData], None] | None = None,
+    ) -> None:
+        """Initialize the station for ``{quantity: entity_id}`` sensors.
+
+        ``monthly_solar`` is the configured solar radiation per month, used
+        for Penman-Monteith when no pyranometer is configured.
+        """
+        self.hass = hass
+        self.monthly_solar = monthly_solar
+        self.sensors = {quantity: entity for quantity, entity in sensors.items() if entity}
+        self._entity_quantity = {entity: quantity for quantity, entity in self.sensors.items()}
+        self._on_day_complete = on_day_complete
+        self._day: date = dt_util.now().date()
+        self._accumulators: dict[str, DailyAccumulator] = {
+            quantity: DailyAccumulator() for quantity in self.sensors
+        }
+        self.observed: deque[WeatherData] = deque(maxlen=OBSERVED_DAYS_KEPT)
+        self._unsubs: list[Callable[[], None]] = []
+
+    @property
+    def configured(self) -> bool:
+        """Return True if at least a temperature sensor is configured."""
+        return STATION_TEMPERATURE in self.sensors
+
+    @callback
+    def async_start(self) -> None:
+        """Seed from the current states and subscribe to changes."""
+        if not self.sensors:
+            return
+        now = dt_util.now()
+        for entity_id in self.sensors.values():
+            self._add_state(entity_id, self.hass.states.get(entity_id), now)
+        self._unsubs.append(
+            async_track_state_change_event(
+                self.hass, list(self.sensors.values()), self._handle_state_change
+            )
+        )
+        self._unsubs.append(
+            async_track_time_change(
+                self.hass, self._handle_midnight, hour=0, minute=0, second=0
+            )
+        )
+        _LOGGER.debug("Weather station started with sensors %s", self.sensors)
+
+    @callback
+    def async_stop(self) -> None:
+        """Unsubscribe from all sensor and timer events."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        """Feed one sensor state change into its accumulator."""
+        new_state = event.data.get("new_state")
+        when = new_state.last_updated if new_state is not None else dt_util.utcnow()
+        when = dt_util.as_local(when)
+        if when.date() > self._day:
+            self._rollover(when)
+        elif when.date() < self._day:
+            # Stamped before the last rollover: the finished day stays closed,
+            # the reading counts as the sensor's current value
+            when = dt_util.now()
+        self._add_state(event.data["entity_id"], new_state, when)
+
+    @callback
+    def _handle_midnight(self, now: datetime) -> None:
+        """Close the day even if no sensor reported since midnight."""
+        if now.date() > self._day:
+            self._rollover(now)
+
+    def _add_state(self, entity_id: str, state, when: datetime) -> None:
+        """Convert a state to the internal unit and accumulate it."""
+        quantity = self._entity_quantity.get(entity_id)
+        if quantity is None:
+            return
+        try:
+            value = float(state.state)
+        except (AttributeError, TypeError, ValueError):
+            # Unavailable or removed: the last reading no longer counts
+            self._accumulators[quantity].interrupt(when)
+            return
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if unit in _UNIT_CONVERSIONS:
+            value = _UNIT_CONVERSIONS[unit](value)
+        self._accumulators[quantity].add(value, when)
+
+    def _rollover(self, now: datetime) -> None:
+        """Close the finished day and start accumulating the new one."""
+        midnight = dt_util.start_of_local_day(now)
+        finished = self._accumulators
+        self._accumulators = {
+            quantity: accumulator.close(midnight) for quantity, accumulator in finished.items()
+        }
+        finished_day = self._day
+        self._day = now.date()
+
+        weather = self.measured_day(finished_day, finished)
+        if weather is None:
+            return
+        self.observed.append(weather)
+        _LOGGER.debug(
+            "Observed %s: temp=%.1f-%.1f°C, humidity=%.0f%%, estimated=%s",
+            finished_day,
+            weather.min_temp,
+            weather.max_temp,
+            weather.humidity,
+            sorted(weather.estimated),
+        )
+        if self._on_day_complete is not None:
+            self._on_day_complete(weather)
+
+    def measured_day(
+        self, day: date, accumulators: dict[str, DailyAccumulator] | None = None
+    ) -> WeatherData | None:
+        """Build the measured record with actual ETo for ``day``.
+
+        Returns None without temperature readings or if they cover less
+        than ``MIN_DAY_COVERAGE`` of the day, since min/max would only
+        reflect part of it. Quantities without a sensor or readings are
+        listed in ``estimated`` and the ETo method is chosen accordingly;
+        partly measured radiation falls back to the monthly value. Rain is
+        not measured by the station.
+        """
+        accumulators = self._accumulators if accumulators is None else accumulators
+        temperature = accumulators.get(STATION_TEMPERATURE)
+        if temperature is None or not temperature.has_data:
+            return None
+        start = dt_util.start_of_local_day(day)
+        day_seconds = (dt_util.start_of_local_day(day + timedelta(days=1)) - start).total_seconds()
+        if temperature.coverage(day_seconds) < MIN_DAY_COVERAGE:
+            _LOGGER.debug(
+                "Temperature covers only %.0f%% of %s, not recording a measured day",
+                temperature.coverage(day_seconds) * 100,
+                day,
+            )
+            return None
+
+        values: dict[str, float] = {}
+        for quantity, field in (
+            (STATION_HUMIDITY, "humidity"),
+            (STATION_WIND_SPEED, "wind_speed"),
+            (STATION_PRESSURE, "pressure"),
+        ):
+            accumulator = accumulators.get(quantity)
+            if accumulator is not None and accumulator.has_data:
+                values[field] = accumulator.mean
+
+        return observed_weather(
+            self.hass,
+            day,
+            temperature.minimum,
+            temperature.maximum,
+            values,
+            solar_radiation=self._solar_radiation(accumulators, day_seconds),
+            monthly_solar=self.monthly_solar,
+        )
+
+    def _solar_radiation(
+        self, accumulators: dict[str, DailyAccumulator], day_seconds: float | None = None
+    ) -> float | None:
+        """Return the integrated pyranometer radiation in kWh/m², if measured.
+
+        With ``day_seconds`` the integral must cover ``MIN_DAY_COVERAGE`` of
+        the day; a partial integral would understate the day's radiation.
+        """
+        radiation = accumulators.get(STATION_SOLAR_RADIATION)
+        if radiation is None or radiation.seconds <= 0:
+            return None
+        if day_seconds is not None and radiation.coverage(day_seconds) < MIN_DAY_COVERAGE:
+            return None
+        return radiation.integral / _J_PER_KWH
+
+    def today(self) -> dict[str, Any]:
+        """Return the running statistics of the current day."""
+        radiation = self._solar_radiation(self._accumulators)
+        return {
+            "date": self._day.isoformat(),
+            "solar_radiation": round(radiation, 3) if radiation is not None else None,
+            "sensors": {
+                quantity: accumulator.as_dict()
+                for quantity, accumulator in self._accumulators.items()
+            },
+        }
@@ -0,0 +1,77 @@
+"""Prefix-sum water-balance index for IrrigationPro.
+
+ETo and rain of a forecast are accumulated once into prefix sums, so the
+total of any window of days is the difference of two entries. For every
+zone calendar a table of "days until the next allowed day" is built once
+per forecast as well. The scheduler, the test simulation and
+the status API all read window totals from the same index.
+"""
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate
+from typing import Any
+
+from .const import WEEKDAYS
+from .weather_provider import ForecastSeries
+from .zone_calendar import ZoneCalendar
+
+# Longest watering window: the same weekday comes back after a week
+MAX_WINDOW_DAYS = 7
+
+
+class WaterBalanceIndex:
+    """O(1) ETo / rain window sums and next-watering-day lookups."""
+
+    __slots__ = ("forecast", "dates", "weekdays", "_eto", "_rain", "_next_day")
+
+    def __init__(self, forecast: ForecastSeries) -> None:
+        """Build the prefix sums for ``forecast``."""
+        self.forecast = forecast
+        self.dates = forecast.dates()
+        self.weekdays = tuple(WEEKDAYS[day.weekday()] for day in self.dates)
+        # _eto[i] is the ETo of days 0 .. i - 1
+        self._eto = array("d", accumulate(forecast.column("eto"), initial=0.0))
+        self._rain = array("d", accumulate(forecast.column("rain"), initial=0.0))
+        self._next_day: dict[tuple, tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of forecast days."""
+        return len(self.weekdays)
+
+    def eto(self, start: int, stop: int) -> float:
+        """Return the ETo of days ``start``..``stop - 1``."""
+        return self._eto[stop] - self._eto[start]
+
+    def rain(self, start: int, stop: int) -> float:
+        """Return the rain of days ``start``..``stop - 1``."""
+        return self._rain[stop] - self._rain[start]
+
+    def days_until_next(self, calendar: ZoneCalendar, day_index: int) -> int:
+        """Return the days from ``day_index`` to the next allowed day.
+
+        Falls back to 1 when the next allowed day lies beyond the forecast.
+        """
+        table = self._next_day.get(calendar.key)
+        if table is None:
+            table = self._next_day[calendar.key] = self._build_next_day(calendar)
+        return table[day_index]
+
+    def _build_next_day(self, calendar: ZoneCalendar) -> tuple[int, ...]:
+        """Scan the forecast backwards once to fill the lookup table."""
+        table = [1] * len(self.dates)
+        next_allowed: int | None = None
+        for index in range(len(self.dates) - 1, -1, -1):
+            if next_allowed is not None and next_allowed - index <= MAX_WINDOW_DAYS:
+                table[index] = next_allowed - index
+            if calendar.allows(self.dates[index]):
+                next_allowed = index
+        return tuple(table)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cumulative sums for the status API."""
+        return {
+            "dates": [day.isoformat() for day in self.dates],
+            "eto_cumulative": [round(value, 3) for value in self._eto[1:]],
+            "rain_cumulative": [round(value, 3) for value in self._rain[1:]],
+        }
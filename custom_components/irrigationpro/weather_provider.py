@@ -1,37 +1,436 @@
 """Weather data provider for IrrigationPro."""
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any
+import statistics
+import time
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, NamedTuple, overload
 
-import aiohttp
 from astral import LocationInfo
 from astral.sun import sun as astral_sun
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_RESET_SECONDS,
+    BREAKER_RESET_SECONDS,
+    FUSION_MEDIAN,
+    FUSION_WEIGHTED,
+    SOURCE_DEADLINE_SECONDS,
+)
+from .http_client import async_get_http_client
+from .retry import CircuitBreaker, CircuitOpenError
+
 _LOGGER = logging.getLogger(__name__)
 
 OWM_API_URL = "https://api.openweathermap.org/data/3.0/onecall"
 
+# WeatherData field -> HA forecast key, used to flag substituted defaults
+_HA_FORECAST_FIELDS = {
+    "min_temp": "templow",
+    "max_temp": "temperature",
+    "humidity": "humidity",
+    "pressure": "pressure",
+    "wind_speed": "wind_speed",
+}
+
+
+class WeatherData(NamedTuple):
+    """Immutable weather record for one forecast day."""
+
+    sunrise: datetime | None = None
+    min_temp: float = 0
+    max_temp: float = 0
+    humidity: float = 0
+    pressure: float = 0
+    wind_speed: float = 0
+    rain: float = 0
+    clouds: float = 0
+    summary: str = ""
+    condition: str = ""
+    eto: float = 0
+    eto_method: str = ""
+    # Inputs that were missing in the source and replaced by estimates
+    estimated: frozenset[str] = frozenset()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy for persistent storage."""
+        data = self._asdict()
+        data["sunrise"] = self.sunrise.isoformat() if self.sunrise else None
+        data["estimated"] = sorted(self.estimated)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WeatherData:
+        """Rebuild weather data stored with ``as_dict``."""
+        values = {field: data[field] for field in cls._fields if field in data}
+        values["sunrise"] = (
+            dt_util.parse_datetime(data["sunrise"]) if data.get("sunrise") else None
+        )
+        values["estimated"] = frozenset(data.get("estimated", ()))
+        return cls(**values)
+
+
+# WeatherData fields stored column-wise as float arrays in ForecastSeries
+_NUMERIC_COLUMNS = frozenset(
+    ("min_temp", "max_temp", "humidity", "pressure", "wind_speed", "rain", "clouds", "eto")
+)
+
+
+class ForecastSeries:
+    """Immutable forecast of consecutive days, stored column-wise.
+
+    Numeric fields live in ``array('d')`` columns and are handed out as
+    read-only memoryviews, so window sums and vectorized code (``numpy``
+    accepts them without copying) never touch per-day objects. Indexing
+    still yields ``WeatherData`` records for code that wants a whole day.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self, days: Iterable[WeatherData] = ()):
+        """Build the columns from day records."""
+        rows = list(days)
+        columns: dict[str, Any] = {}
+        for index, field in enumerate(WeatherData._fields):
+            if field in _NUMERIC_COLUMNS:
+                columns[field] = array("d", (float(row[index]) for row in rows))
+            else:
+                columns[field] = tuple(row[index] for row in rows)
+        self._columns = columns
+        self._length = len(rows)
+
+    @classmethod
+    def _from_columns(cls, columns: dict[str, Any], length: int) -> ForecastSeries:
+        """Wrap existing columns without copying them."""
+        series = cls.__new__(cls)
+        series._columns = columns
+        series._length = length
+        return series
+
+    def __len__(self) -> int:
+        """Return the number of days."""
+        return self._length
+
+    def __iter__(self) -> Iterator[WeatherData]:
+        """Iterate over the days as records."""
+        return map(
+            WeatherData._make,
+            zip(*(self._columns[field] for field in WeatherData._fields)),
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> WeatherData: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ForecastSeries: ...
+
+    def __getitem__(self, index):
+        """Return one day as a record, or a sub-series for a slice."""
+        if isinstance(index, slice):
+            columns = {field: column[index] for field, column in self._columns.items()}
+            return self._from_columns(columns, len(range(self._length)[index]))
+        return WeatherData._make(
+            self._columns[field][index] for field in WeatherData._fields
+        )
+
+    def column(self, field: str) -> memoryview | tuple:
+        """Return a whole column (read-only memoryview for numeric fields)."""
+        column = self._columns[field]
+        if field in _NUMERIC_COLUMNS:
+            return memoryview(column).toreadonly()
+        return column
+
+    def eto_slice(self, start: int, stop: int) -> memoryview:
+        """Return the ETo values of days ``start``..``stop - 1``."""
+        return self.column("eto")[start:stop]
+
+    def rain_slice(self, start: int, stop: int) -> memoryview:
+        """Return the rain values of days ``start``..``stop - 1``."""
+        return self.column("rain")[start:stop]
+
+    def with_eto(self, eto: Sequence[float], methods: Sequence[str]) -> ForecastSeries:
+        """Return a copy with new ETo values; all other columns are shared."""
+        if len(eto) != self._length or len(methods) != self._length:
+            raise ValueError("ETo columns must match the forecast length")
+        columns = dict(self._columns)
+        columns["eto"] = array("d", eto)
+        columns["eto_method"] = tuple(methods)
+        return self._from_columns(columns, self._length)
+
+    def dates(self) -> tuple[date, ...]:
+        """Return the local date of every day."""
+        return tuple(sunrise.date() for sunrise in self._columns["sunrise"])
+
+    def changed_days(
+        self, previous: ForecastSeries, fields: Iterable[str]
+    ) -> dict[int, frozenset[str]]:
+        """Diff against ``previous`` per day (matched by date) and field.
+
+        Returns ``{index: changed fields}`` for the days of this series that
+        are missing from ``previous`` or differ in any of ``fields``; days
+        that are identical are left out.
+        """
+        fields = tuple(fields)
+        previous_index = {day: index for index, day in enumerate(previous.dates())}
+        changed: dict[int, frozenset[str]] = {}
+        for index, day in enumerate(self.dates()):
+            other = previous_index.get(day)
+            if other is None:
+                changed[index] = frozenset(fields)
+                continue
+            differ = frozenset(
+                field
+                for field in fields
+                if self._columns[field][index] != previous._columns[field][other]
+            )
+            if differ:
+                changed[index] = differ
+        return changed
+
+
+# Numeric WeatherData fields combined across sources
+_FUSED_FIELDS = (
+    "min_temp",
+    "max_temp",
+    "humidity",
+    "pressure",
+    "wind_speed",
+    "rain",
+    "clouds",
+)
+
+# Smoothing factor for the per-source moving average latency
+LATENCY_EWMA_ALPHA = 0.2
 
-class WeatherData:
-    """Weather data container."""
+
+class SourceStats:
+    """Latency and failure counters for one weather source."""
 
     def __init__(self):
-        """Initialize weather data."""
-        self.sunrise: datetime | None = None
-        self.min_temp: float = 0
-        self.max_temp: float = 0
-        self.humidity: float = 0
-        self.pressure: float = 0
-        self.wind_speed: float = 0
-        self.rain: float = 0
-        self.clouds: float = 0
-        self.summary: str = ""
-        self.condition: str = ""
-        self.eto: float = 0
+        """Initialize counters."""
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.last_latency_ms: float | None = None
+        self.avg_latency_ms: float | None = None
+        self.last_error: str | None = None
+
+    def record(self, latency: float, error: BaseException | None = None) -> None:
+        """Record one fetch that took ``latency`` seconds."""
+        latency_ms = latency * 1000
+        self.calls += 1
+        self.last_latency_ms = latency_ms
+        if self.avg_latency_ms is None:
+            self.avg_latency_ms = latency_ms
+        else:
+            self.avg_latency_ms += LATENCY_EWMA_ALPHA * (latency_ms - self.avg_latency_ms)
+        if error is not None:
+            self.failures += 1
+            if isinstance(error, asyncio.TimeoutError):
+                self.timeouts += 1
+            self.last_error = str(error) or type(error).__name__
+
+    @property
+    def reliability(self) -> float:
+        """Return the share of successful fetches (1.0 before the first call)."""
+        if not self.calls:
+            return 1.0
+        return (self.calls - self.failures) / self.calls
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for the status API."""
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "last_latency_ms": (
+                round(self.last_latency_ms, 1) if self.last_latency_ms is not None else None
+            ),
+            "avg_latency_ms": (
+                round(self.avg_latency_ms, 1) if self.avg_latency_ms is not None else None
+            ),
+            "last_error": self.last_error,
+        }
+
+
+def _fuse_values(values: list[tuple[float, float]], method: str) -> float:
+    """Combine (value, weight) pairs with the median or a weighted mean."""
+    if method == FUSION_WEIGHTED:
+        total = sum(weight for _, weight in values)
+        if total > 0:
+            return sum(value * weight for value, weight in values) / total
+    return statistics.median(value for value, _ in values)
+
+
+def fuse_forecasts(
+    forecasts: Mapping[str, ForecastSeries],
+    method: str = FUSION_MEDIAN,
+    weights: Mapping[str, float] | None = None,
+) -> ForecastSeries:
+    """Fuse per-source forecasts day by day, matched by date.
+
+    Sources are aligned on the sunrise date, so a source whose first day
+    is still yesterday is not mixed with another source's today. Days only
+    one source covers are taken from it unchanged. Values a source only
+    estimated are ignored as long as another source measured them. Sunrise
+    and condition are taken from the first source that covers the day.
+    """
+    weights = weights or {}
+    by_date: dict[date, list[tuple[str, WeatherData]]] = {}
+    for name, days in forecasts.items():
+        for index, when in enumerate(days.dates()):
+            by_date.setdefault(when, []).append((name, days[index]))
+
+    fused: list[WeatherData] = []
+    for when in sorted(by_date):
+        covering = by_date[when]
+        base = covering[0][1]
+        if len(covering) == 1:
+            fused.append(base)
+            continue
+        values: dict[str, float] = {}
+        estimated: set[str] = set()
+        for field in _FUSED_FIELDS:
+            pairs = [
+                (getattr(day, field), weights.get(name, 1.0))
+                for name, day in covering
+                if field not in day.estimated
+            ]
+            if not pairs:
+                pairs = [(getattr(day, field), weights.get(name, 1.0)) for name, day in covering]
+                estimated.add(field)
+            values[field] = _fuse_values(pairs, method)
+        fused.append(
+            WeatherData(
+                sunrise=base.sunrise,
+                summary=base.summary,
+                condition=base.condition,
+                estimated=frozenset(estimated),
+                **values,
+            )
+        )
+    return ForecastSeries(fused)
+
+
+# Sunrise cache size: covers the 400-day precompute plus some headroom
+SUNRISE_CACHE_SIZE = 512
+SUNRISE_PRECOMPUTE_DAYS = 400
+
+
+@lru_cache(maxsize=SUNRISE_CACHE_SIZE)
+def _sunrise(day: date, latitude: float, longitude: float, tz_name: str) -> datetime | None:
+    """Return the sunrise for a day and location, or None if the sun does not rise."""
+    tzinfo = dt_util.get_time_zone(tz_name)
+    location = LocationInfo(latitude=latitude, longitude=longitude, timezone=tz_name)
+    try:
+        return astral_sun(location.observer, date=day, tzinfo=tzinfo)["sunrise"]
+    except Exception:
+        return None
+
+
+def precompute_sunrises(
+    start: date, latitude: float, longitude: float, tz_name: str,
+    days: int = SUNRISE_PRECOMPUTE_DAYS,
+) -> None:
+    """Fill the sunrise cache for ``days`` days from ``start`` (executor job)."""
+    for offset in range(days):
+        _sunrise(start + timedelta(days=offset), latitude, longitude, tz_name)
+
+
+def _value(forecast_day: dict[str, Any], key: str, default: float) -> float:
+    """Return a numeric forecast value, ``default`` if missing or null."""
+    value = forecast_day.get(key)
+    return default if value is None else value
+
+
+def _payload_hash(payload: Any) -> int:
+    """Return a content hash of a raw forecast payload."""
+    return hash(json.dumps(payload, sort_keys=True, default=str))
+
+
+class HourlyWeather(NamedTuple):
+    """Single forecast hour used for hourly ETo and the rain gate.
+
+    Humidity, pressure and wind speed are None if the source lacks them.
+    """
+
+    start: datetime
+    temp: float
+    humidity: float | None
+    pressure: float | None
+    wind_speed: float | None
+    clouds: float | None
+    rain: float = 0.0
+
+
+def _iter_ha_hourly(forecast: list[dict[str, Any]], hours: int) -> Iterator[HourlyWeather]:
+    """Lazily convert HA hourly forecast entries to HourlyWeather."""
+    for entry in forecast[:hours]:
+        start = entry.get("datetime")
+        if isinstance(start, str):
+            start = dt_util.parse_datetime(start)
+        temp = entry.get("temperature")
+        if start is None or temp is None:
+            continue
+        yield HourlyWeather(
+            start=start,
+            temp=temp,
+            humidity=entry.get("humidity"),
+            pressure=entry.get("pressure"),
+            wind_speed=entry.get("wind_speed"),
+            clouds=entry.get("cloud_coverage"),
+            rain=entry.get("precipitation") or 0.0,
+        )
+
+
+def _iter_owm_hourly(hourly: list[dict[str, Any]], hours: int) -> Iterator[HourlyWeather]:
+    """Lazily convert the OWM One Call hourly block to HourlyWeather."""
+    for entry in hourly[:hours]:
+        yield HourlyWeather(
+            start=datetime.fromtimestamp(entry["dt"], tz=dt_util.DEFAULT_TIME_ZONE),
+            temp=entry["temp"],
+            humidity=entry["humidity"],
+            pressure=entry["pressure"],
+            wind_speed=entry["wind_speed"],
+            clouds=entry.get("clouds"),
+            rain=entry.get("rain", {}).get("1h", 0.0),
+        )
+
+
+def parse_owm_daily(daily: Sequence[dict[str, Any]], days: int) -> list[WeatherData]:
+    """Parse the ``daily`` block of a One Call 3.0 response."""
+    forecast_data = []
+    for i, day in enumerate(daily[:days]):
+        weather = WeatherData(
+            sunrise=datetime.fromtimestamp(day["sunrise"], tz=dt_util.DEFAULT_TIME_ZONE),
+            min_temp=day["temp"]["min"],
+            max_temp=day["temp"]["max"],
+            humidity=day["humidity"],
+            pressure=day["pressure"],
+            wind_speed=day["wind_speed"],
+            rain=day.get("rain", 0),
+            clouds=day["clouds"],
+            summary=day["weather"][0]["description"],
+            condition=day["weather"][0].get("main", "unknown"),
+        )
+        forecast_data.append(weather)
+        _LOGGER.debug(
+            "Day %d (OWM): temp=%s-%s°C, humidity=%s%%, rain=%smm",
+            i,
+            weather.min_temp,
+            weather.max_temp,
+            weather.humidity,
+            weather.rain,
+        )
+    return forecast_data
 
 
 class WeatherProvider:
@@ -43,33 +442,235 @@ class WeatherProvider:
         weather_entity: str | None = None,
         owm_api_key: str | None = None,
         use_owm: bool = False,
+        hourly_eto: bool = False,
+        parallel_sources: bool = False,
+        fusion_method: str = FUSION_MEDIAN,
+        owm_base_url: str | None = None,
     ):
-        """Initialize the weather provider."""
+        """Initialize the weather provider.
+
+        ``owm_base_url`` replaces the One Call endpoint, e.g. with the local
+        stand-in from ``tools/fake_owm_server.py``.
+        """
         self.hass = hass
         self.weather_entity = weather_entity
         self.owm_api_key = owm_api_key
         self.use_owm = use_owm
-        self._session: aiohttp.ClientSession | None = None
+        self.hourly_eto = hourly_eto
+        # Keep the OWM hourly block for the rain gate even without hourly ETo
+        self.keep_hourly = False
+        self.parallel_sources = parallel_sources
+        self.fusion_method = fusion_method
+        self.owm_base_url = owm_base_url or OWM_API_URL
+        self.source_stats: dict[str, SourceStats] = {}
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._http = async_get_http_client(hass)
+        self._owm_hourly: list[dict[str, Any]] = []
+        self._last_source: str | None = None
+        # Change detection per source: key of the last parsed payload and its result
+        self._cache: dict[str, tuple[tuple, ForecastSeries]] = {}
+        # Last fused forecast and the sources it was built from
+        self._fused_sources: tuple[str, ...] = ()
+        self._fused_forecast = ForecastSeries()
+        self.forecast_unchanged = False
+
+    def _sunrise_for(self, target_date: datetime) -> datetime:
+        """Return the (cached) sunrise for a day, 06:00 if there is none."""
+        sunrise = _sunrise(
+            target_date.date(),
+            self.hass.config.latitude,
+            self.hass.config.longitude,
+            str(dt_util.DEFAULT_TIME_ZONE),
+        )
+        if sunrise is None:
+            return target_date.replace(hour=6, minute=0, second=0, microsecond=0)
+        return sunrise
+
+    async def async_prime_sunrise_cache(self) -> None:
+        """Precompute upcoming sunrises in an executor so refreshes only do lookups."""
+        await self.hass.async_add_executor_job(
+            precompute_sunrises,
+            dt_util.now().date(),
+            self.hass.config.latitude,
+            self.hass.config.longitude,
+            str(dt_util.DEFAULT_TIME_ZONE),
+        )
+
+    def _cached(self, source: str, key: tuple) -> ForecastSeries | None:
+        """Return the previous forecast if ``key`` matches the source's last payload."""
+        cache_key, forecast = self._cache.get(source, (None, ForecastSeries()))
+        self.forecast_unchanged = key == cache_key and bool(forecast)
+        if self.forecast_unchanged:
+            _LOGGER.debug("Forecast from %s unchanged since last fetch, reusing parsed data", source)
+            return forecast
+        return None
+
+    def _store(self, source: str, key: tuple, days: list[WeatherData]) -> ForecastSeries:
+        """Build the series for freshly parsed days and remember it."""
+        forecast = ForecastSeries(days)
+        self._cache[source] = (key, forecast)
+        return forecast
+
+    def invalidate_cache(self) -> None:
+        """Force the next fetch to be parsed again."""
+        self._cache.clear()
+        self._fused_sources = ()
+        self._fused_forecast = ForecastSeries()
+        self.forecast_unchanged = False
+
+    async def _timed(self, source: str, coro, deadline: float | None = None):
+        """Await a source fetch, recording its latency and outcome.
+
+        Raises CircuitOpenError without calling the source while its
+        circuit breaker is open.
+        """
+        breaker = self.breakers.get(source)
+        if breaker is None:
+            breaker = self.breakers[source] = CircuitBreaker(
+                source,
+                BREAKER_FAILURE_THRESHOLD,
+                BREAKER_RESET_SECONDS,
+                BREAKER_MAX_RESET_SECONDS,
+            )
+        if not breaker.allow():
+            coro.close()
+            raise CircuitOpenError(f"circuit open for weather source {source}")
+
+        stats = self.source_stats.setdefault(source, SourceStats())
+        start = time.monotonic()
+        try:
+            if deadline is None:
+                result = await coro
+            else:
+                result = await asyncio.wait_for(coro, deadline)
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except Exception as err:
+            stats.record(time.monotonic() - start, err)
+            breaker.record_failure()
+            raise
+        stats.record(time.monotonic() - start)
+        breaker.record_success()
+        return result
+
+    async def async_get_forecast(self, days: int = 8) -> ForecastSeries:
+        """Get weather forecast for the next N days.
+
+        When the source payload did not change since the last call, the
+        previous list is returned unchanged and ``forecast_unchanged`` is set.
+        """
+        self.forecast_unchanged = False
+        if self.parallel_sources and self.weather_entity and self.owm_api_key:
+            return await self._get_fused_forecast(days)
 
-    async def async_get_forecast(self, days: int = 8) -> list[WeatherData]:
-        """Get weather forecast for the next N days."""
         if self.weather_entity and not self.use_owm:
             try:
-                return await self._get_ha_forecast(days)
+                forecast = await self._timed("ha", self._get_ha_forecast(days))
+                self._last_source = "ha"
+                return forecast
             except Exception as err:
-                _LOGGER.warning(
-                    "Failed to get weather from HA entity, trying OWM: %s", err
-                )
+                if not isinstance(err, CircuitOpenError):
+                    _LOGGER.warning(
+                        "Failed to get weather from HA entity, trying OWM: %s", err
+                    )
                 if self.owm_api_key:
-                    return await self._get_owm_forecast(days)
+                    forecast = await self._timed("owm", self._get_owm_forecast(days))
+                    self._last_source = "owm"
+                    return forecast
                 raise
 
         if self.owm_api_key and self.use_owm:
-            return await self._get_owm_forecast(days)
+            forecast = await self._timed("owm", self._get_owm_forecast(days))
+            self._last_source = "owm"
+            return forecast
 
         raise ValueError("No weather source configured")
 
-    async def _get_ha_forecast(self, days: int) -> list[WeatherData]:
+    async def _get_fused_forecast(self, days: int) -> ForecastSeries:
+        """Fetch all sources concurrently and fuse the ones answering in time.
+
+        Each source gets its own deadline, so a hanging entity cannot delay
+        the refresh beyond ``SOURCE_DEADLINE_SECONDS``.
+        """
+        fetchers = {"ha": self._get_ha_forecast, "owm": self._get_owm_forecast}
+        previous = {source: forecast for source, (_, forecast) in self._cache.items()}
+        results = await asyncio.gather(
+            *(
+                self._timed(source, fetch(days), SOURCE_DEADLINE_SECONDS)
+                for source, fetch in fetchers.items()
+            ),
+            return_exceptions=True,
+        )
+
+        forecasts: dict[str, ForecastSeries] = {}
+        for source, result in zip(fetchers, results):
+            if isinstance(result, CircuitOpenError):
+                _LOGGER.debug("Skipping weather source %s: %s", source, result)
+            elif isinstance(result, BaseException):
+                _LOGGER.warning(
+                    "Weather source %s failed: %s", source,
+                    str(result) or type(result).__name__,
+                )
+            else:
+                forecasts[source] = result
+        if not forecasts:
+            # An open circuit only repeats an earlier failure; report a real one
+            error = next(
+                (result for result in results if not isinstance(result, CircuitOpenError)),
+                results[0],
+            )
+            cause = next((result for result in results if result is not error), None)
+            raise error from cause
+
+        # Hourly ETo prefers the HA entity, OWM if only its block is fresh
+        self._last_source = "ha" if "ha" in forecasts else "owm"
+
+        sources = tuple(forecasts)
+        self.forecast_unchanged = (
+            sources == self._fused_sources
+            and bool(self._fused_forecast)
+            and all(forecasts[source] is previous.get(source) for source in sources)
+        )
+        if self.forecast_unchanged:
+            _LOGGER.debug("All weather sources unchanged, reusing fused forecast")
+            return self._fused_forecast
+
+        if len(forecasts) == 1:
+            fused = forecasts[sources[0]]
+        else:
+            weights = {
+                source: self.source_stats[source].reliability for source in sources
+            }
+            fused = fuse_forecasts(forecasts, self.fusion_method, weights)
+        self._fused_sources = sources
+        self._fused_forecast = fused
+        return fused
+
+    async def async_get_hourly_forecast(self, hours: int = 192) -> Iterator[HourlyWeather]:
+        """Return a lazy iterator over the hourly forecast of the last source.
+
+        The OWM hourly block is taken from the last daily fetch, so this never
+        costs an extra API call; it covers only the next 48 hours. For HA
+        entities the ``get_forecasts`` service is called with ``type: hourly``.
+        """
+        if self._last_source == "owm":
+            return _iter_owm_hourly(self._owm_hourly, hours)
+
+        if not self.weather_entity:
+            raise ValueError("No weather source configured")
+
+        response = await self.hass.services.async_call(
+            "weather",
+            "get_forecasts",
+            {"entity_id": self.weather_entity, "type": "hourly"},
+            blocking=True,
+            return_response=True,
+        )
+        forecast = response.get(self.weather_entity, {}).get("forecast", []) or []
+        return _iter_ha_hourly(forecast, hours)
+
+    async def _get_ha_forecast(self, days: int) -> ForecastSeries:
         """Get forecast from Home Assistant weather entity."""
         _LOGGER.debug("Fetching weather from HA entity: %s", self.weather_entity)
 
@@ -80,10 +681,16 @@ class WeatherProvider:
 
         # Get forecast from weather entity
         forecast_data = []
+        today = dt_util.now().date()
         
-        # Try to get forecast attribute
+        # Try to get forecast attribute (legacy entities); the state's
+        # last_updated changes whenever that attribute changes
         forecast_attr = state.attributes.get("forecast")
-        if not forecast_attr:
+        if forecast_attr:
+            cache_key = ("ha_attr", self.weather_entity, state.last_updated, today, days)
+            if (cached := self._cached("ha", cache_key)) is not None:
+                return cached
+        else:
             # Try calling the forecast service
             try:
                 response = await self.hass.services.async_call(
@@ -97,55 +704,43 @@ class WeatherProvider:
             except Exception as err:
                 _LOGGER.debug("Could not call get_forecasts service: %s", err)
                 forecast_attr = []
-
-        # Set up location for sunrise calculation
-        location = LocationInfo(
-            latitude=self.hass.config.latitude,
-            longitude=self.hass.config.longitude,
-            timezone=str(dt_util.DEFAULT_TIME_ZONE),
-        )
+            cache_key = ("ha", self.weather_entity, _payload_hash(forecast_attr), today, days)
+            if (cached := self._cached("ha", cache_key)) is not None:
+                return cached
 
         # Parse forecast data
         for i in range(min(days, len(forecast_attr) if forecast_attr else 0)):
             forecast_day = forecast_attr[i] if i < len(forecast_attr) else {}
-            
-            weather = WeatherData()
-            
-            # Calculate sunrise for this day
-            target_date = dt_util.now() + timedelta(days=i)
-            try:
-                sun_info = astral_sun(
-                    location.observer,
-                    date=target_date.date(),
-                    tzinfo=dt_util.DEFAULT_TIME_ZONE,
-                )
-                weather.sunrise = sun_info["sunrise"]
-            except Exception:
-                weather.sunrise = target_date.replace(hour=6, minute=0, second=0, microsecond=0)
-            
-            # Temperature
-            weather.min_temp = forecast_day.get("templow", forecast_day.get("temperature", 15))
-            weather.max_temp = forecast_day.get("temperature", 20)
-            
-            # Humidity (estimate if not available)
-            weather.humidity = forecast_day.get("humidity", 60)
-            
-            # Pressure (use standard if not available)
-            weather.pressure = forecast_day.get("pressure", 1013)
-            
-            # Wind speed
-            weather.wind_speed = forecast_day.get("wind_speed", 2)
-            
-            # Rain (precipitation)
-            weather.rain = forecast_day.get("precipitation", 0) or 0
-            
-            # Cloud coverage
-            weather.clouds = forecast_day.get("cloud_coverage", 50)
-            
-            # Weather condition
-            weather.summary = forecast_day.get("condition", "unknown")
-            weather.condition = weather.summary
-            
+            max_temp = _value(forecast_day, "temperature", 20)
+            summary = forecast_day.get("condition") or "unknown"
+
+            weather = WeatherData(
+                # Sunrise for this day (cached per date and location)
+                sunrise=self._sunrise_for(dt_util.now() + timedelta(days=i)),
+                # Temperature
+                min_temp=_value(forecast_day, "templow", _value(forecast_day, "temperature", 15)),
+                max_temp=max_temp,
+                # Humidity (estimate if not available)
+                humidity=_value(forecast_day, "humidity", 60),
+                # Pressure (use standard if not available)
+                pressure=_value(forecast_day, "pressure", 1013),
+                # Wind speed
+                wind_speed=_value(forecast_day, "wind_speed", 2),
+                # Rain (precipitation)
+                rain=_value(forecast_day, "precipitation", 0),
+                # Cloud coverage
+                clouds=_value(forecast_day, "cloud_coverage", 50),
+                # Weather condition
+                summary=summary,
+                condition=summary,
+                # Remember which inputs the source did not provide
+                estimated=frozenset(
+                    field
+                    for field, key in _HA_FORECAST_FIELDS.items()
+                    if forecast_day.get(key) is None
+                ),
+            )
+
             forecast_data.append(weather)
             _LOGGER.debug(
                 "Day %d: temp=%s-%s°C, humidity=%s%%, rain=%smm",
@@ -158,31 +753,27 @@ class WeatherProvider:
 
         # If we don't have enough forecast data, fill with estimates
         while len(forecast_data) < days:
-            weather = WeatherData()
-            target_date = dt_util.now() + timedelta(days=len(forecast_data))
-            try:
-                sun_info = astral_sun(
-                    location.observer,
-                    date=target_date.date(),
-                    tzinfo=dt_util.DEFAULT_TIME_ZONE,
+            forecast_data.append(
+                WeatherData(
+                    sunrise=self._sunrise_for(
+                        dt_util.now() + timedelta(days=len(forecast_data))
+                    ),
+                    min_temp=15,
+                    max_temp=20,
+                    humidity=60,
+                    pressure=1013,
+                    wind_speed=2,
+                    rain=0,
+                    clouds=50,
+                    summary="unknown",
+                    condition="unknown",
+                    estimated=frozenset(_HA_FORECAST_FIELDS) | {"rain", "clouds"},
                 )
-                weather.sunrise = sun_info["sunrise"]
-            except Exception:
-                weather.sunrise = target_date.replace(hour=6, minute=0, second=0, microsecond=0)
-            weather.min_temp = 15
-            weather.max_temp = 20
-            weather.humidity = 60
-            weather.pressure = 1013
-            weather.wind_speed = 2
-            weather.rain = 0
-            weather.clouds = 50
-            weather.summary = "unknown"
-            weather.condition = "unknown"
-            forecast_data.append(weather)
+            )
 
-        return forecast_data
+        return self._store("ha", cache_key, forecast_data)
 
-    async def _get_owm_forecast(self, days: int) -> list[WeatherData]:
+    async def _get_owm_forecast(self, days: int) -> ForecastSeries:
         """Get forecast from OpenWeatherMap API (One Call 3.0)."""
         _LOGGER.debug("Fetching weather from OpenWeatherMap")
 
@@ -192,19 +783,19 @@ class WeatherProvider:
         lat = self.hass.config.latitude
         lon = self.hass.config.longitude
 
-        if self._session is None:
-            self._session = aiohttp.ClientSession()
-
         params = {
             "lat": lat,
             "lon": lon,
             "appid": self.owm_api_key,
             "units": "metric",
-            "exclude": "current,minutely,hourly,alerts",
+            "exclude": (
+                "current,minutely,alerts" if self.hourly_eto or self.keep_hourly
+                else "current,minutely,hourly,alerts"
+            ),
         }
 
         try:
-            async with self._session.get(OWM_API_URL, params=params) as response:
+            async with self._http.get(self.owm_base_url, params=params) as response:
                 if response.status != 200:
                     raise ValueError(f"OWM API error: {response.status}")
                 
@@ -214,41 +805,21 @@ class WeatherProvider:
             _LOGGER.error("Error fetching OWM data: %s", err)
             raise
 
+        # Keep the raw hourly block for hourly ETo (parsed lazily on demand)
+        self._owm_hourly = (
+            data.get("hourly", []) if self.hourly_eto or self.keep_hourly else []
+        )
+
         # Parse daily forecast
-        forecast_data = []
         daily = data.get("daily", [])
+        cache_key = ("owm", _payload_hash(daily[:days]), days)
+        if (cached := self._cached("owm", cache_key)) is not None:
+            return cached
 
-        for i in range(min(days, len(daily))):
-            day = daily[i]
-            
-            weather = WeatherData()
-            weather.sunrise = datetime.fromtimestamp(
-                day["sunrise"], tz=dt_util.DEFAULT_TIME_ZONE
-            )
-            weather.min_temp = day["temp"]["min"]
-            weather.max_temp = day["temp"]["max"]
-            weather.humidity = day["humidity"]
-            weather.pressure = day["pressure"]
-            weather.wind_speed = day["wind_speed"]
-            weather.rain = day.get("rain", 0)
-            weather.clouds = day["clouds"]
-            weather.summary = day["weather"][0]["description"]
-            weather.condition = day["weather"][0].get("main", "unknown")
-            
-            forecast_data.append(weather)
-            _LOGGER.debug(
-                "Day %d (OWM): temp=%s-%s°C, humidity=%s%%, rain=%smm",
-                i,
-                weather.min_temp,
-                weather.max_temp,
-                weather.humidity,
-                weather.rain,
-            )
+        forecast_data = parse_owm_daily(daily, days)
 
-        return forecast_data
+        return self._store("owm", cache_key, forecast_data)
 
     async def async_close(self):
-        """Close the session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Release provider resources (the shared HTTP session stays open)."""
+        self.invalidate_cache()
@@ -0,0 +1,182 @@
+"""Compiled watering calendar for IrrigationPro zones.
+
+The allowed weekdays and months of a zone are kept as a 7-bit and a
+12-bit mask. Together with odd/even-day water restrictions and blackout
+dates they are compiled into an allow bitmap covering 366 days from an
+origin date, so "may this zone water on day X" and "when is the next
+allowed day" are bit tests instead of list scans. The bitmap is recompiled
+when a lookup falls outside of it, i.e. about once a year per zone.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from datetime import date, timedelta
+from typing import Any
+
+from .const import (
+    DAY_RESTRICTION_EVEN,
+    DAY_RESTRICTION_NONE,
+    DAY_RESTRICTION_ODD,
+    WEEKDAYS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Days covered by one compiled allow bitmap
+HORIZON_DAYS = 366
+
+
+def weekday_mask(weekdays: Iterable[str]) -> int:
+    """Return the 7-bit mask (bit 0 = Monday) of weekday names."""
+    mask = 0
+    for day in weekdays:
+        if day in WEEKDAYS:
+            mask |= 1 << WEEKDAYS.index(day)
+    return mask
+
+
+def month_mask(months: Iterable[int | str]) -> int:
+    """Return the 12-bit mask (bit 0 = January) of month numbers."""
+    mask = 0
+    for month in months:
+        try:
+            month = int(month)
+        except (TypeError, ValueError):
+            continue
+        if 1 <= month <= 12:
+            mask |= 1 << (month - 1)
+    return mask
+
+
+def parse_blackout_dates(values: Iterable[str]) -> tuple[frozenset[date], frozenset[tuple[int, int]]]:
+    """Split blackout entries into fixed dates and yearly (month, day) pairs.
+
+    ``YYYY-MM-DD`` blocks that date once, ``MM-DD`` blocks it every year.
+    Invalid entries are skipped.
+    """
+    fixed: set[date] = set()
+    yearly: set[tuple[int, int]] = set()
+    for value in values:
+        text = str(value).strip()
+        try:
+            if text.count("-") == 1:
+                month, day = (int(part) for part in text.split("-"))
+                # Validate against a leap year so 02-29 is accepted
+                date(2000, month, day)
+                yearly.add((month, day))
+            else:
+                fixed.add(date.fromisoformat(text))
+        except ValueError:
+            _LOGGER.warning("Ignoring invalid blackout date '%s'", text)
+    return frozenset(fixed), frozenset(yearly)
+
+
+class ZoneCalendar:
+    """Weekday/month masks, water restrictions and a 366-day allow bitmap."""
+
+    __slots__ = (
+        "weekday_mask",
+        "month_mask",
+        "day_restriction",
+        "blackout_dates",
+        "blackout_yearly",
+        "key",
+        "_origin",
+        "_bits",
+    )
+
+    def __init__(
+        self,
+        weekdays: Iterable[str],
+        months: Iterable[int | str],
+        day_restriction: str = DAY_RESTRICTION_NONE,
+        blackout_dates: Iterable[str] = (),
+    ) -> None:
+        """Compile the masks; the bitmap is built on the first lookup."""
+        self.weekday_mask = weekday_mask(weekdays)
+        self.month_mask = month_mask(months)
+        if day_restriction not in (DAY_RESTRICTION_ODD, DAY_RESTRICTION_EVEN):
+            day_restriction = DAY_RESTRICTION_NONE
+        self.day_restriction = day_restriction
+        self.blackout_dates, self.blackout_yearly = parse_blackout_dates(blackout_dates)
+        # Zones with the same rules share lookup tables (see WaterBalanceIndex)
+        self.key = (
+            self.weekday_mask,
+            self.month_mask,
+            self.day_restriction,
+            self.blackout_dates,
+            self.blackout_yearly,
+        )
+        self._origin: date | None = None
+        self._bits = 0
+
+    def allows_weekday(self, day: date) -> bool:
+        """Return True if the weekday of ``day`` is a watering weekday."""
+        return bool(self.weekday_mask >> day.weekday() & 1)
+
+    def allows_month(self, day: date) -> bool:
+        """Return True if the month of ``day`` is a watering month."""
+        return bool(self.month_mask >> (day.month - 1) & 1)
+
+    def restricted(self, day: date) -> bool:
+        """Return True if a water restriction or blackout date blocks ``day``."""
+        if self.day_restriction == DAY_RESTRICTION_ODD and day.day % 2 == 0:
+            return True
+        if self.day_restriction == DAY_RESTRICTION_EVEN and day.day % 2 == 1:
+            return True
+        return day in self.blackout_dates or (day.month, day.day) in self.blackout_yearly
+
+    def _compile(self, origin: date) -> None:
+        """Build the allow bitmap for ``origin`` .. ``origin + 365``."""
+        bits = 0
+        day = origin
+        for offset in range(HORIZON_DAYS):
+            if self.allows_weekday(day) and self.allows_month(day) and not self.restricted(day):
+                bits |= 1 << offset
+            day += timedelta(days=1)
+        self._origin = origin
+        self._bits = bits
+
+    def _offset(self, day: date) -> int:
+        """Return the bit of ``day``, recompiling if it lies outside the bitmap."""
+        if self._origin is not None:
+            offset = (day - self._origin).days
+            if 0 <= offset < HORIZON_DAYS:
+                return offset
+        self._compile(day)
+        return 0
+
+    def allows(self, day: date) -> bool:
+        """Return True if the zone may water on ``day``."""
+        offset = self._offset(day)
+        return bool(self._bits >> offset & 1)
+
+    def next_allowed(self, day: date) -> date | None:
+        """Return the first allowed day on or after ``day``.
+
+        Returns None if no day within a year is allowed.
+        """
+        offset = self._offset(day)
+        rest = self._bits >> offset
+        if not rest and offset:
+            # The bitmap ends before a full year from ``day``
+            self._compile(day)
+            rest = self._bits
+        if not rest:
+            return None
+        return day + timedelta(days=(rest & -rest).bit_length() - 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the compiled calendar for the status API."""
+        return {
+            "weekday_mask": self.weekday_mask,
+            "month_mask": self.month_mask,
+            "day_restriction": self.day_restriction,
+            "blackout_dates": sorted(
+                [day.isoformat() for day in self.blackout_dates]
+                + [f"{month:02d}-{day:02d}" for month, day in self.blackout_yearly]
+            ),
+            "origin": self._origin.isoformat() if self._origin else None,
+            "allowed_days": self._bits.bit_count(),
+        }
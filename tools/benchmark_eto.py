@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Benchmark the IrrigationPro ETo methods for cost and accuracy.
+
+Reports microseconds per call for every registered method (plus the batch
+Penman-Monteith path) and the deviation from the FAO-56 worked examples:
+17 (Bangkok, April, monthly data, 5.72 mm/day) and 18 (Uccle/Brussels,
+6 July, daily data, 3.9 mm/day) for the daily methods, and 19 (N'Djamena,
+1 October, 0.63 mm/h at 14-15 h and 0.0 mm/h at 02-03 h) for the hourly
+equation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import math
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ETO_PATH = Path(__file__).resolve().parents[1] / "custom_components" / "irrigationpro" / "eto.py"
+
+
+def _load_eto():
+    spec = importlib.util.spec_from_file_location("irrigationpro_eto", ETO_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _svp(temp: float) -> float:
+    return 0.6108 * math.exp(17.27 * temp / (temp + 237.3))
+
+
+# FAO-56 example 18: Tmax 21.5, Tmin 12.3 degC, ea 1.409 kPa, u2 2.078 m/s,
+# Rs 22.07 MJ/m2/day, altitude 100 m, latitude 50 deg 48' N -> ETo 3.9 mm/day.
+FAO56_EXAMPLE_18 = {
+    "min_temp": 12.3,
+    "max_temp": 21.5,
+    "humidity": 1.409 / ((_svp(21.5) + _svp(12.3)) / 2) * 100,
+    "pressure": 1001.0,
+    # calculate_eto converts 10 m wind to 2 m with a factor of 0.748
+    "wind_speed": 2.078 / 0.748,
+    # kWh/m2/day as configured in IrrigationPro
+    "solar_radiation": 22.07 / 3.6,
+    "altitude": 100.0,
+    "latitude": 50.8,
+    "date": datetime(2026, 7, 6),
+}
+FAO56_EXAMPLE_18_ETO = 3.9
+
+# FAO-56 example 17: Tmax 34.8, Tmin 25.6 degC, ea 2.85 kPa, u2 2 m/s,
+# Rs 22.65 MJ/m2/day, altitude 2 m, latitude 13 deg 44' N, mid April
+# -> ETo 5.72 mm/day (with a monthly soil heat flux of 0.14 MJ/m2/day,
+# which the daily methods take as zero).
+FAO56_EXAMPLE_17 = {
+    "min_temp": 25.6,
+    "max_temp": 34.8,
+    "humidity": 2.85 / ((_svp(34.8) + _svp(25.6)) / 2) * 100,
+    "pressure": 1013.0,
+    "wind_speed": 2.0 / 0.748,
+    "solar_radiation": 22.65 / 3.6,
+    "altitude": 2.0,
+    "latitude": 13.73,
+    "date": datetime(2026, 4, 15),
+}
+FAO56_EXAMPLE_17_ETO = 5.72
+
+DAILY_EXAMPLES = (
+    ("example 17", FAO56_EXAMPLE_17, FAO56_EXAMPLE_17_ETO),
+    ("example 18", FAO56_EXAMPLE_18, FAO56_EXAMPLE_18_ETO),
+)
+
+# FAO-56 example 19: N'Djamena (12 deg 8' N, 15 deg E, UTC+1, 8 m),
+# 1 October, P 101.2 kPa. (start hour, T, RH %, u2 m/s, Rs MJ/m2/h, ETo mm/h)
+FAO56_EXAMPLE_19_LOCATION = {"latitude": 12.13, "longitude": 15.0, "altitude": 8.0}
+FAO56_EXAMPLE_19_HOURS = (
+    (14, 38.0, 52.0, 3.3, 2.450, 0.63),
+    (2, 28.0, 90.0, 1.9, 0.0, 0.0),
+)
+
+
+def _hourly_example(eto, hour, temp, humidity, wind, r_s, _reference) -> float:
+    """Return the hourly ETo for one example 19 hour.
+
+    The hourly equation estimates Rs from cloud coverage, so the measured
+    Rs is converted to the cloud coverage that reproduces it.
+    """
+    start = datetime(2026, 10, 1, hour, tzinfo=timezone(timedelta(hours=1)))
+    location = FAO56_EXAMPLE_19_LOCATION
+    r_a = eto._extraterrestrial_radiation_hourly(location["latitude"], location["longitude"], start)
+    r_so = r_a * (0.75 + 2 * location["altitude"] / 100000)
+    cloud = None
+    if r_so > 0:
+        cloud = 100 * ((1 - min(1.0, r_s / r_so)) / 0.75) ** (1 / 3.4)
+    return eto.calculate_eto_hourly(
+        temp=temp,
+        humidity=humidity,
+        pressure=1012.0,
+        wind_speed=wind / 0.748,
+        start=start,
+        cloud_coverage=cloud,
+        **location,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000, help="calls per method")
+    parser.add_argument("--days", type=int, default=1000, help="days per batch call")
+    args = parser.parse_args()
+
+    eto = _load_eto()
+    table = eto.get_radiation_table(FAO56_EXAMPLE_18["latitude"], FAO56_EXAMPLE_18["altitude"])
+    inputs = {**FAO56_EXAMPLE_18, "radiation_table": table}
+
+    print(f"{'method':<22} {'example':<12} {'us/call':>10} {'ETo':>8} {'dev mm':>8} {'dev %':>8}")
+    for method in sorted(eto.ETO_METHODS.values(), key=lambda m: (m.tier, m.cost)):
+        seconds = timeit.timeit(lambda: method.func(**inputs), number=args.number)
+        for name, example, reference in DAILY_EXAMPLES:
+            example_table = eto.get_radiation_table(example["latitude"], example["altitude"])
+            value = method.func(**example, radiation_table=example_table)
+            deviation = value - reference
+            timing = f"{seconds / args.number * 1e6:>10.2f}" if example is FAO56_EXAMPLE_18 else f"{'':>10}"
+            print(
+                f"{method.name:<22} {name:<12} {timing} {value:>8.3f} "
+                f"{deviation:>+8.3f} {deviation / reference * 100:>+7.1f}%"
+            )
+
+    for hour in FAO56_EXAMPLE_19_HOURS:
+        value = _hourly_example(eto, *hour)
+        deviation = value - hour[-1]
+        print(
+            f"{'penman_monteith hourly':<22} {f'ex. 19 {hour[0]:02d} h':<12} {'':>10} "
+            f"{value:>8.3f} {deviation:>+8.3f}"
+        )
+
+    dates = [FAO56_EXAMPLE_18["date"] + timedelta(days=i) for i in range(args.days)]
+    columns = {
+        "min_temps": [FAO56_EXAMPLE_18["min_temp"]] * args.days,
+        "max_temps": [FAO56_EXAMPLE_18["max_temp"]] * args.days,
+        "humidities": [FAO56_EXAMPLE_18["humidity"]] * args.days,
+        "pressures": [FAO56_EXAMPLE_18["pressure"]] * args.days,
+        "wind_speeds": [FAO56_EXAMPLE_18["wind_speed"]] * args.days,
+        "solar_radiations": [FAO56_EXAMPLE_18["solar_radiation"]] * args.days,
+        "dates": dates,
+        "altitude": FAO56_EXAMPLE_18["altitude"],
+        "latitude": FAO56_EXAMPLE_18["latitude"],
+        "radiation_table": table,
+    }
+    repeats = max(1, args.number // args.days)
+    seconds = timeit.timeit(lambda: eto.calculate_eto_batch(**columns), number=repeats)
+    backend = "numpy" if eto.HAS_NUMPY else "scalar fallback"
+    print(
+        f"{'penman_monteith batch':<22} {seconds / (repeats * args.days) * 1e6:>10.2f}"
+        f"   ({args.days} days/call, {backend})"
+    )
+
+
+if __name__ == "__main__":
+    main()
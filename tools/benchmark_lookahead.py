@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark the IrrigationPro look-ahead planner.
+
+Plans random 8-day soil buckets for many zones and reports the time per
+refresh (mean and p95), the number of planned waterings and whether any
+zone crosses its MAD limit. With ``--verify`` every plan is also checked
+against brute force over all subsets of allowed days.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import itertools
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+LOOKAHEAD_PATH = Path(__file__).resolve().parents[1] / "custom_components" / "irrigationpro" / "lookahead.py"
+
+
+def _load_lookahead():
+    spec = importlib.util.spec_from_file_location("irrigationpro_lookahead", LOOKAHEAD_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _random_bucket(lookahead, rng: random.Random, zone_id: int, days: int):
+    taw = rng.uniform(20.0, 60.0)
+    mad = rng.uniform(0.3, 0.6)
+    return lookahead.ZoneBucket(
+        zone_id,
+        taw,
+        mad,
+        rng.uniform(0.0, mad * taw),
+        [rng.uniform(1.0, 6.0) for _ in range(days)],
+        [rng.choice((0.0, 0.0, 0.0, rng.uniform(0.0, 15.0))) for _ in range(days)],
+        [rng.random() < 0.6 for _ in range(days)],
+    )
+
+
+def _cost(lookahead, bucket, days: set[int]) -> tuple[float, float]:
+    """Return (water + starts, worst excess over the limit) of watering on ``days``."""
+    limit = bucket.mad * bucket.taw
+    depletion = min(bucket.taw, bucket.depletion)
+    cost = excess = 0.0
+    for day in range(len(bucket.etc)):
+        if day in days:
+            cost += depletion + lookahead.START_PENALTY_MM
+            depletion = 0.0
+        depletion = min(bucket.taw, max(0.0, depletion + bucket.etc[day] - bucket.rain[day]))
+        excess = max(excess, depletion - limit)
+    return cost + depletion, excess
+
+
+def _verify(lookahead, bucket) -> bool:
+    """Return True if no subset of allowed days beats the plan."""
+    plan = lookahead.plan_zone(bucket)
+    cost, excess = _cost(lookahead, bucket, set(plan.days))
+    allowed = [day for day, ok in enumerate(bucket.allowed) if ok]
+    for size in range(len(allowed) + 1):
+        for days in itertools.combinations(allowed, size):
+            other_cost, other_excess = _cost(lookahead, bucket, set(days))
+            if other_excess <= 1e-9 and (excess > 1e-9 or other_cost < cost - 1e-6):
+                return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--zones", type=int, default=50, help="zones per refresh")
+    parser.add_argument("--days", type=int, default=8, help="forecast days")
+    parser.add_argument("--repeat", type=int, default=200, help="refreshes to time")
+    parser.add_argument("--verify", type=int, default=0, help="zones to check by brute force")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    lookahead = _load_lookahead()
+    rng = random.Random(args.seed)
+    buckets = [_random_bucket(lookahead, rng, zone_id, args.days) for zone_id in range(args.zones)]
+
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        plans = lookahead.plan_zones(buckets)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    waterings = sum(len(plan.days) for plan in plans.values())
+    over_limit = sum(1 for plan in plans.values() if plan.over_limit > 0)
+    print(f"{args.zones} zones x {args.days} days")
+    print(f"  mean {statistics.fmean(timings):.2f} ms, p95 {timings[int(len(timings) * 0.95) - 1]:.2f} ms")
+    print(f"  {waterings} waterings planned, {over_limit} zones over their MAD limit")
+
+    if args.verify:
+        failures = sum(
+            not _verify(lookahead, _random_bucket(lookahead, rng, zone_id, args.days))
+            for zone_id in range(args.verify)
+        )
+        print(f"  brute force: {args.verify - failures}/{args.verify} plans optimal")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Benchmark the IrrigationPro OWM path against the local stand-in server.
+
+Starts ``fake_owm_server`` in-process and reports:
+
+* fetch latency percentiles for concurrent One Call requests,
+* how the retry backoff (``retry.RetryPolicy``) and the circuit breaker
+  behave at the configured error rate,
+* JSON decode and ``parse_owm_daily`` throughput (the latter only when
+  Home Assistant is importable).
+
+No network access or API key is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import statistics
+import sys
+import time
+import timeit
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+TOOLS_PATH = Path(__file__).resolve().parent
+REPO_PATH = TOOLS_PATH.parent
+RETRY_PATH = REPO_PATH / "custom_components" / "irrigationpro" / "retry.py"
+
+sys.path.insert(0, str(TOOLS_PATH))
+import fake_owm_server  # noqa: E402
+
+
+def _load_retry():
+    spec = importlib.util.spec_from_file_location("irrigationpro_retry", RETRY_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _percentile(values: list[float], share: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+async def _fetch(session: aiohttp.ClientSession, url: str, timeout: float) -> tuple[float, int]:
+    """Return (latency ms, HTTP status); status 0 is a client timeout."""
+    start = time.perf_counter()
+    try:
+        async with session.get(
+            url,
+            params={"lat": 50.8, "lon": 4.35, "appid": "bench", "units": "metric"},
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            await response.read()
+            status = response.status
+    except asyncio.TimeoutError:
+        status = 0
+    return (time.perf_counter() - start) * 1000, status
+
+
+async def _bench_latency(session, url, requests: int, concurrency: int, timeout: float) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            return await _fetch(session, url, timeout)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    ok = [latency for latency, status in results if status == 200]
+    failed = len(results) - len(ok)
+
+    print(f"{'requests':<22} {requests:>10}")
+    print(f"{'concurrency':<22} {concurrency:>10}")
+    print(f"{'throughput req/s':<22} {requests / elapsed:>10.1f}")
+    print(f"{'failed':<22} {failed:>10}")
+    if ok:
+        for label, share in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            print(f"{'latency ' + label + ' ms':<22} {_percentile(ok, share):>10.2f}")
+        print(f"{'latency max ms':<22} {max(ok):>10.2f}")
+
+
+async def _bench_retries(session, url, fetches: int, timeout: float, args) -> None:
+    """Run logical fetches with backoff until success, like the coordinator."""
+    retry = _load_retry()
+    breaker = retry.CircuitBreaker("owm", args.breaker_threshold, args.retry_max, args.retry_max * 8)
+    attempts: list[int] = []
+    waited: list[float] = []
+    refused = 0
+    gave_up = 0
+
+    for _ in range(fetches):
+        policy = retry.RetryPolicy(args.retry_base, args.retry_max)
+        total_wait = 0.0
+        while True:
+            if not breaker.allow():
+                refused += 1
+                delay = breaker.retry_in() or 0.0
+            else:
+                _latency, status = await _fetch(session, url, timeout)
+                if status == 200:
+                    breaker.record_success()
+                    break
+                breaker.record_failure()
+                delay = policy.next_delay().total_seconds()
+            if policy.attempts >= args.max_attempts:
+                gave_up += 1
+                break
+            total_wait += delay
+            await asyncio.sleep(delay)
+        attempts.append(policy.attempts + 1)
+        waited.append(total_wait)
+
+    print(f"{'logical fetches':<22} {fetches:>10}")
+    print(f"{'attempts mean':<22} {statistics.fmean(attempts):>10.2f}")
+    print(f"{'attempts max':<22} {max(attempts):>10}")
+    print(f"{'backoff wait mean s':<22} {statistics.fmean(waited):>10.3f}")
+    print(f"{'breaker opened':<22} {breaker.opened:>10}")
+    print(f"{'refused by breaker':<22} {refused:>10}")
+    print(f"{'gave up':<22} {gave_up:>10}")
+
+
+def _bench_parse(payload: dict, number: int, days: int) -> None:
+    raw = json.dumps(payload)
+    seconds = timeit.timeit(lambda: json.loads(raw), number=number)
+    print(f"{'json decode us':<22} {seconds / number * 1e6:>10.1f}  ({len(raw)} bytes)")
+
+    try:
+        sys.path.insert(0, str(REPO_PATH))
+        from custom_components.irrigationpro.weather_provider import parse_owm_daily
+    except ImportError as err:
+        print(f"{'parse_owm_daily':<22} {'skipped':>10}  ({err})")
+        return
+    daily = payload["daily"]
+    seconds = timeit.timeit(lambda: parse_owm_daily(daily, days), number=number)
+    print(f"{'parse_owm_daily us':<22} {seconds / number * 1e6:>10.1f}  ({days} days)")
+
+
+async def _main(args) -> None:
+    replay = json.loads(args.replay.read_text()) if args.replay else None
+    app = fake_owm_server.create_app(
+        replay=replay,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        days=args.days,
+        seed=args.seed,
+    )
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    url = f"http://127.0.0.1:{port}{fake_owm_server.ONECALL_PATH}"
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            print("== fetch latency ==")
+            await _bench_latency(session, url, args.requests, args.concurrency, args.timeout)
+            print("\n== retries ==")
+            await _bench_retries(session, url, args.fetches, args.timeout, args)
+    finally:
+        await runner.cleanup()
+
+    print("\n== parsing ==")
+    payload = replay or fake_owm_server.synthetic_onecall(50.8, 4.35, args.days, seed=args.seed)
+    _bench_parse(payload, args.number, args.days)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--replay", type=Path, help="recorded One Call JSON response to serve")
+    parser.add_argument("--latency", type=float, default=50.0, help="mean server latency in ms")
+    parser.add_argument("--jitter", type=float, default=20.0, help="± latency jitter in ms")
+    parser.add_argument("--error-rate", type=float, default=0.1, help="share of 503 responses")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="share of hanging requests")
+    parser.add_argument("--timeout", type=float, default=2.0, help="client deadline in s")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--fetches", type=int, default=50, help="logical fetches with retries")
+    parser.add_argument("--retry-base", type=float, default=0.02, help="scaled-down backoff base in s")
+    parser.add_argument("--retry-max", type=float, default=0.5, help="scaled-down backoff cap in s")
+    parser.add_argument("--max-attempts", type=int, default=8)
+    parser.add_argument("--breaker-threshold", type=int, default=3)
+    parser.add_argument("--days", type=int, default=8)
+    parser.add_argument("--number", type=int, default=2000, help="parse iterations")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
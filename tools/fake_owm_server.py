@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Local stand-in for the OpenWeatherMap One Call 3.0 API.
+
+Serves ``GET /data/3.0/onecall`` from a recorded response (``--replay``)
+or from deterministic synthetic data, with configurable latency and error
+rates, so the IrrigationPro OWM path can be exercised and benchmarked
+without network access. Point the integration's "OWM base URL" option to
+``http://<host>:<port>/data/3.0/onecall``.
+
+``GET /stats`` returns request counters, ``POST /reset`` clears them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+ONECALL_PATH = "/data/3.0/onecall"
+
+_CONDITIONS = (
+    (800, "Clear", "clear sky", "01d"),
+    (802, "Clouds", "scattered clouds", "03d"),
+    (804, "Clouds", "overcast clouds", "04d"),
+    (500, "Rain", "light rain", "10d"),
+    (501, "Rain", "moderate rain", "10d"),
+)
+
+
+def synthetic_onecall(
+    lat: float,
+    lon: float,
+    days: int = 8,
+    hours: int = 48,
+    seed: int = 0,
+    start: int | None = None,
+) -> dict[str, Any]:
+    """Return a plausible One Call 3.0 payload for ``days`` days from ``start``.
+
+    The same ``seed`` and ``start`` always give the same payload, so
+    repeated runs are comparable.
+    """
+    rng = random.Random(seed)
+    start = int(start if start is not None else time.time()) // 86400 * 86400
+    # Warmer in northern summer, colder in winter
+    season = math.cos((time.gmtime(start).tm_yday - 196) / 365 * 2 * math.pi)
+    base_temp = 12 + 10 * season * (1 if lat >= 0 else -1)
+
+    daily = []
+    for day in range(days):
+        dt = start + day * 86400
+        t_min = base_temp - 5 + rng.uniform(-3, 3)
+        t_max = t_min + rng.uniform(6, 14)
+        clouds = rng.randint(0, 100)
+        condition = _CONDITIONS[min(len(_CONDITIONS) - 1, clouds * len(_CONDITIONS) // 101)]
+        entry = {
+            "dt": dt + 43200,
+            "sunrise": dt + 6 * 3600 - int(2 * 3600 * season),
+            "sunset": dt + 18 * 3600 + int(2 * 3600 * season),
+            "temp": {
+                "day": round((t_min + t_max) / 2, 2),
+                "min": round(t_min, 2),
+                "max": round(t_max, 2),
+                "night": round(t_min + 1, 2),
+                "eve": round(t_max - 2, 2),
+                "morn": round(t_min + 2, 2),
+            },
+            "pressure": rng.randint(1000, 1030),
+            "humidity": rng.randint(35, 95),
+            "wind_speed": round(rng.uniform(0.5, 8), 2),
+            "wind_deg": rng.randint(0, 359),
+            "clouds": clouds,
+            "pop": round(clouds / 100, 2),
+            "uvi": round(max(0.0, 8 * season * (1 - clouds / 100)), 2),
+            "weather": [
+                {"id": condition[0], "main": condition[1], "description": condition[2], "icon": condition[3]}
+            ],
+        }
+        if condition[1] == "Rain":
+            entry["rain"] = round(rng.uniform(0.5, 12), 2)
+        daily.append(entry)
+
+    hourly = []
+    for hour in range(hours):
+        day = daily[min(hour // 24, days - 1)] if days else None
+        t_min = day["temp"]["min"] if day else base_temp
+        t_max = day["temp"]["max"] if day else base_temp + 8
+        # Daily temperature curve peaking at 15:00
+        phase = math.cos((hour % 24 - 15) / 24 * 2 * math.pi)
+        entry = {
+            "dt": start + hour * 3600,
+            "temp": round(t_min + (t_max - t_min) * (phase + 1) / 2, 2),
+            "pressure": day["pressure"] if day else 1013,
+            "humidity": day["humidity"] if day else 60,
+            "wind_speed": day["wind_speed"] if day else 2.0,
+            "clouds": day["clouds"] if day else 50,
+        }
+        if day and "rain" in day:
+            # Spread the day's rain over the afternoon (12:00-18:00)
+            if 12 <= hour % 24 < 18:
+                entry["rain"] = {"1h": round(day["rain"] / 6, 2)}
+        hourly.append(entry)
+
+    return {
+        "lat": lat,
+        "lon": lon,
+        "timezone": "UTC",
+        "timezone_offset": 0,
+        "hourly": hourly,
+        "daily": daily,
+    }
+
+
+def create_app(
+    replay: dict[str, Any] | None = None,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    error_status: int = 503,
+    timeout_rate: float = 0.0,
+    api_key: str | None = None,
+    days: int = 8,
+    seed: int = 0,
+) -> web.Application:
+    """Create the fake One Call application.
+
+    ``error_rate`` answers that share of requests with ``error_status``;
+    ``timeout_rate`` lets that share hang for 60 s to trigger client
+    deadlines.
+    """
+    rng = random.Random(seed)
+    stats = {"requests": 0, "errors": 0, "timeouts": 0}
+
+    async def onecall(request: web.Request) -> web.Response:
+        stats["requests"] += 1
+        delay = max(0.0, latency_ms + rng.uniform(-jitter_ms, jitter_ms)) / 1000
+        if delay:
+            await asyncio.sleep(delay)
+
+        if api_key is not None and request.query.get("appid") != api_key:
+            stats["errors"] += 1
+            return web.json_response({"cod": 401, "message": "Invalid API key."}, status=401)
+        roll = rng.random()
+        if roll < timeout_rate:
+            stats["timeouts"] += 1
+            await asyncio.sleep(60)
+        elif roll < timeout_rate + error_rate:
+            stats["errors"] += 1
+            return web.json_response({"cod": error_status, "message": "fake error"}, status=error_status)
+
+        try:
+            lat = float(request.query.get("lat", 0))
+            lon = float(request.query.get("lon", 0))
+        except ValueError:
+            return web.json_response({"cod": 400, "message": "wrong latitude"}, status=400)
+
+        payload = dict(replay) if replay is not None else synthetic_onecall(lat, lon, days, seed=seed)
+        # One Call drops excluded blocks
+        for block in request.query.get("exclude", "").split(","):
+            payload.pop(block.strip(), None)
+        return web.json_response(payload)
+
+    async def get_stats(_request: web.Request) -> web.Response:
+        return web.json_response(stats)
+
+    async def reset(_request: web.Request) -> web.Response:
+        for key in stats:
+            stats[key] = 0
+        return web.json_response(stats)
+
+    app = web.Application()
+    app.router.add_get(ONECALL_PATH, onecall)
+    app.router.add_get("/stats", get_stats)
+    app.router.add_post("/reset", reset)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--replay", type=Path, help="recorded One Call JSON response to serve")
+    parser.add_argument("--latency", type=float, default=0.0, help="mean latency in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="± latency jitter in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of error responses (0-1)")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="share of hanging requests (0-1)")
+    parser.add_argument("--api-key", help="only accept this appid")
+    parser.add_argument("--days", type=int, default=8, help="synthetic forecast days")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    replay = json.loads(args.replay.read_text()) if args.replay else None
+    app = create_app(
+        replay=replay,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        timeout_rate=args.timeout_rate,
+        api_key=args.api_key,
+        days=args.days,
+        seed=args.seed,
+    )
+    print(f"Fake One Call 3.0 at http://{args.host}:{args.port}{ONECALL_PATH}")
+    web.run_app(app, host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()